@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Artifact Files v1.0
+Helpers shared by the project tools (session index, context packer,
+interface diff) and catalog sync: artifact naming and atomic JSON writes.
+
+Artifacts are versioned by file name in two spellings, "simple-io-v1.3.py"
+and "simple_io_v1.0.py"; both are versions of the artifact "simple-io.py".
+"""
+
+import json
+import os
+import re
+import tempfile
+from pathlib import Path, PurePosixPath
+from typing import Any, Tuple
+
+_VERSIONED_NAME = re.compile(r'^(?P<name>.+?)[-_]v(?P<version>\d+(?:[._]\d+)*)$')
+
+def parse_artifact_name(file_name: str) -> Tuple[str, Tuple[int, ...]]:
+    """
+    Split a file name into artifact name and version.
+
+    Both "locale-manager-v1.5.py" and "simple_io_v1.0.py" are recognized;
+    underscores in the name are normalized to hyphens.
+
+    Args:
+        file_name: File name, optionally with a directory
+
+    Returns:
+        Tuple[str, Tuple[int, ...]]: Artifact name (with suffix) and version
+            (empty if unversioned)
+    """
+    path = PurePosixPath(file_name)
+    match = _VERSIONED_NAME.match(path.stem)
+    if match is None:
+        return path.stem.replace("_", "-") + path.suffix, ()
+    version = tuple(int(part) for part in re.split(r'[._]', match.group("version")))
+    return match.group("name").replace("_", "-") + path.suffix, version
+
+def module_name(file_name: str) -> str:
+    """Get the import name of a source ("simple-io-v1.3.py" -> "simple_io_v1_3")."""
+    return re.sub(r'[^0-9A-Za-z_]', '_', PurePosixPath(file_name).stem)
+
+def write_json_atomic(path: Path, data: Any, **dump_options: Any) -> None:
+    """
+    Write JSON to a temporary file and rename it into place.
+
+    Readers never see a partially written file, and a failed write leaves
+    the previous file intact.
+
+    Args:
+        path: Destination file; missing parent directories are created
+        data: JSON-serializable data
+        **dump_options: Extra json.dump options (e.g. indent, sort_keys)
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, **dump_options)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
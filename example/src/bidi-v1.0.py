@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Bidi Classifier v1.0
+Table-driven strong-direction classification for runtime parameters such
+as user-supplied names, and Unicode isolate wrapping for substitution into
+translated templates.
+
+Strong classes are looked up in a two-level table: one 256-entry byte block
+per code point block. Nothing is precomputed at import; each block is
+filled from unicodedata the first time a character in it is classified,
+and identical blocks share one bytes object (131 distinct blocks cover all
+of Unicode). ASCII text skips the table entirely.
+"""
+
+import re
+import time
+import unicodedata
+from typing import Dict, List, Optional, Tuple
+
+NEUTRAL = 0
+STRONG_LTR = 1
+STRONG_RTL = 2
+
+LTR = "ltr"
+RTL = "rtl"
+
+LRI = "\u2066"  # Left-to-right isolate
+RLI = "\u2067"  # Right-to-left isolate
+FSI = "\u2068"  # First strong isolate
+PDI = "\u2069"  # Pop directional isolate
+
+_BLOCK_BITS = 8
+_BLOCK_MASK = (1 << _BLOCK_BITS) - 1
+_STRONG_CLASSES = {'L': STRONG_LTR, 'R': STRONG_RTL, 'AL': STRONG_RTL}
+_ASCII_LETTER = re.compile(r'[A-Za-z]')
+
+_blocks: List[Optional[bytes]] = [None] * (0x110000 >> _BLOCK_BITS)
+_unique_blocks: Dict[bytes, bytes] = {}
+
+def _load_block(index: int) -> bytes:
+    """Compute and memoize the strong-class block for a block index."""
+    start = index << _BLOCK_BITS
+    block = bytes(
+        _STRONG_CLASSES.get(unicodedata.bidirectional(chr(cp)), NEUTRAL)
+        for cp in range(start, start + _BLOCK_MASK + 1)
+    )
+    block = _unique_blocks.setdefault(block, block)
+    _blocks[index] = block
+    return block
+
+def strong_class(char: str) -> int:
+    """
+    Get the strong bidi class of a character.
+
+    Args:
+        char: Single character
+
+    Returns:
+        int: STRONG_LTR, STRONG_RTL or NEUTRAL
+    """
+    cp = ord(char)
+    block = _blocks[cp >> _BLOCK_BITS] or _load_block(cp >> _BLOCK_BITS)
+    return block[cp & _BLOCK_MASK]
+
+def first_strong_direction(text: str) -> Optional[str]:
+    """
+    Get the direction of the first strong character (UAX #9 rules P2/P3).
+
+    Args:
+        text: Text to classify
+
+    Returns:
+        Optional[str]: LTR, RTL, or None if the text has no strong characters
+    """
+    if text.isascii():
+        return LTR if _ASCII_LETTER.search(text) else None
+    blocks = _blocks
+    for char in text:
+        cp = ord(char)
+        block = blocks[cp >> _BLOCK_BITS] or _load_block(cp >> _BLOCK_BITS)
+        strong = block[cp & _BLOCK_MASK]
+        if strong:
+            return LTR if strong == STRONG_LTR else RTL
+    return None
+
+def has_mixed_direction(text: str) -> bool:
+    """
+    Check if text contains both strong LTR and strong RTL characters.
+
+    Args:
+        text: Text to check
+
+    Returns:
+        bool: True if both directions are present
+    """
+    if text.isascii():
+        return False
+    seen = 0
+    blocks = _blocks
+    for char in text:
+        cp = ord(char)
+        block = blocks[cp >> _BLOCK_BITS] or _load_block(cp >> _BLOCK_BITS)
+        seen |= block[cp & _BLOCK_MASK]
+        if seen == STRONG_LTR | STRONG_RTL:
+            return True
+    return False
+
+def direction_runs(text: str) -> List[Tuple[Optional[str], str]]:
+    """
+    Split text into directional runs.
+
+    A new run starts at each strong character whose direction differs from
+    the current run; neutral characters stay in the current run.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        List[Tuple[Optional[str], str]]: (direction, segment) pairs; the
+            direction is None only for text without strong characters
+    """
+    if not text:
+        return []
+    if text.isascii():
+        return [(LTR if _ASCII_LETTER.search(text) else None, text)]
+    runs = []
+    blocks = _blocks
+    current = NEUTRAL
+    start = 0
+    for index, char in enumerate(text):
+        cp = ord(char)
+        block = blocks[cp >> _BLOCK_BITS] or _load_block(cp >> _BLOCK_BITS)
+        strong = block[cp & _BLOCK_MASK]
+        if strong and strong != current:
+            if current:
+                runs.append((LTR if current == STRONG_LTR else RTL, text[start:index]))
+                start = index
+            current = strong
+    direction = {STRONG_LTR: LTR, STRONG_RTL: RTL}.get(current)
+    runs.append((direction, text[start:]))
+    return runs
+
+def isolate(value: str, context: str = LTR) -> str:
+    """
+    Wrap a runtime value in directional isolates for its surrounding text.
+
+    Values whose direction matches the context (and that contain no
+    opposite-direction text) are returned unchanged, so ordinary output
+    such as "Hola José" carries no invisible control characters. Other
+    values with a known direction get LRI/RLI; values without strong
+    characters get FSI.
+
+    Args:
+        value: Value to substitute
+        context: Direction of the surrounding template (LTR or RTL)
+
+    Returns:
+        str: Value wrapped in isolates where needed
+    """
+    if context == LTR and value.isascii():
+        return value
+    direction = first_strong_direction(value)
+    if direction == context and not has_mixed_direction(value):
+        return value
+    if direction == LTR:
+        return f"{LRI}{value}{PDI}"
+    if direction == RTL:
+        return f"{RLI}{value}{PDI}"
+    return f"{FSI}{value}{PDI}"
+
+def _per_char_runs(text: str) -> List[Tuple[Optional[str], str]]:
+    """Reference segmentation calling unicodedata per character."""
+    segments = []
+    current_segment = []
+    current_direction = None
+    for char in text:
+        char_direction = unicodedata.bidirectional(char)
+        if char_direction in ('R', 'AL'):
+            if current_direction == LTR:
+                segments.append((LTR, ''.join(current_segment)))
+                current_segment = []
+            current_direction = RTL
+        elif char_direction == 'L':
+            if current_direction == RTL:
+                segments.append((RTL, ''.join(current_segment)))
+                current_segment = []
+            current_direction = LTR
+        current_segment.append(char)
+    if current_segment:
+        segments.append((current_direction, ''.join(current_segment)))
+    return segments
+
+def benchmark(rounds: int = 20_000) -> Dict[str, float]:
+    """
+    Compare table-driven segmentation with the per-character unicodedata loop.
+
+    Args:
+        rounds: Iterations over the sample names
+
+    Returns:
+        Dict[str, float]: Seconds taken by each approach
+    """
+    names = ["John Smith", "María José", "محمد علي", "דוד כהן (David Cohen)",
+             "山田太郎", "123 - 456", "O'Brien-Smith"]
+    results = {}
+    for label, segment in (("unicodedata_loop", _per_char_runs),
+                           ("table_lookup", direction_runs)):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for name in names:
+                segment(name)
+        results[label] = time.perf_counter() - start
+    return results
+
+if __name__ == "__main__":
+    timings = benchmark()
+    for label, seconds in timings.items():
+        print(f"{label:<18}{seconds * 1000:>10.1f} ms")
+    print(f"{'speedup':<18}{timings['unicodedata_loop'] / timings['table_lookup']:>10.1f}x")
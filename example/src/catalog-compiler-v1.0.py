@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+"""
+Catalog Compiler v1.0
+Lints a locale directory (per-locale JSON catalogs plus metadata.json) and
+compiles it into a single validated runtime artifact.
+
+Checks performed in one pass:
+- Missing and extra keys against the reference locale
+- Placeholder mismatches (e.g. {min_length}) between translations,
+  including the arguments of ICU plural/select messages
+- Malformed format strings and messages
+- Plural messages whose categories do not match the locale's plural_rules
+- Fallback chain cycles and references to unknown locales
+- Catalog size per locale
+
+The artifact is loaded at runtime through CompiledStore
+(catalog-store-v1.0.py), so LocaleManager can be pointed at it directly.
+"""
+
+import argparse
+import json
+import os
+import string
+import sys
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from message_format_v1_0 import (
+    ArgumentNode, MessageAST, PluralNode, SelectNode, is_message, parse_message
+)
+
+METADATA_FILE = "metadata.json"
+ARTIFACT_FORMAT = 1
+
+@dataclass
+class LocaleReport:
+    """Lint results for a single locale catalog."""
+    locale: str
+    key_count: int = 0
+    size_bytes: int = 0
+    missing_keys: List[str] = field(default_factory=list)
+    extra_keys: List[str] = field(default_factory=list)
+    placeholder_mismatches: Dict[str, Tuple[List[str], List[str]]] = field(
+        default_factory=dict
+    )
+
+    @property
+    def coverage(self) -> float:
+        """Fraction of reference keys present in this locale."""
+        present = self.key_count - len(self.extra_keys)
+        total = present + len(self.missing_keys)
+        return present / total if total else 1.0
+
+@dataclass
+class CatalogReport:
+    """Aggregated lint results for a locale directory."""
+    reference_locale: str
+    locales: Dict[str, LocaleReport] = field(default_factory=dict)
+    cycles: List[List[str]] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """True if the catalog can be compiled."""
+        return not self.errors
+
+def flatten_catalog(data: Dict, prefix: str = "") -> Dict[str, str]:
+    """
+    Flatten a nested catalog into dotted keys.
+
+    Args:
+        data: Nested translation dictionary
+        prefix: Key prefix for recursion
+
+    Returns:
+        Dict[str, str]: Mapping of dotted key to text
+
+    Raises:
+        ValueError: If a leaf value is not a string
+    """
+    flat = {}
+    for key, value in data.items():
+        dotted = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten_catalog(value, f"{dotted}."))
+        elif isinstance(value, str):
+            flat[dotted] = value
+        else:
+            raise ValueError(f"Non-string value at {dotted}")
+    return flat
+
+def unflatten_catalog(flat: Dict[str, str]) -> Dict:
+    """
+    Rebuild a nested catalog from dotted keys.
+
+    Args:
+        flat: Mapping of dotted key to text
+
+    Returns:
+        Dict: Nested translation dictionary
+    """
+    nested: Dict = {}
+    for key in sorted(flat):
+        node = nested
+        *parents, leaf = key.split('.')
+        for part in parents:
+            node = node.setdefault(part, {})
+        node[leaf] = flat[key]
+    return nested
+
+def _message_arguments(nodes: MessageAST, names: Set[str]) -> None:
+    """Collect argument names from a parsed message, including branches."""
+    for node in nodes:
+        if isinstance(node, ArgumentNode):
+            names.add(node.name)
+        elif isinstance(node, (PluralNode, SelectNode)):
+            names.add(node.name)
+            for _, body in getattr(node, "exact", ()) + node.branches:
+                _message_arguments(body, names)
+
+def _plural_nodes(nodes: MessageAST) -> List[PluralNode]:
+    """Collect the plural nodes of a parsed message, including nested ones."""
+    found = []
+    for node in nodes:
+        if isinstance(node, (PluralNode, SelectNode)):
+            if isinstance(node, PluralNode):
+                found.append(node)
+            for _, body in getattr(node, "exact", ()) + node.branches:
+                found.extend(_plural_nodes(body))
+    return found
+
+def extract_placeholders(text: str) -> Set[str]:
+    """
+    Get the placeholder names used by a format string or ICU message.
+
+    Args:
+        text: Format string, or plural/select message
+
+    Returns:
+        Set[str]: Placeholder field names (attribute/index access stripped)
+
+    Raises:
+        ValueError: If the format string or message is malformed
+    """
+    names: Set[str] = set()
+    if is_message(text):
+        _message_arguments(parse_message(text), names)
+        return names
+    for _, field_name, _, _ in string.Formatter().parse(text):
+        if field_name is not None:
+            names.add(field_name.split('.')[0].split('[')[0])
+    return names
+
+def find_fallback_cycles(chains: Dict[str, List[str]]) -> List[List[str]]:
+    """
+    Detect cycles in the fallback graph.
+
+    A locale listing itself in its own chain is harmless and ignored.
+
+    Args:
+        chains: Mapping of locale code to fallback chain
+
+    Returns:
+        List[List[str]]: Each cycle as a closed path of locale codes
+    """
+    cycles = []
+    seen_cycles = set()
+    state: Dict[str, int] = {}  # 1 = on stack, 2 = done
+    stack: List[str] = []
+
+    def visit(locale: str) -> None:
+        state[locale] = 1
+        stack.append(locale)
+        for target in chains.get(locale, []):
+            if target == locale:
+                continue
+            if state.get(target) == 1:
+                cycle = stack[stack.index(target):] + [target]
+                signature = frozenset(cycle)
+                if signature not in seen_cycles:
+                    seen_cycles.add(signature)
+                    cycles.append(cycle)
+            elif target not in state:
+                visit(target)
+        stack.pop()
+        state[locale] = 2
+
+    for locale in sorted(chains):
+        if locale not in state:
+            visit(locale)
+    return cycles
+
+class CatalogCompiler:
+    """Validates locale catalogs and emits the compiled runtime artifact."""
+
+    def __init__(self, locale_dir: str, reference_locale: str = "en"):
+        """
+        Initialize catalog compiler.
+
+        Args:
+            locale_dir: Directory containing locale files and metadata.json
+            reference_locale: Locale whose keys define full coverage
+        """
+        self.locale_dir = Path(locale_dir)
+        self.reference_locale = reference_locale
+        self.metadata: Dict[str, Dict] = {}
+        self.catalogs: Dict[str, Dict[str, str]] = {}
+
+    def lint(self) -> CatalogReport:
+        """
+        Load and validate every catalog in the locale directory.
+
+        Returns:
+            CatalogReport: Lint results
+        """
+        report = CatalogReport(reference_locale=self.reference_locale)
+        self._load_metadata(report)
+        self._load_catalogs(report)
+
+        reference = self.catalogs.get(self.reference_locale)
+        if reference is None:
+            report.errors.append(
+                f"Reference locale {self.reference_locale} has no catalog"
+            )
+            reference = {}
+        reference_placeholders = self._placeholders_for(
+            self.reference_locale, reference, report
+        )
+
+        for locale, catalog in self.catalogs.items():
+            locale_report = report.locales[locale]
+            if locale != self.reference_locale:
+                placeholders = self._placeholders_for(locale, catalog, report)
+                locale_report.missing_keys = sorted(reference.keys() - catalog.keys())
+                locale_report.extra_keys = sorted(catalog.keys() - reference.keys())
+                for key in reference.keys() & catalog.keys():
+                    expected = reference_placeholders.get(key)
+                    actual = placeholders.get(key)
+                    if expected is not None and actual is not None and expected != actual:
+                        locale_report.placeholder_mismatches[key] = (
+                            sorted(expected), sorted(actual)
+                        )
+            for key in locale_report.missing_keys:
+                report.errors.append(f"{locale}: missing key {key}")
+            for key in locale_report.extra_keys:
+                report.warnings.append(f"{locale}: extra key {key}")
+            for key, (expected, actual) in locale_report.placeholder_mismatches.items():
+                report.errors.append(
+                    f"{locale}: placeholder mismatch in {key}: "
+                    f"expected {expected}, found {actual}"
+                )
+
+        for locale, catalog in self.catalogs.items():
+            self._check_plural_categories(locale, catalog, report)
+        self._check_fallback_chains(report)
+        return report
+
+    def compile(self, output_path: str,
+                report: Optional[CatalogReport] = None) -> CatalogReport:
+        """
+        Lint the catalogs and write the runtime artifact if they are valid.
+
+        The artifact is written to a temporary file and atomically renamed,
+        so readers never observe a partial or unvalidated catalog.
+
+        Args:
+            output_path: Destination path of the compiled artifact
+            report: Optional existing lint report to reuse
+
+        Returns:
+            CatalogReport: Lint results; nothing is written if not ok
+        """
+        report = report or self.lint()
+        if not report.ok:
+            return report
+
+        artifact = {
+            "format": ARTIFACT_FORMAT,
+            "reference_locale": self.reference_locale,
+            "metadata": self.metadata,
+            "catalogs": self.catalogs
+        }
+        output = Path(output_path)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=output.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(artifact, f, ensure_ascii=False,
+                          separators=(',', ':'), sort_keys=True)
+            os.replace(tmp_path, output)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+        return report
+
+    def _load_metadata(self, report: CatalogReport) -> None:
+        """Load metadata.json into self.metadata."""
+        metadata_file = self.locale_dir / METADATA_FILE
+        try:
+            with open(metadata_file, 'r', encoding='utf-8') as f:
+                self.metadata = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            report.errors.append(f"Failed to load metadata: {e}")
+
+    def _load_catalogs(self, report: CatalogReport) -> None:
+        """Load and flatten every locale catalog in the directory."""
+        for locale_file in sorted(self.locale_dir.glob("*.json")):
+            if locale_file.name == METADATA_FILE:
+                continue
+            locale = locale_file.stem
+            locale_report = report.locales.setdefault(locale, LocaleReport(locale))
+            try:
+                raw = locale_file.read_bytes()
+                catalog = flatten_catalog(json.loads(raw.decode('utf-8')))
+            except (UnicodeDecodeError, ValueError) as e:
+                report.errors.append(f"{locale}: invalid catalog: {e}")
+                continue
+            locale_report.key_count = len(catalog)
+            locale_report.size_bytes = len(raw)
+            self.catalogs[locale] = catalog
+            if self.metadata and locale not in self.metadata:
+                report.errors.append(f"{locale}: no entry in {METADATA_FILE}")
+
+    def _placeholders_for(self, locale: str, catalog: Dict[str, str],
+                          report: CatalogReport) -> Dict[str, Set[str]]:
+        """Extract placeholders per key, recording malformed templates."""
+        placeholders = {}
+        for key, text in catalog.items():
+            try:
+                placeholders[key] = extract_placeholders(text)
+            except ValueError as e:
+                kind = "message" if is_message(text) else "format string"
+                report.errors.append(f"{locale}: invalid {kind} in {key}: {e}")
+        return placeholders
+
+    def _check_plural_categories(self, locale: str, catalog: Dict[str, str],
+                                 report: CatalogReport) -> None:
+        """Compare plural branches with the categories the locale defines."""
+        rules = self.metadata.get(locale, {}).get("plural_rules")
+        if not rules:
+            return
+        categories = set(rules) | {"other"}
+        for key, text in catalog.items():
+            if not is_message(text):
+                continue
+            try:
+                plurals = _plural_nodes(parse_message(text))
+            except ValueError:
+                continue  # already reported as an invalid message
+            for node in plurals:
+                branches = {category for category, _ in node.branches}
+                missing = sorted(categories - branches)
+                unknown = sorted(branches - categories)
+                if missing:
+                    report.warnings.append(
+                        f"{locale}: plural {node.name} in {key} lacks categories {missing}"
+                    )
+                if unknown:
+                    report.warnings.append(
+                        f"{locale}: plural {node.name} in {key} uses unknown categories {unknown}"
+                    )
+
+    def _check_fallback_chains(self, report: CatalogReport) -> None:
+        """Validate fallback chain targets and detect cycles."""
+        chains = {
+            locale: list(meta.get("fallback_chain", []))
+            for locale, meta in self.metadata.items()
+        }
+        for locale, chain in chains.items():
+            if locale not in self.catalogs:
+                report.warnings.append(f"{locale}: metadata entry without catalog")
+            for target in chain:
+                if target not in self.metadata:
+                    report.errors.append(
+                        f"{locale}: fallback chain references unknown locale {target}"
+                    )
+        report.cycles = find_fallback_cycles(chains)
+        for cycle in report.cycles:
+            report.errors.append(f"Fallback chain cycle: {' -> '.join(cycle)}")
+
+def format_report(report: CatalogReport) -> str:
+    """
+    Render a lint report as human-readable text.
+
+    Args:
+        report: Lint results
+
+    Returns:
+        str: Report text
+    """
+    lines = [f"{'Locale':<8}{'Keys':>6}{'Bytes':>9}{'Coverage':>10}"
+             f"{'Missing':>9}{'Extra':>7}{'Placeholders':>14}"]
+    for locale in sorted(report.locales):
+        r = report.locales[locale]
+        lines.append(
+            f"{locale:<8}{r.key_count:>6}{r.size_bytes:>9}{r.coverage:>10.1%}"
+            f"{len(r.missing_keys):>9}{len(r.extra_keys):>7}"
+            f"{len(r.placeholder_mismatches):>14}"
+        )
+    lines.extend(f"ERROR: {message}" for message in report.errors)
+    lines.extend(f"WARNING: {message}" for message in report.warnings)
+    lines.append("OK" if report.ok else f"FAILED ({len(report.errors)} errors)")
+    return "\n".join(lines)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point.
+
+    Args:
+        argv: Optional argument list
+
+    Returns:
+        int: Exit status (0 if the catalog is valid)
+    """
+    parser = argparse.ArgumentParser(description="Lint and compile locale catalogs")
+    parser.add_argument("locale_dir", help="Directory with locale JSON files")
+    parser.add_argument("-o", "--output", help="Write compiled artifact to this path")
+    parser.add_argument("-r", "--reference", default="en",
+                        help="Reference locale (default: en)")
+    parser.add_argument("--strict", action="store_true",
+                        help="Treat warnings as errors")
+    parser.add_argument("--json", action="store_true",
+                        help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    compiler = CatalogCompiler(args.locale_dir, args.reference)
+    report = compiler.lint()
+    if args.strict:
+        report.errors.extend(report.warnings)
+        report.warnings = []
+    if args.output:
+        compiler.compile(args.output, report)
+
+    if args.json:
+        print(json.dumps({
+            "ok": report.ok,
+            "reference_locale": report.reference_locale,
+            "locales": {
+                locale: {
+                    "key_count": r.key_count,
+                    "size_bytes": r.size_bytes,
+                    "coverage": r.coverage,
+                    "missing_keys": r.missing_keys,
+                    "extra_keys": r.extra_keys,
+                    "placeholder_mismatches": r.placeholder_mismatches
+                }
+                for locale, r in report.locales.items()
+            },
+            "cycles": report.cycles,
+            "errors": report.errors,
+            "warnings": report.warnings
+        }, ensure_ascii=False, indent=2))
+    else:
+        print(format_report(report))
+    return 0 if report.ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Catalog Store v1.0
+Storage backends for locale catalogs and metadata.json.
+
+- DirectoryStore: one file per locale in a directory (the classic layout)
+- BundleStore: a single zip or tar(.gz) bundle, read with one sequential
+  read; zip members are located through the central directory, tar
+  members are indexed in the same pass
+- MemoryStore: catalogs held in a mapping, for tests and embedding
+- CompiledStore: the validated artifact written by catalog-compiler,
+  so production loads only catalogs that passed the linter
+
+Stores are addressed by file name ("en.json", "metadata.json"), so every
+backend holds the same files as a locale directory.
+"""
+
+import abc
+import copy
+import io
+import json
+import tarfile
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import IO, Any, Dict, List, Mapping, Union
+
+from catalog_compiler_v1_0 import ARTIFACT_FORMAT, METADATA_FILE, unflatten_catalog
+
+class CatalogStore(abc.ABC):
+    """Base class for catalog storage backends."""
+
+    @abc.abstractmethod
+    def read(self, name: str) -> bytes:
+        """
+        Read a stored file.
+
+        Args:
+            name: File name, e.g. "en.json"
+
+        Returns:
+            bytes: File contents
+
+        Raises:
+            FileNotFoundError: If the file is not in the store
+        """
+
+    @abc.abstractmethod
+    def names(self) -> List[str]:
+        """
+        List stored file names.
+
+        Returns:
+            List[str]: Sorted file names
+        """
+
+    def size(self, name: str) -> int:
+        """
+        Get the size of a stored file in bytes.
+
+        Args:
+            name: File name
+
+        Returns:
+            int: Uncompressed size
+
+        Raises:
+            FileNotFoundError: If the file is not in the store
+        """
+        return len(self.read(name))
+
+    def open(self, name: str) -> IO[bytes]:
+        """
+        Open a stored file for incremental reading.
+
+        Args:
+            name: File name
+
+        Returns:
+            IO[bytes]: Binary stream
+
+        Raises:
+            FileNotFoundError: If the file is not in the store
+        """
+        return io.BytesIO(self.read(name))
+
+    def exists(self, name: str) -> bool:
+        """Check if a file is in the store."""
+        return name in self.names()
+
+    def locales(self) -> List[str]:
+        """
+        List locales with a catalog in the store.
+
+        Returns:
+            List[str]: Sorted locale codes
+        """
+        return [name[:-5] for name in self.names()
+                if name.endswith(".json") and name != METADATA_FILE]
+
+    def load_json(self, name: str) -> Any:
+        """
+        Read and parse a stored JSON file.
+
+        Args:
+            name: File name
+
+        Returns:
+            Any: Parsed JSON
+
+        Raises:
+            FileNotFoundError: If the file is not in the store
+            ValueError: If the file is not valid JSON
+        """
+        return json.loads(self.read(name).decode('utf-8'))
+
+class DirectoryStore(CatalogStore):
+    """Catalog files in a directory."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    def read(self, name: str) -> bytes:
+        return (self.path / name).read_bytes()
+
+    def open(self, name: str) -> IO[bytes]:
+        return open(self.path / name, 'rb')
+
+    def size(self, name: str) -> int:
+        return (self.path / name).stat().st_size
+
+    def names(self) -> List[str]:
+        return sorted(path.name for path in self.path.glob("*.json"))
+
+    def exists(self, name: str) -> bool:
+        return (self.path / name).is_file()
+
+class BundleStore(CatalogStore):
+    """Catalog files in a single zip or tar bundle."""
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open a bundle with a single read.
+
+        Members may sit in a subdirectory of the bundle; they are indexed
+        by file name.
+
+        Args:
+            path: Zip, tar, tar.gz/tgz or tar.bz2 file
+
+        Raises:
+            ValueError: If the bundle is unreadable or has clashing names
+        """
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        self._zip = None
+        self._members: Dict[str, Any] = {}
+        try:
+            if zipfile.is_zipfile(io.BytesIO(data)):
+                self._zip = zipfile.ZipFile(io.BytesIO(data))
+                for info in self._zip.infolist():
+                    if not info.is_dir():
+                        self._add_member(info.filename, info)
+            else:
+                with tarfile.open(fileobj=io.BytesIO(data), mode='r:*') as tar:
+                    # Extract during the single pass; compressed tars cannot seek cheaply
+                    for member in tar:
+                        if member.isfile():
+                            self._add_member(member.name, tar.extractfile(member).read())
+        except (zipfile.BadZipFile, tarfile.TarError) as e:
+            raise ValueError(f"Invalid catalog bundle {self.path}: {e}")
+
+    def _add_member(self, member_name: str, entry: Any) -> None:
+        name = PurePosixPath(member_name).name
+        if name in self._members:
+            raise ValueError(f"Duplicate file {name} in catalog bundle {self.path}")
+        self._members[name] = entry
+
+    def read(self, name: str) -> bytes:
+        entry = self._members.get(name)
+        if entry is None:
+            raise FileNotFoundError(f"{name} not in catalog bundle {self.path}")
+        return self._zip.read(entry) if self._zip is not None else entry
+
+    def open(self, name: str) -> IO[bytes]:
+        if self._zip is not None and name in self._members:
+            # Decompress incrementally instead of materializing the member
+            return self._zip.open(self._members[name])
+        return super().open(name)
+
+    def size(self, name: str) -> int:
+        if self._zip is not None and name in self._members:
+            return self._members[name].file_size
+        return super().size(name)
+
+    def names(self) -> List[str]:
+        return sorted(self._members)
+
+    def exists(self, name: str) -> bool:
+        return name in self._members
+
+class MemoryStore(CatalogStore):
+    """Catalogs held in memory."""
+
+    def __init__(self, files: Mapping[str, Any]):
+        """
+        Initialize in-memory store.
+
+        Args:
+            files: File name (".json" optional, e.g. "en" or "metadata") to
+                parsed JSON, str or bytes
+        """
+        self._files = {
+            name if name.endswith(".json") else f"{name}.json": value
+            for name, value in files.items()
+        }
+
+    def read(self, name: str) -> bytes:
+        if name not in self._files:
+            raise FileNotFoundError(f"{name} not in memory store")
+        value = self._files[name]
+        if isinstance(value, bytes):
+            return value
+        if isinstance(value, str):
+            return value.encode('utf-8')
+        return json.dumps(value, ensure_ascii=False).encode('utf-8')
+
+    def load_json(self, name: str) -> Any:
+        value = self._files.get(name)
+        if isinstance(value, (dict, list)):
+            # Copy so callers never share state with the store
+            return copy.deepcopy(value)
+        return super().load_json(name)
+
+    def names(self) -> List[str]:
+        return sorted(self._files)
+
+    def exists(self, name: str) -> bool:
+        return name in self._files
+
+class CompiledStore(MemoryStore):
+    """Catalogs from a compiled catalog artifact."""
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Load a compiled artifact.
+
+        Args:
+            path: Artifact written by CatalogCompiler.compile
+
+        Raises:
+            ValueError: If the file is not a compiled catalog artifact
+        """
+        self.path = Path(path)
+        try:
+            with open(self.path, 'rb') as f:
+                artifact = json.loads(f.read().decode('utf-8'))
+        except (UnicodeDecodeError, ValueError) as e:
+            raise ValueError(f"Invalid catalog artifact {self.path}: {e}")
+        if not isinstance(artifact, dict) or artifact.get("format") != ARTIFACT_FORMAT:
+            raise ValueError(f"Unsupported catalog artifact format in {self.path}")
+        files: Dict[str, Any] = {
+            f"{locale}.json": unflatten_catalog(catalog)
+            for locale, catalog in artifact["catalogs"].items()
+        }
+        files[METADATA_FILE] = artifact["metadata"]
+        super().__init__(files)
+
+def open_store(source: Any) -> CatalogStore:
+    """
+    Get the store for a locale source.
+
+    Args:
+        source: A CatalogStore, a mapping of files, a locale directory,
+            a zip/tar bundle path, or a compiled artifact (.json) path
+
+    Returns:
+        CatalogStore: Matching backend
+    """
+    if isinstance(source, CatalogStore):
+        return source
+    if isinstance(source, Mapping):
+        return MemoryStore(source)
+    path = Path(source)
+    if path.is_file():
+        return CompiledStore(path) if path.suffix == ".json" else BundleStore(path)
+    return DirectoryStore(path)
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Catalog Stream v1.0
+Incremental locale catalog loading without building the nested dict tree.
+
+The parser reads a catalog in fixed-size chunks and yields (dotted key,
+text) pairs as soon as each string is complete, keeping only a stack of
+key prefixes and the unconsumed tail of the current chunk. Strings are
+decoded with the json module's C scanner. Non-string leaves (numbers,
+booleans, null, arrays) are skipped, since lookups only return text.
+
+load_flat_catalog feeds the pairs straight into a FlatCatalog, so peak
+memory during a load stays close to the size of the finished index.
+"""
+
+import io
+import re
+from json.decoder import JSONDecodeError, scanstring
+from typing import IO, Iterator, Tuple, Union
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+# A complete key without escapes, through its colon (the common case)
+_PLAIN_MEMBER = re.compile(r'[ \t\n\r]*"([^"\\\x00-\x1f]*)"[ \t\n\r]*:[ \t\n\r]*')
+_SCALAR = re.compile(r'-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?|true|false|null')
+# Characters that may continue a number matched up to a chunk boundary
+_NUMBER_CONTINUATION = frozenset("0123456789.eE+-")
+
+class FlatCatalog(dict):
+    """Catalog indexed by dotted key ("greeting_templates.default" -> text)."""
+
+class _Reader:
+    """Sliding window over a text stream."""
+
+    def __init__(self, stream: IO[str], chunk_size: int):
+        self._read = stream.read
+        self._chunk_size = chunk_size
+        self._consumed = 0
+        self._eof = False
+        self.buffer = ""
+        self.pos = 0
+
+    def fill(self) -> bool:
+        """Append the next chunk, dropping consumed text; False at EOF."""
+        if self._eof:
+            return False
+        chunk = self._read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._consumed += self.pos
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def error(self, message: str) -> ValueError:
+        return ValueError(f"{message} at offset {self._consumed + self.pos}")
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ("" at EOF)."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise self.error(f"Expected {char!r}")
+        self.pos += 1
+
+    def string(self) -> str:
+        """Decode the string starting at the current quote."""
+        while True:
+            try:
+                value, end = scanstring(self.buffer, self.pos + 1, True)
+            except JSONDecodeError as e:
+                # Usually a string cut by the chunk boundary: read on and retry
+                if self.fill():
+                    continue
+                raise self.error(e.msg)
+            self.pos = end
+            return value
+
+    def scalar(self) -> None:
+        """Skip a number or literal."""
+        while True:
+            match = _SCALAR.match(self.buffer, self.pos)
+            if match is not None and (self._eof or (
+                    match.end() < len(self.buffer)
+                    and self.buffer[match.end()] not in _NUMBER_CONTINUATION)):
+                self.pos = match.end()
+                return
+            if not self.fill():
+                if match is None:
+                    raise self.error("Invalid value")
+
+    def skip_value(self) -> None:
+        """Skip a non-string value, including nested arrays and objects."""
+        depth = 0
+        while True:
+            char = self.peek()
+            if char == '"':
+                self.string()
+            elif char in ('[', '{'):
+                depth += 1
+                self.pos += 1
+            elif char in (']', '}'):
+                if not depth:
+                    raise self.error("Invalid value")
+                depth -= 1
+                self.pos += 1
+            elif char in (',', ':') and depth:
+                self.pos += 1
+            elif char:
+                self.scalar()
+            else:
+                raise self.error("Unexpected end of catalog")
+            if depth <= 0:
+                return
+
+def _text_stream(stream: IO) -> IO[str]:
+    """Wrap binary streams for UTF-8 decoding."""
+    if isinstance(stream, io.TextIOBase):
+        return stream
+    return io.TextIOWrapper(stream, encoding='utf-8')
+
+def iter_catalog_pairs(stream: IO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[str, str]]:
+    """
+    Parse a catalog incrementally.
+
+    Args:
+        stream: Text or binary (UTF-8) stream of a JSON catalog object
+        chunk_size: Characters read per chunk
+
+    Yields:
+        Tuple[str, str]: Dotted key and text, in document order
+
+    Raises:
+        ValueError: If the catalog is not a valid JSON object
+    """
+    reader = _Reader(_text_stream(stream), chunk_size)
+    reader.expect('{')
+    prefixes = [""]
+    plain_member = _PLAIN_MEMBER.match
+    after_value = reader.peek() == '}'
+    while prefixes:
+        if after_value:
+            char = reader.peek()
+            reader.pos += 1
+            if char == '}':
+                prefixes.pop()
+                continue
+            if char != ',':
+                raise reader.error("Expected ',' or '}'")
+        buffer = reader.buffer
+        match = plain_member(buffer, reader.pos)
+        if match is not None:
+            key = prefixes[-1] + match.group(1)
+            position = match.end()
+            if position < len(buffer) and buffer[position] == '"':
+                # Fast path: string value complete within the buffer
+                try:
+                    value, reader.pos = scanstring(buffer, position + 1, True)
+                except JSONDecodeError:
+                    reader.pos = position
+                else:
+                    after_value = True
+                    yield key, value
+                    continue
+            reader.pos = position
+        else:
+            if reader.peek() != '"':
+                raise reader.error("Expected key")
+            key = prefixes[-1] + reader.string()
+            reader.expect(':')
+        char = reader.peek()
+        after_value = True
+        if char == '"':
+            yield key, reader.string()
+        elif char == '{':
+            reader.pos += 1
+            if reader.peek() == '}':
+                reader.pos += 1
+            else:
+                prefixes.append(key + '.')
+                after_value = False
+        else:
+            reader.skip_value()
+    if reader.peek():
+        raise reader.error("Extra data after catalog")
+
+def load_flat_catalog(source: Union[IO, str, bytes],
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> FlatCatalog:
+    """
+    Load a catalog straight into a FlatCatalog.
+
+    Args:
+        source: Stream, or a complete JSON document as str or bytes
+        chunk_size: Characters read per chunk
+
+    Returns:
+        FlatCatalog: Dotted key to text
+
+    Raises:
+        ValueError: If the catalog is not a valid JSON object
+    """
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    elif isinstance(source, str):
+        source = io.StringIO(source)
+    catalog = FlatCatalog()
+    catalog.update(iter_catalog_pairs(source, chunk_size))
+    return catalog
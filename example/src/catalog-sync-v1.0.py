@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Catalog Sync v1.0
+Versioned catalog distribution: a publisher writes per-locale versions and
+key-level deltas to a store, and subscribers on each node fetch only the
+changed keys and apply them to a running LocaleManager.
+
+Store layout (served as plain files, locally or over HTTP):
+- index.json: {"locales": {locale: {"version": N, "oldest_delta": M}}}
+- <locale>/snapshot.json: latest full flat catalog with its version
+- <locale>/<N>.json: delta from version N-1 to N ({"set": {...}, "delete": [...]})
+
+Only the last max_deltas deltas are kept. A subscriber that is too far
+behind, or that finds a delta missing, fetches the snapshot instead.
+"""
+
+import argparse
+import functools
+import json
+import logging
+import sys
+import urllib.error
+import urllib.request
+from dataclasses import dataclass, field
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from artifact_files_v1_0 import write_json_atomic
+from catalog_compiler_v1_0 import METADATA_FILE, flatten_catalog, unflatten_catalog
+
+INDEX_FILE = "index.json"
+SNAPSHOT_FILE = "snapshot.json"
+
+class CatalogPublisher:
+    """Publishes versioned catalogs and deltas into a store directory."""
+
+    def __init__(self, store_dir: str, max_deltas: int = 50):
+        """
+        Initialize publisher.
+
+        Args:
+            store_dir: Store directory (created if missing)
+            max_deltas: Deltas kept per locale before older ones are pruned
+        """
+        self.store_dir = Path(store_dir)
+        self.max_deltas = max_deltas
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+
+    def _read_json(self, path: Path, default: Any) -> Any:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return default
+
+    def publish(self, locale: str, catalog: Dict) -> int:
+        """
+        Publish a new version of a locale catalog if it changed.
+
+        Args:
+            locale: Locale code
+            catalog: Nested translation dictionary
+
+        Returns:
+            int: Current version of the locale
+
+        Raises:
+            ValueError: If the catalog contains non-string values
+        """
+        flat = flatten_catalog(catalog)
+        locale_dir = self.store_dir / locale
+        snapshot = self._read_json(locale_dir / SNAPSHOT_FILE, {"version": 0, "catalog": {}})
+        previous = snapshot["catalog"]
+        changed = {key: text for key, text in flat.items() if previous.get(key) != text}
+        deleted = sorted(key for key in previous if key not in flat)
+        if not changed and not deleted and snapshot["version"]:
+            return snapshot["version"]
+
+        version = snapshot["version"] + 1
+        # The delta goes out before the snapshot and index that reference it
+        write_json_atomic(locale_dir / f"{version}.json", {
+            "locale": locale, "version": version, "base": version - 1,
+            "set": changed, "delete": deleted
+        }, separators=(',', ':'), sort_keys=True)
+        write_json_atomic(locale_dir / SNAPSHOT_FILE, {
+            "locale": locale, "version": version, "catalog": flat
+        }, separators=(',', ':'), sort_keys=True)
+        oldest = max(1, version - self.max_deltas + 1)
+        for stale in range(oldest - 1, 0, -1):
+            stale_path = locale_dir / f"{stale}.json"
+            if not stale_path.exists():
+                break
+            stale_path.unlink()
+
+        index = self._read_json(self.store_dir / INDEX_FILE, {"locales": {}})
+        index["locales"][locale] = {"version": version, "oldest_delta": oldest}
+        write_json_atomic(self.store_dir / INDEX_FILE, index,
+                          separators=(',', ':'), sort_keys=True)
+        return version
+
+    def publish_dir(self, locale_dir: str) -> Dict[str, int]:
+        """
+        Publish every catalog in a locale directory.
+
+        Args:
+            locale_dir: Locale directory (metadata.json is skipped)
+
+        Returns:
+            Dict[str, int]: Version per locale
+        """
+        versions = {}
+        for locale_file in sorted(Path(locale_dir).glob("*.json")):
+            if locale_file.name == METADATA_FILE:
+                continue
+            with open(locale_file, 'r', encoding='utf-8') as f:
+                versions[locale_file.stem] = self.publish(locale_file.stem, json.load(f))
+        return versions
+
+class FileTransport:
+    """Reads store files from a local or shared directory."""
+
+    def __init__(self, store_dir: str):
+        self.store_dir = Path(store_dir)
+
+    def fetch(self, name: str) -> Optional[bytes]:
+        """
+        Fetch a store file.
+
+        Args:
+            name: Path relative to the store root
+
+        Returns:
+            Optional[bytes]: File contents, or None if missing
+        """
+        try:
+            return (self.store_dir / name).read_bytes()
+        except FileNotFoundError:
+            return None
+
+class HttpTransport:
+    """Reads store files from an HTTP server."""
+
+    def __init__(self, base_url: str, timeout: float = 10.0):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+
+    def fetch(self, name: str) -> Optional[bytes]:
+        """
+        Fetch a store file.
+
+        Args:
+            name: Path relative to the store root
+
+        Returns:
+            Optional[bytes]: Response body, or None on 404
+        """
+        try:
+            with urllib.request.urlopen(f"{self.base_url}/{name}", timeout=self.timeout) as response:
+                return response.read()
+        except urllib.error.HTTPError as e:
+            if e.code == 404:
+                return None
+            raise
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format: str, *args: Any) -> None:
+        logging.getLogger(__name__).debug(format % args)
+
+def serve_store(store_dir: str, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """
+    Create an HTTP server for a store directory.
+
+    Call serve_forever() (e.g. in a thread) to start serving; port 0
+    picks a free port, available as server.server_address[1].
+
+    Args:
+        store_dir: Store directory
+        host: Bind address
+        port: Bind port
+
+    Returns:
+        ThreadingHTTPServer: Unstarted server
+    """
+    handler = functools.partial(_QuietHandler, directory=str(store_dir))
+    return ThreadingHTTPServer((host, port), handler)
+
+@dataclass
+class SyncResult:
+    """Outcome of a subscriber sync."""
+    deltas: Dict[str, List[int]] = field(default_factory=dict)
+    snapshots: List[str] = field(default_factory=list)
+    keys_changed: int = 0
+
+    @property
+    def updated(self) -> List[str]:
+        """Locales updated by this sync."""
+        return sorted(set(self.deltas) | set(self.snapshots))
+
+class CatalogSubscriber:
+    """Keeps a running LocaleManager in sync with a catalog store."""
+
+    def __init__(self, locale_manager: Any, transport: Any,
+                 locales: Optional[List[str]] = None):
+        """
+        Initialize subscriber.
+
+        Args:
+            locale_manager: LocaleManager receiving catalog updates
+            transport: FileTransport, HttpTransport or any object with fetch(name)
+            locales: Locales to follow (default: every locale in the store)
+        """
+        self.locale_manager = locale_manager
+        self.transport = transport
+        self.locales = set(locales) if locales is not None else None
+        self.versions: Dict[str, int] = {}
+        self._catalogs: Dict[str, Dict[str, str]] = {}
+        self.logger = logging.getLogger(__name__)
+
+    def _fetch_json(self, name: str) -> Optional[Any]:
+        data = self.transport.fetch(name)
+        return json.loads(data.decode('utf-8')) if data is not None else None
+
+    def _fetch_deltas(self, locale: str, current: int, target: int) -> Optional[List[Dict]]:
+        """Fetch the contiguous deltas from current to target, or None on a gap."""
+        deltas = []
+        for version in range(current + 1, target + 1):
+            delta = self._fetch_json(f"{locale}/{version}.json")
+            if delta is None or delta.get("base") != version - 1:
+                return None
+            deltas.append(delta)
+        return deltas
+
+    def sync(self) -> SyncResult:
+        """
+        Bring followed locales up to the store's versions.
+
+        Each locale's deltas are fetched completely and applied to a copy
+        before the LocaleManager's catalog is swapped, so a failed or
+        partial fetch never leaves a half-applied catalog.
+
+        Returns:
+            SyncResult: Applied deltas and snapshots
+
+        Raises:
+            ValueError: If the store index is missing
+        """
+        index = self._fetch_json(INDEX_FILE)
+        if index is None:
+            raise ValueError("Catalog store has no index")
+        result = SyncResult()
+        for locale, entry in sorted(index["locales"].items()):
+            if self.locales is not None and locale not in self.locales:
+                continue
+            current = self.versions.get(locale, 0)
+            target = entry["version"]
+            if target <= current:
+                continue
+
+            deltas = None
+            if current and current + 1 >= entry.get("oldest_delta", 1):
+                deltas = self._fetch_deltas(locale, current, target)
+            if deltas is not None:
+                flat = dict(self._catalogs[locale])
+                for delta in deltas:
+                    flat.update(delta["set"])
+                    for key in delta["delete"]:
+                        flat.pop(key, None)
+                    result.keys_changed += len(delta["set"]) + len(delta["delete"])
+                result.deltas[locale] = [delta["version"] for delta in deltas]
+            else:
+                snapshot = self._fetch_json(f"{locale}/{SNAPSHOT_FILE}")
+                if snapshot is None:
+                    self.logger.warning(f"No snapshot for {locale} in catalog store")
+                    continue
+                if current:
+                    self.logger.info(f"Version gap for {locale} ({current} -> {target}), "
+                                     "using snapshot")
+                flat = snapshot["catalog"]
+                target = snapshot["version"]
+                result.keys_changed += len(flat)
+                result.snapshots.append(locale)
+
+            self.locale_manager.replace_catalog(locale, unflatten_catalog(flat))
+            self._catalogs[locale] = flat
+            self.versions[locale] = target
+        return result
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point.
+
+    Args:
+        argv: Optional argument list
+
+    Returns:
+        int: Exit status
+    """
+    parser = argparse.ArgumentParser(description="Publish or serve versioned catalogs")
+    commands = parser.add_subparsers(dest="command", required=True)
+    publish = commands.add_parser("publish", help="Publish a locale directory")
+    publish.add_argument("locales", help="Locale directory")
+    publish.add_argument("-s", "--store", required=True, help="Store directory")
+    publish.add_argument("--max-deltas", type=int, default=50)
+    serve = commands.add_parser("serve", help="Serve a store over HTTP")
+    serve.add_argument("store", help="Store directory")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    if args.command == "publish":
+        versions = CatalogPublisher(args.store, args.max_deltas).publish_dir(args.locales)
+        for locale, version in versions.items():
+            print(f"{locale:<8}v{version}")
+        return 0
+
+    server = serve_store(args.store, args.host, args.port)
+    print(f"Serving {args.store} on http://{args.host}:{server.server_address[1]}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
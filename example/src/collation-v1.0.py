@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Collation v1.0
+Locale-aware sort keys for names, built from per-locale weight tables.
+
+Each character maps to three levels of weights, computed once per locale
+and cached in the locale's table:
+- Primary: base letter, ignoring case and accents (with locale tailoring,
+  e.g. Spanish "ñ" as a letter after "n"; katakana folded onto hiragana;
+  letters without a decomposition such as "æ" and "ø" given explicit
+  base letters)
+- Secondary: accents
+- Tertiary: case (lowercase first)
+Punctuation and spaces are ignorable and only break remaining ties.
+"""
+
+import unicodedata
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+SortKey = Tuple[str, str, str, str]
+
+# Built-in tailorings: character -> letter it sorts immediately after
+DEFAULT_TAILORINGS: Dict[str, Dict[str, str]] = {
+    "es": {"ñ": "n"}
+}
+
+_KATAKANA_START = 0x30A1
+_KATAKANA_END = 0x30F6
+_KANA_OFFSET = 0x60
+
+# Letters with no canonical decomposition that sort with Latin base letters;
+# the letter itself becomes the secondary weight so "Aesir" < "Æsir"
+_BASE_LETTERS: Dict[str, str] = {
+    "æ": "ae",
+    "œ": "oe",
+    "ø": "o"
+}
+
+# Primaries (up to 0x21FFFF) are encoded as two 11-bit characters and
+# secondaries are capped below the surrogate range, so keys never contain
+# surrogates and stay encodable
+_PRIMARY_BITS = 11
+_PRIMARY_MASK = (1 << _PRIMARY_BITS) - 1
+_MAX_SECONDARY = 0xD7FF
+
+class _WeightTable(dict):
+    """str.translate table filled lazily from a per-character weight function."""
+
+    def __init__(self, compute: Callable[[str], Optional[str]]):
+        super().__init__()
+        self._compute = compute
+
+    def __missing__(self, codepoint: int) -> Optional[str]:
+        weight = self[codepoint] = self._compute(chr(codepoint))
+        return weight
+
+class Collator:
+    """Sort key builder for a single locale."""
+
+    MAX_CACHED_KEYS = 65536
+
+    def __init__(self, locale: str, tailoring: Optional[Mapping[str, str]] = None):
+        """
+        Initialize collator.
+
+        Args:
+            locale: Locale code
+            tailoring: Optional mapping of character to the letter it
+                sorts immediately after (defaults to DEFAULT_TAILORINGS)
+        """
+        self.locale = locale
+        base_language = locale.split('-')[0].split('_')[0]
+        if tailoring is None:
+            tailoring = DEFAULT_TAILORINGS.get(base_language, {})
+        self._tailored_primaries: Dict[str, int] = {}
+        for char, after in tailoring.items():
+            # Primaries are spaced by 2, leaving odd slots for tailored letters
+            self._tailored_primaries[char.casefold()] = self._base_primary(after) + 1
+        # Weights are encoded as fixed-width strings per level so keys
+        # compare as plain strings and are built with str.translate
+        self._primary = _WeightTable(lambda c: self._weights(c)[0])
+        self._secondary = _WeightTable(lambda c: self._weights(c)[1])
+        self._tertiary = _WeightTable(lambda c: self._weights(c)[2])
+        self._keys: Dict[str, SortKey] = {}
+
+    @staticmethod
+    def _base_primary(char: str) -> int:
+        """Primary weight of an untailored base character."""
+        cp = ord(char)
+        if _KATAKANA_START <= cp <= _KATAKANA_END:
+            cp -= _KANA_OFFSET
+        return cp * 2
+
+    @staticmethod
+    def _encode_primary(weight: int) -> str:
+        """Encode a primary weight as two characters that compare in weight order."""
+        return chr(weight >> _PRIMARY_BITS) + chr(weight & _PRIMARY_MASK)
+
+    def _weights(self, char: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """Compute encoded weights for a character; None if it is ignorable."""
+        folded = char.casefold()
+        tailored = self._tailored_primaries.get(folded)
+        if tailored is not None:
+            return self._encode_primary(tailored), '\x00', '\x00' if char == folded else '\x01'
+
+        letters = _BASE_LETTERS.get(folded)
+        if letters is not None:
+            primaries = ''.join(self._encode_primary(self._base_primary(c)) for c in letters)
+            secondaries = chr(ord(folded)) + '\x00' * (len(letters) - 1)
+            case = '\x00' if char == folded else '\x01'
+            return primaries, secondaries, case * len(letters)
+
+        decomposed = unicodedata.normalize('NFD', char)
+        base = ''.join(c for c in decomposed if not unicodedata.combining(c))
+        marks = sum(ord(c) for c in decomposed if unicodedata.combining(c))
+        if not base or not base.isalnum():
+            return None, None, None
+        letters = base.casefold()
+        primaries = ''.join(self._encode_primary(self._base_primary(c)) for c in letters)
+        secondaries = chr(min(marks, _MAX_SECONDARY)) + '\x00' * (len(letters) - 1)
+        case = '\x00' if base == base.lower() else '\x01'
+        return primaries, secondaries, case * len(letters)
+
+    def sort_key(self, name: str) -> SortKey:
+        """
+        Get the memoized sort key for a name.
+
+        Args:
+            name: Name to sort
+
+        Returns:
+            SortKey: Tuple comparing primary, secondary, tertiary weights
+                and finally the original string
+        """
+        key = self._keys.get(name)
+        if key is not None:
+            return key
+        text = name if name.isascii() else unicodedata.normalize('NFC', name)
+        key = (
+            text.translate(self._primary),
+            text.translate(self._secondary),
+            text.translate(self._tertiary),
+            name
+        )
+        if len(self._keys) >= self.MAX_CACHED_KEYS:
+            self._keys.clear()
+        self._keys[name] = key
+        return key
+
+    def sorted(self, names: Iterable[str], reverse: bool = False) -> List[str]:
+        """
+        Sort names by decorate-sort-undecorate, computing each key once.
+
+        Args:
+            names: Names to sort
+            reverse: Sort descending
+
+        Returns:
+            List[str]: Sorted names
+        """
+        sort_key = self.sort_key
+        decorated = [sort_key(name) for name in names]
+        decorated.sort(reverse=reverse)
+        return [key[-1] for key in decorated]
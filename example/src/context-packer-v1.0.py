@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""
+Context Packer v1.0
+Builds the context bundle for a new session under a token budget.
+
+Artifacts are grouped by name across versions ("simple-io-v1.3.py" and
+"simple_io_v1.0.py" are both versions of simple-io), and only the newest
+version of each is packed; superseded versions are listed as trimmed.
+Versions named in the summaries' artifact sections but absent on disk are
+reported as missing.
+
+Files are packed by priority until the budget is spent:
+1. Newest requirements document and latest session summary
+2. Sources whose interface changed from their previous version, that the
+   latest summary lists as artifacts (the main program), or that define a
+   class or function recorded in the summaries' interface definitions
+3. Sources those import (transitively)
+4. Remaining current sources
+5. Older summaries, newest first
+
+Within a tier, the main program comes first, then sources closer to it
+in the import graph, then those defining more recorded interfaces. Test
+files, and command-line tools not connected to the main program by
+imports (such as this packer), are excluded.
+
+A Python source that does not fit in full is packed as an outline of its
+class and function signatures when that fits. Token counts, imports and
+outlines are cached per file (by size and mtime, then content hash), and
+the last plan is reused while its inputs are unchanged.
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import re
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from artifact_files_v1_0 import module_name, parse_artifact_name, write_json_atomic
+from interface_diff_v1_0 import CACHE_FILE as INTERFACE_CACHE_FILE
+from session_index_v1_0 import INDEX_FILE, SUMMARY_GLOB, SessionIndex
+
+CACHE_FILE = ".context-pack-cache.json"
+CACHE_FORMAT = 2
+CHARS_PER_TOKEN = 4
+SOURCE_SUFFIXES = {".py", ".json", ".md"}
+# Caches the project tools write next to the sources
+TOOL_CACHES = {CACHE_FILE, INDEX_FILE, INTERFACE_CACHE_FILE}
+
+_REQUIREMENTS = re.compile(r'^requirements', re.IGNORECASE)
+_TEST_NAME = re.compile(r'^test[-_]')
+
+# Priority tiers, lowest first
+CORE, CHANGED, DEPENDENCY, CURRENT, HISTORY = range(5)
+
+@dataclass
+class Artifact:
+    """One file considered for the bundle."""
+    path: str
+    name: str
+    version: Tuple[int, ...] = ()
+    tokens: int = 0
+
+    @property
+    def version_label(self) -> str:
+        return "v" + ".".join(map(str, self.version)) if self.version else ""
+
+@dataclass
+class PackPlan:
+    """Files chosen for a bundle, and why the others were left out."""
+    budget: int
+    used: int = 0
+    included: List[Dict[str, Any]] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    trimmed: Dict[str, str] = field(default_factory=dict)
+    missing: List[str] = field(default_factory=list)
+    excluded: List[str] = field(default_factory=list)
+
+def estimate_tokens(text: str, chars_per_token: int = CHARS_PER_TOKEN) -> int:
+    """Estimate the token count of a text."""
+    return -(-len(text) // chars_per_token)
+
+def _imports(tree: ast.Module) -> List[str]:
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module.split(".")[0])
+    return sorted(names)
+
+def _definitions(tree: ast.Module) -> List[str]:
+    return [node.name for node in tree.body
+            if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef))
+            and not node.name.startswith("_")]
+
+def _is_entry_point(tree: ast.Module) -> bool:
+    """Check for a top-level `if __name__ == "__main__":` block."""
+    return any(isinstance(node, ast.If) and isinstance(node.test, ast.Compare)
+               and isinstance(node.test.left, ast.Name) and node.test.left.id == "__name__"
+               for node in tree.body)
+
+def _stub(node: ast.AST) -> ast.AST:
+    """Copy a definition with its body reduced to the docstring summary."""
+    docstring = ast.get_docstring(node)
+    body: List[ast.stmt] = []
+    if docstring:
+        body.append(ast.Expr(ast.Constant(docstring.strip().splitlines()[0])))
+    if isinstance(node, ast.ClassDef):
+        body.extend(_stub(child) for child in node.body
+                    if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef))
+                    and (not child.name.startswith("_") or child.name == "__init__"))
+    if not body or isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        body.append(ast.Expr(ast.Constant(...)))
+    stub = type(node)(**{name: getattr(node, name, None) for name in node._fields})
+    stub.body = body
+    return stub
+
+def python_outline(tree: ast.Module) -> str:
+    """
+    Render the public class and function signatures of a module.
+
+    Args:
+        tree: Parsed module
+
+    Returns:
+        str: Module docstring summary and signature stubs
+    """
+    parts = []
+    docstring = ast.get_docstring(tree)
+    if docstring:
+        parts.append(f'"""{docstring.strip().splitlines()[0]}"""')
+    for node in tree.body:
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)) \
+                and not node.name.startswith("_"):
+            parts.append(ast.unparse(ast.fix_missing_locations(_stub(node))))
+    return "\n\n".join(parts) + "\n"
+
+class ContextPacker:
+    """Selects and bundles the latest project artifacts under a token budget."""
+
+    def __init__(self, root: str, source_dir: Optional[str] = None,
+                 cache_path: Optional[str] = None, chars_per_token: int = CHARS_PER_TOKEN):
+        """
+        Initialize packer.
+
+        Args:
+            root: Project directory holding the summaries and requirements
+            source_dir: Source directory (default: root/src)
+            cache_path: Cache file (default: .context-pack-cache.json in root)
+            chars_per_token: Characters per token for size estimates
+        """
+        self.root = Path(root)
+        self.source_dir = Path(source_dir) if source_dir else self.root / "src"
+        self.cache_path = Path(cache_path) if cache_path else self.root / CACHE_FILE
+        self.chars_per_token = chars_per_token
+        self.index = SessionIndex(str(self.root))
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._plan: Dict[str, Any] = {}
+        self._dirty = False
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("format") == CACHE_FORMAT and data.get("chars_per_token") == chars_per_token:
+                self._files = data.get("files", {})
+                self._plan = data.get("plan", {})
+        except (OSError, ValueError):
+            pass
+
+    def _relative(self, path: Path) -> str:
+        return os.path.relpath(path, self.root).replace(os.sep, "/")
+
+    def _file_info(self, path: Path) -> Dict[str, Any]:
+        """Get the cached token count, imports and outline of a file."""
+        key = self._relative(path)
+        stat = path.stat()
+        entry = self._files.get(key)
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry
+        raw = path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        if entry is None or entry["sha256"] != digest:
+            text = raw.decode('utf-8', errors='replace')
+            entry = {"sha256": digest, "tokens": estimate_tokens(text, self.chars_per_token),
+                     "imports": [], "definitions": [], "entry_point": False,
+                     "outline": None, "outline_tokens": 0}
+            if path.suffix == ".py":
+                try:
+                    tree = ast.parse(text)
+                except SyntaxError:
+                    tree = None
+                if tree is not None:
+                    entry["imports"] = _imports(tree)
+                    entry["definitions"] = _definitions(tree)
+                    entry["entry_point"] = _is_entry_point(tree)
+                    entry["outline"] = python_outline(tree)
+                    entry["outline_tokens"] = estimate_tokens(entry["outline"], self.chars_per_token)
+        entry = dict(entry, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+        self._files[key] = entry
+        self._dirty = True
+        return entry
+
+    def _candidates(self) -> List[Path]:
+        paths = sorted(self.root.glob(SUMMARY_GLOB))
+        paths.extend(path for path in sorted(self.root.glob("*.md"))
+                     if _REQUIREMENTS.match(path.name))
+        if self.source_dir.is_dir():
+            paths.extend(path for path in sorted(self.source_dir.iterdir())
+                         if path.is_file() and path.suffix in SOURCE_SUFFIXES
+                         and not path.name.startswith(".") and path.name not in TOOL_CACHES)
+        return paths
+
+    def _select(self, paths: List[Path], plan: PackPlan) -> List[Tuple[int, str]]:
+        """Assign each current artifact a priority tier, in packing order."""
+        summaries = self.index.summaries
+        latest = self.index.latest()
+        latest_file = latest.file if latest else None
+        summary_files = {summary.file for summary in summaries}
+
+        sources: Dict[str, List[Artifact]] = {}
+        requirements: List[Artifact] = []
+        for path in paths:
+            if path.name in summary_files:
+                continue
+            if _TEST_NAME.match(path.name):
+                plan.excluded.append(self._relative(path))
+                continue
+            name, version = parse_artifact_name(path.name)
+            artifact = Artifact(self._relative(path), name, version,
+                                self._file_info(path)["tokens"])
+            if _REQUIREMENTS.match(path.name):
+                requirements.append(artifact)
+            else:
+                sources.setdefault(name, []).append(artifact)
+
+        current: Dict[str, Artifact] = {}
+        for name, versions in sources.items():
+            versions.sort(key=lambda artifact: artifact.version)
+            current[name] = versions[-1]
+            for old in versions[:-1]:
+                plan.trimmed[old.path] = current[name].path
+
+        # Versions the summaries know of that are newer than anything on disk
+        for summary in summaries:
+            for reference in summary.artifacts:
+                name, version = parse_artifact_name(reference)
+                if version and name in current and version > current[name].version:
+                    missing = f"{reference} ({summary.file})"
+                    if missing not in plan.missing:
+                        plan.missing.append(missing)
+
+        infos = {artifact.path: self._file_info(self.root / artifact.path)
+                 for artifact in current.values()}
+        # "main" is defined by every entry point, so it says nothing about relevance
+        recorded = {name for summary in summaries for name in summary.interfaces} - {"main"}
+        relevance = {path: len(recorded.intersection(info["definitions"]))
+                     for path, info in infos.items()}
+        modules = {module_name(artifact.path): artifact for artifact in current.values()}
+        referenced = {parse_artifact_name(reference)[0]
+                      for reference in (latest.artifacts if latest else [])}
+        main_program = {artifact.path for name, artifact in current.items() if name in referenced}
+        changed = set()
+        for name, artifact in current.items():
+            versions = sources[name]
+            if artifact.path in main_program or relevance[artifact.path]:
+                changed.add(artifact.path)
+            elif len(versions) > 1 and artifact.path.endswith(".py"):
+                previous = self._file_info(self.root / versions[-2].path)
+                if infos[artifact.path]["outline"] != previous["outline"]:
+                    changed.add(artifact.path)
+
+        dependencies: Set[str] = set()
+        pending = list(changed)
+        while pending:
+            for imported in infos[pending.pop()]["imports"]:
+                dependency = modules.get(imported)
+                if dependency and dependency.path not in changed | dependencies:
+                    dependencies.add(dependency.path)
+                    pending.append(dependency.path)
+
+        # Import graph in both directions: importers of a module are as
+        # related to it as the modules it imports
+        neighbours: Dict[str, Set[str]] = {path: set() for path in infos}
+        for path, info in infos.items():
+            for imported in info["imports"]:
+                dependency = modules.get(imported)
+                if dependency and dependency.path != path:
+                    neighbours[path].add(dependency.path)
+                    neighbours[dependency.path].add(path)
+        distance = dict.fromkeys(changed, 0)
+        frontier = sorted(changed)
+        while frontier:
+            reached = []
+            for path in frontier:
+                for neighbour in sorted(neighbours[path]):
+                    if neighbour not in distance:
+                        distance[neighbour] = distance[path] + 1
+                        reached.append(neighbour)
+            frontier = reached
+        if changed:
+            # Modules the main program uses, and modules built on those
+            related = changed | dependencies
+            grown = True
+            while grown:
+                importers = {path for path, info in infos.items() if path not in related
+                             and any(modules.get(imported) is not None
+                                     and modules[imported].path in related
+                                     for imported in info["imports"])}
+                related |= importers
+                grown = bool(importers)
+            # Tools: unrelated entry points, and helpers only tools import
+            tools = {path for path, info in infos.items()
+                     if path not in related and info["entry_point"]}
+            grown = True
+            while grown:
+                helpers = {path for path in infos if path not in related | tools
+                           and neighbours[path] and neighbours[path] <= tools}
+                tools |= helpers
+                grown = bool(helpers)
+            plan.excluded.extend(tools)
+        excluded = set(plan.excluded)
+        plan.excluded.sort()
+
+        order: List[Tuple[int, str]] = []
+        if requirements:
+            requirements.sort(key=lambda artifact: artifact.version)
+            order.append((CORE, requirements[-1].path))
+            for old in requirements[:-1]:
+                plan.trimmed[old.path] = requirements[-1].path
+        for summary in reversed(summaries):
+            if not (summary.title or summary.session_id):
+                continue
+            tier = CORE if summary.file == latest_file else HISTORY
+            order.append((tier, self._relative(self.root / summary.file)))
+        ranked = sorted(
+            (artifact.path for artifact in current.values() if artifact.path not in excluded),
+            key=lambda path: (distance.get(path, len(infos)), path not in main_program,
+                              -relevance[path], path)
+        )
+        for path in ranked:
+            if path in changed:
+                tier = CHANGED
+            elif path in dependencies:
+                tier = DEPENDENCY
+            else:
+                tier = CURRENT
+            order.append((tier, path))
+        # Stable sort keeps newest-first summaries and the ranking within tiers
+        order.sort(key=lambda item: item[0])
+        return order
+
+    def plan(self, budget: int) -> PackPlan:
+        """
+        Choose the files for a bundle.
+
+        Args:
+            budget: Token budget
+
+        Returns:
+            PackPlan: Included files (full or outline), skipped, trimmed
+                and missing artifacts
+        """
+        self.index.update()
+        paths = self._candidates()
+        fingerprint = hashlib.sha256(json.dumps(
+            [budget] + [(self._relative(path), self._file_info(path)["sha256"]) for path in paths]
+        ).encode('utf-8')).hexdigest()
+        if self._plan.get("fingerprint") == fingerprint:
+            self._save()
+            return PackPlan(**self._plan["plan"])
+
+        plan = PackPlan(budget=budget)
+        for tier, path in self._select(paths, plan):
+            info = self._file_info(self.root / path)
+            if plan.used + info["tokens"] <= budget:
+                mode, tokens = "full", info["tokens"]
+            elif info["outline"] and plan.used + info["outline_tokens"] <= budget:
+                mode, tokens = "outline", info["outline_tokens"]
+            else:
+                plan.skipped.append(path)
+                continue
+            plan.used += tokens
+            plan.included.append({"path": path, "mode": mode, "tokens": tokens, "tier": tier})
+        self._plan = {"fingerprint": fingerprint, "plan": asdict(plan)}
+        self._dirty = True
+        self._save()
+        return plan
+
+    def _save(self) -> None:
+        if self._dirty:
+            write_json_atomic(self.cache_path, {
+                "format": CACHE_FORMAT, "chars_per_token": self.chars_per_token,
+                "files": self._files, "plan": self._plan
+            })
+            self._dirty = False
+
+    def render(self, plan: PackPlan) -> str:
+        """
+        Assemble the bundle text for a plan.
+
+        Args:
+            plan: Plan from plan()
+
+        Returns:
+            str: Files in priority order, each under a header line
+        """
+        parts = []
+        for item in plan.included:
+            path = item["path"]
+            if item["mode"] == "outline":
+                header = f"===== {path} (interface outline) ====="
+                body = self._file_info(self.root / path)["outline"]
+            else:
+                header = f"===== {path} ====="
+                body = (self.root / path).read_text(encoding='utf-8', errors='replace')
+            parts.append(f"{header}\n{body.rstrip()}\n")
+        return "\n".join(parts)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point.
+
+    Args:
+        argv: Optional argument list
+
+    Returns:
+        int: Exit status
+    """
+    parser = argparse.ArgumentParser(description="Pack the latest project artifacts for a new session")
+    parser.add_argument("root", nargs="?", default=".", help="Project directory")
+    parser.add_argument("-b", "--budget", type=int, default=50000, help="Token budget")
+    parser.add_argument("-s", "--source-dir", help="Source directory (default: ROOT/src)")
+    parser.add_argument("-o", "--output", help="Bundle file (default: stdout)")
+    parser.add_argument("--manifest", action="store_true",
+                        help="Print the plan as JSON instead of the bundle")
+    args = parser.parse_args(argv)
+
+    packer = ContextPacker(args.root, args.source_dir)
+    plan = packer.plan(args.budget)
+    if args.manifest:
+        print(json.dumps(asdict(plan), indent=2))
+        return 0
+    bundle = packer.render(plan)
+    if args.output:
+        Path(args.output).write_text(bundle, encoding='utf-8')
+        print(f"Packed {len(plan.included)} files, ~{plan.used}/{plan.budget} tokens "
+              f"({len(plan.skipped)} skipped, {len(plan.trimmed)} superseded, "
+              f"{len(plan.excluded)} excluded)")
+    else:
+        sys.stdout.write(bundle)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
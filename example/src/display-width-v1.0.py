@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Display Width v1.0
+Terminal cell width, padding, truncation and columnar formatting for text
+mixing Latin, CJK and RTL scripts.
+
+Width classes are kept in a two-level table of 256-entry blocks, filled
+lazily from unicodedata and shared between identical blocks, in the same
+layout as the bidi classifier. Printable ASCII text takes a len() fast
+path; ASCII control characters are zero width on both paths.
+"""
+
+import unicodedata
+from typing import Any, Dict, List, Optional, Sequence
+
+ZERO = 0
+NARROW = 1
+WIDE = 2
+AMBIGUOUS = 3
+
+LEFT = "left"
+RIGHT = "right"
+CENTER = "center"
+
+_BLOCK_BITS = 8
+_BLOCK_MASK = (1 << _BLOCK_BITS) - 1
+_ZERO_WIDTH_CATEGORIES = {'Mn', 'Me', 'Cf', 'Cc'}
+
+_blocks: List[Optional[bytes]] = [None] * (0x110000 >> _BLOCK_BITS)
+_unique_blocks: Dict[bytes, bytes] = {}
+
+def _char_class(char: str) -> int:
+    """Compute the width class of a character."""
+    if unicodedata.category(char) in _ZERO_WIDTH_CATEGORIES:
+        return ZERO
+    east_asian = unicodedata.east_asian_width(char)
+    if east_asian in ('W', 'F'):
+        return WIDE
+    if east_asian == 'A':
+        return AMBIGUOUS
+    return NARROW
+
+def _load_block(index: int) -> bytes:
+    """Compute and memoize the width-class block for a block index."""
+    start = index << _BLOCK_BITS
+    block = bytes(_char_class(chr(cp)) for cp in range(start, start + _BLOCK_MASK + 1))
+    block = _unique_blocks.setdefault(block, block)
+    _blocks[index] = block
+    return block
+
+def char_width(char: str, ambiguous_width: int = 1) -> int:
+    """
+    Get the terminal cell width of a character.
+
+    Args:
+        char: Single character
+        ambiguous_width: Width for East Asian ambiguous characters
+
+    Returns:
+        int: 0, 1 or 2
+    """
+    cp = ord(char)
+    block = _blocks[cp >> _BLOCK_BITS] or _load_block(cp >> _BLOCK_BITS)
+    width = block[cp & _BLOCK_MASK]
+    return ambiguous_width if width == AMBIGUOUS else width
+
+def display_width(text: str, ambiguous_width: int = 1) -> int:
+    """
+    Get the terminal cell width of text.
+
+    Args:
+        text: Text to measure
+        ambiguous_width: Width for East Asian ambiguous characters
+
+    Returns:
+        int: Number of terminal cells
+    """
+    if text.isascii() and text.isprintable():
+        return len(text)
+    total = 0
+    blocks = _blocks
+    for char in text:
+        cp = ord(char)
+        block = blocks[cp >> _BLOCK_BITS] or _load_block(cp >> _BLOCK_BITS)
+        width = block[cp & _BLOCK_MASK]
+        total += ambiguous_width if width == AMBIGUOUS else width
+    return total
+
+def pad(text: str, width: int, align: str = LEFT, fill: str = ' ',
+        ambiguous_width: int = 1) -> str:
+    """
+    Pad text to a display width.
+
+    Args:
+        text: Text to pad
+        width: Target width in cells
+        align: LEFT, RIGHT or CENTER
+        fill: Single-cell fill character
+        ambiguous_width: Width for East Asian ambiguous characters
+
+    Returns:
+        str: Padded text (unchanged if already wider)
+    """
+    missing = width - display_width(text, ambiguous_width)
+    if missing <= 0:
+        return text
+    if align == RIGHT:
+        return fill * missing + text
+    if align == CENTER:
+        left = missing // 2
+        return fill * left + text + fill * (missing - left)
+    return text + fill * missing
+
+def truncate(text: str, width: int, ellipsis: str = "…",
+             ambiguous_width: int = 1) -> str:
+    """
+    Truncate text to fit a display width.
+
+    Wide characters are never split; the ellipsis counts toward the width.
+
+    Args:
+        text: Text to truncate
+        width: Maximum width in cells
+        ellipsis: Marker appended when text is cut
+        ambiguous_width: Width for East Asian ambiguous characters
+
+    Returns:
+        str: Text fitting within width cells
+    """
+    ascii_text = text.isascii() and text.isprintable()
+    if (len(text) if ascii_text else display_width(text, ambiguous_width)) <= width:
+        return text
+    budget = width - display_width(ellipsis, ambiguous_width)
+    if budget < 0:
+        budget, ellipsis = width, ""
+    if ascii_text:
+        return text[:budget] + ellipsis
+    used = 0
+    for index, char in enumerate(text):
+        char_cells = char_width(char, ambiguous_width)
+        if used + char_cells > budget:
+            return text[:index] + ellipsis
+        used += char_cells
+    return text
+
+def format_columns(rows: Sequence[Sequence[Any]],
+                   headers: Optional[Sequence[str]] = None,
+                   directions: Optional[Sequence[Any]] = None,
+                   max_widths: Optional[Sequence[Optional[int]]] = None,
+                   separator: str = "  ",
+                   ambiguous_width: int = 1) -> str:
+    """
+    Format rows into display-width aligned columns.
+
+    Columns whose direction is RTL (e.g. a LocaleMetadata.direction of
+    TextDirection.RTL) are right-aligned; others are left-aligned.
+
+    Args:
+        rows: Table rows; cells are converted with str()
+        headers: Optional header row
+        directions: Optional per-column direction ("ltr"/"rtl" or TextDirection)
+        max_widths: Optional per-column maximum widths; longer cells are truncated
+        separator: Text between columns
+        ambiguous_width: Width for East Asian ambiguous characters
+
+    Returns:
+        str: Formatted table, one line per row
+    """
+    table = [[str(cell) for cell in row] for row in rows]
+    if headers is not None:
+        table.insert(0, [str(header) for header in headers])
+    if not table:
+        return ""
+    column_count = max(len(row) for row in table)
+    if max_widths:
+        for row in table:
+            for index, limit in enumerate(max_widths[:len(row)]):
+                if limit is not None:
+                    row[index] = truncate(row[index], limit, ambiguous_width=ambiguous_width)
+
+    widths = [0] * column_count
+    cell_widths = []
+    for row in table:
+        row_widths = [display_width(cell, ambiguous_width) for cell in row]
+        cell_widths.append(row_widths)
+        for index, cell_cells in enumerate(row_widths):
+            if cell_cells > widths[index]:
+                widths[index] = cell_cells
+
+    aligns = []
+    for index in range(column_count):
+        direction = directions[index] if directions and index < len(directions) else None
+        aligns.append(RIGHT if getattr(direction, 'value', direction) == "rtl" else LEFT)
+
+    lines = []
+    last = column_count - 1
+    for row, row_widths in zip(table, cell_widths):
+        cells = []
+        for index in range(column_count):
+            cell = row[index] if index < len(row) else ""
+            missing = widths[index] - (row_widths[index] if index < len(row) else 0)
+            if aligns[index] == RIGHT:
+                cells.append(" " * missing + cell)
+            elif index == last:
+                # No trailing padding; the cell's own spaces are kept
+                cells.append(cell)
+            else:
+                cells.append(cell + " " * missing)
+        lines.append(separator.join(cells))
+    return "\n".join(lines)
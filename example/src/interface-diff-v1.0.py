@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+Interface Diff v1.0
+Class and function signature diffs between module versions.
+
+Every source is reduced to an interface summary: its public classes (with
+bases and methods) and top-level functions, keyed by qualified name
+("LocaleManager.get_text"), each with its parameters and return
+annotation. Summaries are cached by content hash, and so are diffs
+between two summaries, so walking a long version history only parses and
+compares the files that changed since the last run.
+
+Any two sources can be compared, including different artifacts, e.g.
+LocaleManager in simple-io-v1.3.py against locale-manager-v1.5.py. The
+diff is JSON, or Markdown for the session summary's Interface Updates
+section.
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from artifact_files_v1_0 import parse_artifact_name, write_json_atomic
+
+CACHE_FILE = ".interface-cache.json"
+CACHE_FORMAT = 1
+
+def _is_public(name: str) -> bool:
+    return not name.startswith("_") or (name.startswith("__") and name.endswith("__"))
+
+def _parameters(args: ast.arguments) -> List[Dict[str, Any]]:
+    """Describe a definition's parameters in declaration order."""
+    params = []
+    positional = args.posonlyargs + args.args
+    defaults = [None] * (len(positional) - len(args.defaults)) + list(args.defaults)
+    for index, (arg, default) in enumerate(zip(positional, defaults)):
+        kind = "positional_only" if index < len(args.posonlyargs) else "positional"
+        params.append((arg, kind, default))
+    if args.vararg:
+        params.append((args.vararg, "var_positional", None))
+    params.extend((arg, "keyword_only", default)
+                  for arg, default in zip(args.kwonlyargs, args.kw_defaults))
+    if args.kwarg:
+        params.append((args.kwarg, "var_keyword", None))
+    return [{
+        "name": arg.arg,
+        "kind": kind,
+        "annotation": ast.unparse(arg.annotation) if arg.annotation else None,
+        "default": ast.unparse(default) if default is not None else None
+    } for arg, kind, default in params]
+
+def _function_entry(node: ast.AST, kind: str) -> Dict[str, Any]:
+    args = ast.unparse(node.args)
+    returns = ast.unparse(node.returns) if node.returns else None
+    prefix = "async def" if isinstance(node, ast.AsyncFunctionDef) else "def"
+    return {
+        "kind": kind,
+        "signature": f"{prefix} {node.name}({args})" + (f" -> {returns}" if returns else ""),
+        "parameters": _parameters(node.args),
+        "returns": returns,
+        "decorators": [ast.unparse(decorator) for decorator in node.decorator_list]
+    }
+
+def summarize_source(text: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Build the interface summary of a module.
+
+    Args:
+        text: Python source
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Qualified name to definition entry
+            (kind, signature, parameters, returns, decorators; bases for classes)
+
+    Raises:
+        SyntaxError: If the source does not parse
+    """
+    symbols: Dict[str, Dict[str, Any]] = {}
+    for node in ast.parse(text).body:
+        if not getattr(node, "name", "") or not _is_public(node.name):
+            continue
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            symbols[node.name] = _function_entry(node, "function")
+        elif isinstance(node, ast.ClassDef):
+            bases = [ast.unparse(base) for base in node.bases]
+            symbols[node.name] = {
+                "kind": "class",
+                "signature": f"class {node.name}" + (f"({', '.join(bases)})" if bases else ""),
+                "bases": bases,
+                "decorators": [ast.unparse(decorator) for decorator in node.decorator_list]
+            }
+            for child in node.body:
+                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)) \
+                        and _is_public(child.name):
+                    symbols[f"{node.name}.{child.name}"] = _function_entry(child, "method")
+    return symbols
+
+def _parameter_changes(before: List[Dict[str, Any]],
+                       after: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], bool]:
+    """Compare parameter lists; returns the changes and whether callers still work."""
+    old = {param["name"]: param for param in before}
+    new = {param["name"]: param for param in after}
+    added = [param for param in after if param["name"] not in old]
+    removed = [param for param in before if param["name"] not in new]
+    changed = [{"name": name, "before": old[name], "after": new[name]}
+               for name in old if name in new and old[name] != new[name]]
+    accepts_extra_keywords = any(param["kind"] == "var_keyword" for param in after)
+    compatible = not removed or accepts_extra_keywords
+    # Existing positional parameters must keep their positions
+    old_positional = [param["name"] for param in before
+                      if param["kind"] in ("positional_only", "positional")]
+    new_positional = [param["name"] for param in after
+                      if param["kind"] in ("positional_only", "positional")]
+    if new_positional[:len(old_positional)] != old_positional:
+        compatible = False
+    for param in added:
+        if param["default"] is None and param["kind"] not in ("var_positional", "var_keyword"):
+            compatible = False
+    for change in changed:
+        if change["before"]["default"] is not None and change["after"]["default"] is None:
+            compatible = False
+        if change["before"]["kind"] != change["after"]["kind"] and \
+                change["after"]["kind"] in ("positional_only", "keyword_only"):
+            compatible = False
+    result = {}
+    if added:
+        result["parameters_added"] = added
+    if removed:
+        result["parameters_removed"] = removed
+    if changed:
+        result["parameters_changed"] = changed
+    return result, compatible
+
+def diff_summaries(before: Dict[str, Dict[str, Any]],
+                   after: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Diff two interface summaries.
+
+    Args:
+        before: Summary of the older source
+        after: Summary of the newer source
+
+    Returns:
+        Dict[str, Any]: Added, removed and changed symbols, and whether the
+            newer interface is backward compatible
+    """
+    added = [dict(after[name], name=name) for name in after if name not in before]
+    removed = [dict(before[name], name=name) for name in before if name not in after]
+    changed = []
+    compatible = not removed
+    for name in before:
+        if name not in after or before[name] == after[name]:
+            continue
+        old, new = before[name], after[name]
+        change = {"name": name, "kind": new["kind"], "before": old["signature"],
+                  "after": new["signature"], "compatible": True}
+        if old["kind"] != new["kind"]:
+            change["compatible"] = False
+        elif new["kind"] == "class":
+            removed_bases = [base for base in old["bases"] if base not in new["bases"]]
+            if removed_bases:
+                change["bases_removed"] = removed_bases
+                change["compatible"] = False
+        else:
+            params, change["compatible"] = _parameter_changes(old["parameters"], new["parameters"])
+            change.update(params)
+            if old["returns"] != new["returns"]:
+                change["returns_changed"] = True
+        if old.get("decorators") != new.get("decorators"):
+            change["decorators"] = {"before": old.get("decorators", []),
+                                    "after": new.get("decorators", [])}
+        compatible = compatible and change["compatible"]
+        changed.append(change)
+    return {"added": added, "removed": removed, "changed": changed, "compatible": compatible}
+
+class InterfaceDiffer:
+    """Cached interface summaries and diffs for the sources of a directory."""
+
+    def __init__(self, source_dir: str, cache_path: Optional[str] = None):
+        """
+        Initialize differ.
+
+        Args:
+            source_dir: Directory with versioned Python sources
+            cache_path: Cache file (default: .interface-cache.json in source_dir)
+        """
+        self.source_dir = Path(source_dir)
+        self.cache_path = Path(cache_path) if cache_path else self.source_dir / CACHE_FILE
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._summaries: Dict[str, Dict[str, Any]] = {}
+        self._diffs: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("format") == CACHE_FORMAT:
+                self._files = data.get("files", {})
+                self._summaries = data.get("summaries", {})
+                self._diffs = data.get("diffs", {})
+        except (OSError, ValueError):
+            pass
+
+    def _resolve(self, source: str) -> Path:
+        path = Path(source)
+        if not path.is_file():
+            path = self.source_dir / source
+        if not path.is_file():
+            raise ValueError(f"Source not found: {source}")
+        return path
+
+    def _digest(self, path: Path) -> str:
+        """Get a file's content hash, rehashing only if size or mtime changed."""
+        stat = path.stat()
+        key = str(path.resolve())
+        entry = self._files.get(key)
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry["sha256"]
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        self._files[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest}
+        self._dirty = True
+        return digest
+
+    def summary(self, source: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the interface summary of a source.
+
+        Args:
+            source: File path, or file name within the source directory
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Qualified name to definition entry
+
+        Raises:
+            ValueError: If the source is missing or does not parse
+        """
+        path = self._resolve(source)
+        digest = self._digest(path)
+        if digest not in self._summaries:
+            try:
+                self._summaries[digest] = summarize_source(path.read_text(encoding='utf-8'))
+            except SyntaxError as e:
+                raise ValueError(f"Cannot parse {path.name}: {e}")
+            self._dirty = True
+        return self._summaries[digest]
+
+    def diff(self, before: str, after: str) -> Dict[str, Any]:
+        """
+        Diff the interfaces of two sources.
+
+        Args:
+            before: Older source
+            after: Newer source
+
+        Returns:
+            Dict[str, Any]: Diff with "from"/"to" file names
+
+        Raises:
+            ValueError: If a source is missing or does not parse
+        """
+        old_path, new_path = self._resolve(before), self._resolve(after)
+        key = f"{self._digest(old_path)}:{self._digest(new_path)}"
+        if key not in self._diffs:
+            self._diffs[key] = diff_summaries(self.summary(before), self.summary(after))
+            self._dirty = True
+        return dict({"from": old_path.name, "to": new_path.name}, **self._diffs[key])
+
+    def versions(self) -> Dict[str, List[str]]:
+        """
+        Group the versioned sources of the directory by artifact.
+
+        Returns:
+            Dict[str, List[str]]: Artifact name to file names, oldest first
+        """
+        groups: Dict[str, List[Tuple[Tuple[int, ...], str]]] = {}
+        for path in self.source_dir.glob("*.py"):
+            name, version = parse_artifact_name(path.name)
+            if version:
+                groups.setdefault(name, []).append((version, path.name))
+        return {name: [file for _, file in sorted(files)] for name, files in sorted(groups.items())}
+
+    def history(self, artifact: str) -> List[Dict[str, Any]]:
+        """
+        Diff each version of an artifact against the one before it.
+
+        Args:
+            artifact: Artifact name, e.g. "simple-io" or "simple-io.py"
+
+        Returns:
+            List[Dict[str, Any]]: Diffs, oldest first
+
+        Raises:
+            ValueError: If the artifact has no versioned sources
+        """
+        name = artifact if artifact.endswith(".py") else f"{artifact}.py"
+        files = self.versions().get(name.replace("_", "-"))
+        if not files:
+            raise ValueError(f"No versioned sources for {artifact}")
+        return [self.diff(old, new) for old, new in zip(files, files[1:])]
+
+    def save(self) -> None:
+        """Write the cache if anything was parsed, diffed or deleted."""
+        files = {key: entry for key, entry in self._files.items() if Path(key).is_file()}
+        if len(files) != len(self._files):
+            self._files = files
+            self._dirty = True
+        if self._dirty:
+            # Drop summaries and diffs of content no longer on disk
+            live = {entry["sha256"] for entry in self._files.values()}
+            self._summaries = {digest: summary for digest, summary in self._summaries.items()
+                               if digest in live}
+            self._diffs = {key: diff for key, diff in self._diffs.items()
+                           if set(key.split(":")) <= live}
+            write_json_atomic(self.cache_path, {
+                "format": CACHE_FORMAT, "files": self._files,
+                "summaries": self._summaries, "diffs": self._diffs
+            })
+            self._dirty = False
+
+def interface_definition(summary: Dict[str, Dict[str, Any]]) -> str:
+    """
+    Render a summary in the style of "Current Interface Definition" blocks.
+
+    Args:
+        summary: Interface summary
+
+    Returns:
+        str: Class and def lines, methods indented under their class
+    """
+    lines = []
+    for name, entry in summary.items():
+        indent = "    " if entry["kind"] == "method" else ""
+        if not indent and lines:
+            lines.append("")
+        lines.extend(f"{indent}@{decorator}" for decorator in entry.get("decorators", []))
+        lines.append(indent + entry["signature"] + (":" if entry["kind"] == "class" else ""))
+    return "\n".join(lines)
+
+def _describe_change(change: Dict[str, Any]) -> str:
+    details = []
+    for param in change.get("parameters_added", []):
+        details.append(f"added `{param['name']}`")
+    for param in change.get("parameters_removed", []):
+        details.append(f"removed `{param['name']}`")
+    for param in change.get("parameters_changed", []):
+        details.append(f"changed `{param['name']}`")
+    if change.get("returns_changed"):
+        details.append("return type changed")
+    for base in change.get("bases_removed", []):
+        details.append(f"no longer derives from `{base}`")
+    if "decorators" in change:
+        details.append("decorators changed")
+    text = f"Modified `{change['name']}`"
+    if details:
+        text += ": " + ", ".join(details)
+    if not change["compatible"]:
+        text += " (breaking)"
+    return text
+
+def interface_updates_markdown(diff: Dict[str, Any], summary: Dict[str, Dict[str, Any]]) -> str:
+    """
+    Render a diff as the session summary's Interface Updates section.
+
+    Args:
+        diff: Diff from InterfaceDiffer.diff
+        summary: Interface summary of the newer source
+
+    Returns:
+        str: Markdown section
+    """
+    changes = [f"Added {entry['kind']} `{entry['name']}`" for entry in diff["added"]]
+    changes.extend(_describe_change(change) for change in diff["changed"])
+    changes.extend(f"Removed {entry['kind']} `{entry['name']}` (breaking)"
+                   for entry in diff["removed"])
+    if not changes:
+        changes.append("No interface changes")
+    changes.append("Backward compatible" if diff["compatible"] else
+                   "Not backward compatible; callers of the breaking items need updates")
+    return "\n".join([
+        "## Interface Updates",
+        "### Current Interface Definition",
+        "```python",
+        f"# {diff['to']}",
+        interface_definition(summary),
+        "```",
+        "",
+        "### Interface Changes",
+        f"Compared with {diff['from']}:"
+    ] + [f"- {change}" for change in changes]) + "\n"
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point.
+
+    Args:
+        argv: Optional argument list
+
+    Returns:
+        int: Exit status (1 on errors, 2 when --check finds breaking changes)
+    """
+    parser = argparse.ArgumentParser(description="Diff class and function signatures between versions")
+    parser.add_argument("-d", "--dir", default=".", help="Source directory")
+    parser.add_argument("--cache", help="Cache file")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("versions", help="List versioned artifacts")
+    diff_parser = commands.add_parser("diff", help="Diff two sources")
+    diff_parser.add_argument("before")
+    diff_parser.add_argument("after")
+    diff_parser.add_argument("--markdown", action="store_true",
+                             help="Print the Interface Updates section instead of JSON")
+    history_parser = commands.add_parser("history", help="Diff consecutive versions of an artifact")
+    history_parser.add_argument("artifact")
+    for command in (diff_parser, history_parser):
+        command.add_argument("--check", action="store_true",
+                             help="Exit with status 2 on breaking changes")
+    args = parser.parse_args(argv)
+
+    differ = InterfaceDiffer(args.dir, args.cache)
+    try:
+        if args.command == "versions":
+            print(json.dumps(differ.versions(), indent=2))
+            return 0
+        if args.command == "diff":
+            diffs = [differ.diff(args.before, args.after)]
+            if args.markdown:
+                sys.stdout.write(interface_updates_markdown(diffs[0], differ.summary(args.after)))
+            else:
+                print(json.dumps(diffs[0], indent=2))
+        else:
+            diffs = differ.history(args.artifact)
+            print(json.dumps(diffs, indent=2))
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        differ.save()
+    if args.check and not all(diff["compatible"] for diff in diffs):
+        return 2
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
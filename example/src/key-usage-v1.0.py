@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Key Usage v1.0
+Static analysis of translation key usage and per-application catalog
+trimming.
+
+Python sources are scanned for get_text(...) calls. Literal keys are kept
+exactly; f-strings and concatenations with a literal head such as
+f"greeting_templates.{style}" keep every key under that prefix. Any other
+key expression is reported as dynamic. String literals that exactly match
+a catalog key (e.g. "time_greetings.morning" assigned to a variable) are
+kept as well, which resolves most variables passed to get_text.
+
+The trimmed catalogs are written in the regular locale directory layout,
+so LocaleManager loads them unchanged.
+"""
+
+import argparse
+import ast
+import json
+import shutil
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+METADATA_FILE = "metadata.json"
+LOOKUP_FUNCTIONS = {"get_text"}
+
+@dataclass
+class KeyUsage:
+    """Translation keys referenced by a set of sources."""
+    exact: Set[str] = field(default_factory=set)
+    prefixes: Set[str] = field(default_factory=set)
+    literals: Set[str] = field(default_factory=set)
+    dynamic: List[Tuple[str, int, str]] = field(default_factory=list)
+
+    def matches(self, key: str, include_literals: bool = True) -> bool:
+        """
+        Check if a catalog key is used.
+
+        Args:
+            key: Dotted catalog key
+            include_literals: Also accept keys seen as plain string literals
+
+        Returns:
+            bool: True if the key must be kept
+        """
+        if key in self.exact or (include_literals and key in self.literals):
+            return True
+        return any(key.startswith(prefix) for prefix in self.prefixes)
+
+def _literal_head(node: ast.expr) -> Optional[str]:
+    """Get the constant leading text of an f-string or concatenation."""
+    if isinstance(node, ast.JoinedStr):
+        head = []
+        for part in node.values:
+            if isinstance(part, ast.Constant) and isinstance(part.value, str):
+                head.append(part.value)
+            else:
+                break
+        return ''.join(head)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        if isinstance(node.left, ast.Constant) and isinstance(node.left.value, str):
+            return node.left.value
+        return _literal_head(node.left)
+    return None
+
+class _UsageVisitor(ast.NodeVisitor):
+    """Collects get_text key arguments and string literals."""
+
+    def __init__(self, filename: str, usage: KeyUsage):
+        self.filename = filename
+        self.usage = usage
+
+    def visit_Constant(self, node: ast.Constant) -> None:
+        if isinstance(node.value, str) and '.' in node.value and ' ' not in node.value:
+            self.usage.literals.add(node.value)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        func = node.func
+        name = func.attr if isinstance(func, ast.Attribute) else getattr(func, 'id', None)
+        if name in LOOKUP_FUNCTIONS:
+            key_node = node.args[0] if node.args else next(
+                (kw.value for kw in node.keywords if kw.arg == "key"), None
+            )
+            if key_node is not None:
+                self._record(key_node)
+        self.generic_visit(node)
+
+    def _record(self, node: ast.expr) -> None:
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            self.usage.exact.add(node.value)
+            return
+        head = _literal_head(node)
+        if head and '.' in head:
+            # Keep whole segments only: "greeting_templates.x{y}" -> "greeting_templates."
+            self.usage.prefixes.add(head[:head.rindex('.') + 1])
+            return
+        self.usage.dynamic.append(
+            (self.filename, node.lineno, ast.unparse(node))
+        )
+
+def scan_sources(paths: Iterable[str]) -> KeyUsage:
+    """
+    Scan Python files or directories for translation key usage.
+
+    Args:
+        paths: Files or directories (searched recursively for *.py)
+
+    Returns:
+        KeyUsage: Collected usage
+
+    Raises:
+        ValueError: If a source file cannot be parsed
+    """
+    usage = KeyUsage()
+    for path in paths:
+        path = Path(path)
+        files = sorted(path.rglob("*.py")) if path.is_dir() else [path]
+        for source_file in files:
+            try:
+                tree = ast.parse(source_file.read_text(encoding='utf-8'), str(source_file))
+            except SyntaxError as e:
+                raise ValueError(f"Failed to parse {source_file}: {e}")
+            _UsageVisitor(str(source_file), usage).visit(tree)
+    return usage
+
+def trim_catalog(data: Dict, usage: KeyUsage, include_literals: bool = True,
+                 prefix: str = "") -> Dict:
+    """
+    Keep only the used keys of a nested catalog.
+
+    Args:
+        data: Nested translation dictionary
+        usage: Key usage to keep
+        include_literals: Also keep keys seen as plain string literals
+        prefix: Key prefix for recursion
+
+    Returns:
+        Dict: Trimmed nested catalog
+    """
+    trimmed = {}
+    for key, value in data.items():
+        dotted = f"{prefix}{key}"
+        if isinstance(value, dict):
+            child = trim_catalog(value, usage, include_literals, f"{dotted}.")
+            if child:
+                trimmed[key] = child
+        elif usage.matches(dotted, include_literals):
+            trimmed[key] = value
+    return trimmed
+
+def write_trimmed_catalogs(locale_dir: str, output_dir: str, usage: KeyUsage,
+                           include_literals: bool = True) -> Dict[str, Tuple[int, int]]:
+    """
+    Write trimmed copies of every catalog in a locale directory.
+
+    Args:
+        locale_dir: Source locale directory
+        output_dir: Destination directory (metadata.json is copied as is)
+        usage: Key usage to keep
+        include_literals: Also keep keys seen as plain string literals
+
+    Returns:
+        Dict[str, Tuple[int, int]]: Per locale, (original, trimmed) size in bytes
+    """
+    source = Path(locale_dir)
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+    sizes = {}
+    for locale_file in sorted(source.glob("*.json")):
+        if locale_file.name == METADATA_FILE:
+            shutil.copyfile(locale_file, output / METADATA_FILE)
+            continue
+        raw = locale_file.read_bytes()
+        trimmed = trim_catalog(json.loads(raw.decode('utf-8')), usage, include_literals)
+        encoded = json.dumps(trimmed, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        (output / locale_file.name).write_bytes(encoded)
+        sizes[locale_file.stem] = (len(raw), len(encoded))
+    return sizes
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point.
+
+    Args:
+        argv: Optional argument list
+
+    Returns:
+        int: Exit status (1 if a source cannot be parsed, or with --strict
+            if dynamic keys were found, in which case nothing is written)
+    """
+    parser = argparse.ArgumentParser(description="Build trimmed per-application catalogs")
+    parser.add_argument("sources", nargs="+", help="Python files or directories to scan")
+    parser.add_argument("-l", "--locales", required=True, help="Locale directory")
+    parser.add_argument("-o", "--output", required=True, help="Output locale directory")
+    parser.add_argument("--no-literals", action="store_true",
+                        help="Only keep keys passed directly to get_text")
+    parser.add_argument("--strict", action="store_true",
+                        help="Fail if any key expression cannot be resolved")
+    args = parser.parse_args(argv)
+
+    try:
+        usage = scan_sources(args.sources)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    for filename, line, expression in usage.dynamic:
+        print(f"WARNING: {filename}:{line}: dynamic key {expression}", file=sys.stderr)
+    if args.strict and usage.dynamic:
+        print("Error: dynamic keys found, no catalogs written", file=sys.stderr)
+        return 1
+    sizes = write_trimmed_catalogs(args.locales, args.output, usage,
+                                   include_literals=not args.no_literals)
+    for locale, (original, trimmed) in sizes.items():
+        print(f"{locale:<8}{original:>9} -> {trimmed:>9} bytes")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
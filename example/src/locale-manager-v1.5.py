@@ -1,11 +1,25 @@
-from typing import Dict, Optional, List, Any
-import json
+from typing import Dict, Optional, List, Any, Iterable, Iterator, Sequence, Tuple, Union
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-import unicodedata
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
 import logging
+from catalog_store_v1_0 import METADATA_FILE, CatalogStore, open_store
+from catalog_stream_v1_0 import FlatCatalog, load_flat_catalog
+from collation_v1_0 import Collator, SortKey
+from bidi_v1_0 import direction_runs, has_mixed_direction, isolate
+from message_format_v1_0 import (
+    CompiledMessage, CompiledTemplate, Formatter, MessageAST, PluralSelector,
+    compile_message, compile_plural_rules, compile_template, is_message,
+    parse_message
+)
+
+# Template replacement fields such as {name}; excluded from direction analysis
+FORMAT_FIELD_PATTERN = re.compile(r'(\{[^{}]*\})')
 
 class TextDirection(Enum):
     """Text direction enumeration."""
@@ -24,24 +38,213 @@ class LocaleMetadata:
     number_format: Dict[str, str]
     date_format: Dict[str, str]
     plural_rules: Dict[str, str]
+    collation: Dict[str, Any] = field(default_factory=dict)
+
+class Translator:
+    """
+    Immutable view of a LocaleManager bound to one resolved locale.
+    
+    Metadata, fallback catalogs and formatters are resolved once when the
+    translator is created, and compiled templates are cached per key, so
+    lookups skip locale resolution entirely. Translators keep serving the
+    catalogs they were bound to; LocaleManager.for_locale returns a fresh
+    translator after a catalog reload.
+    
+    Lookups are sampled by the manager's trace recorder but bypass its
+    render cache: the compiled templates are already cached per key, and
+    a translator outliving a reload would otherwise write results from
+    its old catalogs into the shared cache.
+    """
+    
+    __slots__ = ("manager", "locale", "metadata", "direction", "fallback_chain",
+                 "_catalogs", "_compiled", "_templates", "_number_formatter",
+                 "_date_formatters")
+    
+    def __init__(self, manager: "LocaleManager", locale: str):
+        """
+        Bind a translator to a locale.
+        
+        Args:
+            manager: Owning LocaleManager
+            locale: Locale code present in the manager's metadata
+        """
+        metadata = manager.metadata_cache[locale]
+        catalogs = []
+        for chain_locale in [locale] + metadata.fallback_chain:
+            try:
+                catalogs.append(manager._load_locale_translations(chain_locale))
+            except ValueError:
+                continue
+        bind = super().__setattr__
+        bind("manager", manager)
+        bind("locale", locale)
+        bind("metadata", metadata)
+        bind("direction", metadata.direction)
+        bind("fallback_chain", tuple(metadata.fallback_chain))
+        bind("_catalogs", tuple(catalogs))
+        compiled: Dict[str, Tuple[Optional[str], Any]] = {}
+        bind("_compiled", compiled)
+        bind("_templates", MappingProxyType(compiled))
+        bind("_number_formatter", manager._get_formatter("number", locale))
+        bind("_date_formatters", {})
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Translator is immutable")
+    
+    def _resolve(self, key: str) -> Tuple[Optional[str], Any]:
+        """Find the text for a key and compile it for this locale."""
+        for catalog in self._catalogs:
+            text = self.manager._get_nested_value(catalog, key)
+            if text:
+                try:
+                    compiled = self.manager._compile_template(text, self.locale)
+                except ValueError:
+                    compiled = None
+                break
+        else:
+            text = compiled = None
+        self._compiled[key] = (text, compiled)
+        return text, compiled
+    
+    def get_text(self, key: str, **kwargs) -> str:
+        """
+        Get translated text in the bound locale.
+        
+        Args:
+            key: Translation key
+            **kwargs: Format string parameters
+            
+        Returns:
+            str: Translated text
+        """
+        recorder = self.manager.trace_recorder
+        if recorder is not None and recorder.should_sample():
+            start = time.perf_counter_ns()
+            text = self._render(key, kwargs)
+            recorder.record("get_text", key, self.locale, kwargs,
+                            time.perf_counter_ns() - start)
+            return text
+        return self._render(key, kwargs)
+    
+    def _render(self, key: str, kwargs: Dict[str, Any]) -> str:
+        """Render a key from the compiled template cache."""
+        entry = self._templates.get(key)
+        text, compiled = entry if entry is not None else self._resolve(key)
+        if text is None:
+            return f"Missing translation: {key}"
+        if compiled is not None:
+            try:
+                return compiled.render(kwargs)
+            except (KeyError, TypeError, ValueError):
+                pass
+        # Log and fall back exactly as LocaleManager.get_text does
+        return self.manager._format_text(text, kwargs, self.locale)
+    
+    def format_number(self, number: float) -> str:
+        """
+        Format number according to the bound locale.
+        
+        Args:
+            number: Number to format
+            
+        Returns:
+            str: Formatted number
+        """
+        return self._number_formatter(number)
+    
+    def format_date(self, date_obj: Any, format_key: str = 'default') -> str:
+        """
+        Format date according to the bound locale.
+        
+        Args:
+            date_obj: Date object to format
+            format_key: Format style key
+            
+        Returns:
+            str: Formatted date
+        """
+        formatter = self._date_formatters.get(format_key)
+        if formatter is None:
+            formatter = self._date_formatters[format_key] = self.manager._get_formatter(
+                "date", self.locale, format_key
+            )
+        return formatter(date_obj)
+
+# Translator of the request being handled; set with use_translator()
+current_translator: ContextVar[Optional[Translator]] = ContextVar(
+    "current_translator", default=None
+)
+
+def get_translator() -> Translator:
+    """
+    Get the translator bound to the current context.
+    
+    Returns:
+        Translator: Current translator
+        
+    Raises:
+        LookupError: If no translator is active
+    """
+    translator = current_translator.get()
+    if translator is None:
+        raise LookupError("No translator is active in this context")
+    return translator
+
+@contextmanager
+def use_translator(translator: Translator) -> Iterator[Translator]:
+    """
+    Make a translator current for the duration of a block.
+    
+    Args:
+        translator: Translator to activate
+        
+    Yields:
+        Translator: The activated translator
+    """
+    token = current_translator.set(translator)
+    try:
+        yield translator
+    finally:
+        current_translator.reset(token)
 
 class LocaleManager:
     """Enhanced locale manager with support for RTL and Asian languages."""
     
-    def __init__(self, locale_dir: str, config: Dict):
+    def __init__(self, locale_dir: Union[str, Path, CatalogStore], config: Dict,
+                 render_cache: Optional[Any] = None,
+                 trace_recorder: Optional[Any] = None,
+                 stream_catalogs: bool = False):
         """
         Initialize enhanced locale manager.
         
         Args:
-            locale_dir: Directory containing locale files
+            locale_dir: Directory containing locale files, a zip/tar
+                bundle, or a CatalogStore
             config: Configuration dictionary with locale settings
+            render_cache: Optional RenderCache for parameterized lookups
+            trace_recorder: Optional TraceRecorder sampling get_text calls
+            stream_catalogs: Parse catalogs incrementally into flat
+                dotted-key indexes instead of nested dicts (lower peak
+                memory for very large catalogs)
         """
-        self.locale_dir = Path(locale_dir)
+        self.store = open_store(locale_dir)
+        self.locale_dir = getattr(self.store, "path", None)
         self.config = config
         self.default_locale = config.get("default_locale", "en")
         self.fallback_locale = config.get("fallback_locale", "en")
         self.cached_translations: Dict[str, Dict] = {}
         self.metadata_cache: Dict[str, LocaleMetadata] = {}
+        self.render_cache = render_cache
+        self.trace_recorder = trace_recorder
+        self.stream_catalogs = stream_catalogs
+        self._negotiation_cache: Dict[Any, Tuple[str, ...]] = {}
+        self._locale_lookup: Dict[str, str] = {}
+        self._template_cache: Dict[Tuple[str, str], Any] = {}
+        self._message_asts: Dict[str, Dict[str, MessageAST]] = {}
+        self._plural_selectors: Dict[str, PluralSelector] = {}
+        self._collators: Dict[str, Collator] = {}
+        self._bound_formatters: Dict[Tuple[str, str, Optional[str]], Formatter] = {}
+        self._translators: Dict[str, Translator] = {}
         self.logger = logging.getLogger(__name__)
         
         # Initialize locale data
@@ -50,11 +253,8 @@ class LocaleManager:
 
     def _init_locale_metadata(self) -> None:
         """Initialize locale metadata for all available locales."""
-        metadata_file = self.locale_dir / "metadata.json"
         try:
-            with open(metadata_file, 'r', encoding='utf-8') as f:
-                metadata_data = json.load(f)
-                
+            metadata_data = self.store.load_json(METADATA_FILE)
             for locale_code, meta in metadata_data.items():
                 self.metadata_cache[locale_code] = LocaleMetadata(
                     code=locale_code,
@@ -64,12 +264,43 @@ class LocaleManager:
                     fallback_chain=meta.get("fallback_chain", [self.fallback_locale]),
                     number_format=meta.get("number_format", {}),
                     date_format=meta.get("date_format", {}),
-                    plural_rules=meta.get("plural_rules", {})
+                    plural_rules=meta.get("plural_rules", {}),
+                    collation=meta.get("collation", {})
                 )
+            self._locale_lookup = {
+                self._normalize_tag(code): code for code in self.metadata_cache
+            }
+            self._negotiation_cache.clear()
         except Exception as e:
             self.logger.error(f"Error loading metadata: {e}")
             raise ValueError(f"Failed to initialize locale metadata: {e}")
 
+    def reload_metadata(self) -> None:
+        """
+        Re-read metadata.json and drop everything bound to the old metadata.
+        
+        Bound number/date formatters, compiled templates, plural selectors,
+        collators and translators are rebuilt on next use. The previous
+        metadata stays active if the new file is invalid.
+        
+        Raises:
+            ValueError: If the metadata cannot be loaded
+        """
+        previous = self.metadata_cache
+        self.metadata_cache = {}
+        try:
+            self._init_locale_metadata()
+        except ValueError:
+            self.metadata_cache = previous
+            raise
+        self._bound_formatters.clear()
+        self._template_cache.clear()
+        self._plural_selectors.clear()
+        self._collators.clear()
+        self._translators.clear()
+        if self.render_cache is not None:
+            self.render_cache.invalidate()
+
     def _load_required_translations(self) -> None:
         """Load translations for default and fallback locales."""
         required_locales = {self.default_locale, self.fallback_locale}
@@ -89,16 +320,142 @@ class LocaleManager:
         if locale in self.cached_translations:
             return self.cached_translations[locale]
             
-        locale_file = self.locale_dir / f"{locale}.json"
         try:
-            with open(locale_file, 'r', encoding='utf-8') as f:
-                translations = json.load(f)
-                self.cached_translations[locale] = translations
-                return translations
+            if self.stream_catalogs:
+                with self.store.open(f"{locale}.json") as f:
+                    translations = load_flat_catalog(f)
+            else:
+                translations = self.store.load_json(f"{locale}.json")
+            self._message_asts[locale] = self._index_messages(translations, locale)
+            self.cached_translations[locale] = translations
+            return translations
         except Exception as e:
             self.logger.error(f"Error loading translations for {locale}: {e}")
             raise ValueError(f"Failed to load translations for {locale}: {e}")
 
+    def _index_messages(self, data: Dict, locale: str,
+                        asts: Optional[Dict[str, MessageAST]] = None) -> Dict[str, MessageAST]:
+        """
+        Parse plural/select messages in a catalog into ASTs.
+        
+        ASTs are stored per locale, so they are dropped together with the
+        catalog they came from.
+        
+        Args:
+            data: Nested translation dictionary
+            locale: Locale the catalog belongs to (for logging)
+            asts: Index being filled (recursion)
+            
+        Returns:
+            Dict[str, MessageAST]: Message text to AST
+        """
+        asts = {} if asts is None else asts
+        for value in data.values():
+            if isinstance(value, dict):
+                self._index_messages(value, locale, asts)
+            elif isinstance(value, str) and value not in asts and is_message(value):
+                try:
+                    asts[value] = parse_message(value)
+                except ValueError as e:
+                    self.logger.warning(f"Invalid message in {locale}: {e}")
+        return asts
+
+    def reload_locale(self, locale: str) -> Dict:
+        """
+        Reload translations for a locale from its store.
+        
+        Cached renders for the locale are invalidated so stale text is
+        never served after the reload.
+        
+        Args:
+            locale: Locale code to reload
+            
+        Returns:
+            Dict: Reloaded translations
+        """
+        previous = self.cached_translations.pop(locale, None)
+        try:
+            translations = self._load_locale_translations(locale)
+        except ValueError:
+            if previous is not None:
+                self.cached_translations[locale] = previous
+            raise
+        self._template_cache.clear()
+        self._translators.clear()
+        if self.render_cache is not None:
+            # Other locales may fall back to this one, so drop everything
+            self.render_cache.invalidate()
+        return translations
+
+    def replace_catalog(self, locale: str, translations: Dict) -> None:
+        """
+        Swap in a new catalog for a locale without reading the store.
+
+        Lookups see either the old or the new catalog, never a mix.
+
+        Args:
+            locale: Locale code
+            translations: Complete nested translation dictionary
+        """
+        self._message_asts[locale] = self._index_messages(translations, locale)
+        self.cached_translations[locale] = translations
+        self._template_cache.clear()
+        self._translators.clear()
+        if self.render_cache is not None:
+            self.render_cache.invalidate()
+
+    def unload_locale(self, locale: str) -> bool:
+        """
+        Drop a locale's catalog and per-locale caches from memory.
+
+        The locale is loaded again on its next lookup.
+
+        Args:
+            locale: Locale code to unload
+
+        Returns:
+            bool: True if the catalog was loaded
+        """
+        loaded = self.cached_translations.pop(locale, None) is not None
+        self._message_asts.pop(locale, None)
+        self._plural_selectors.pop(locale, None)
+        self._collators.pop(locale, None)
+        self._translators.clear()
+        # Templates of other locales may have been compiled from this
+        # catalog's text through the fallback chain, so drop them all
+        self._template_cache.clear()
+        for cache_key in [k for k in self._bound_formatters if k[1] == locale]:
+            del self._bound_formatters[cache_key]
+        if self.render_cache is not None:
+            self.render_cache.invalidate(locale)
+        return loaded
+
+    def for_locale(self, locale: Optional[str] = None) -> Translator:
+        """
+        Get the cached translator bound to a locale.
+        
+        Unknown locales are negotiated once; the translator is shared by
+        every code that resolves to the same locale.
+        
+        Args:
+            locale: Requested locale (default locale if None)
+            
+        Returns:
+            Translator: Immutable translator for the resolved locale
+        """
+        locale = locale or self.default_locale
+        translator = self._translators.get(locale)
+        if translator is None:
+            resolved = locale if locale in self.metadata_cache else self.negotiate_locale(locale)
+            translator = self._translators.get(resolved)
+            if translator is None:
+                translator = Translator(self, resolved)
+            if len(self._translators) >= self.MAX_NEGOTIATION_CACHE:
+                self._translators.clear()
+            self._translators[resolved] = translator
+            self._translators[locale] = translator
+        return translator
+
     def get_text(self, key: str, locale: Optional[str] = None,
                  fallback_chain: Optional[List[str]] = None,
                  **kwargs) -> str:
@@ -114,10 +471,57 @@ class LocaleManager:
         Returns:
             str: Translated text
         """
+        recorder = self.trace_recorder
+        if recorder is not None and recorder.should_sample():
+            start = time.perf_counter_ns()
+            text = self._get_text(key, locale, fallback_chain, kwargs)
+            recorder.record("get_text", key, locale, kwargs,
+                            time.perf_counter_ns() - start)
+            return text
+        return self._get_text(key, locale, fallback_chain, kwargs)
+
+    def _get_text(self, key: str, locale: Optional[str],
+                  fallback_chain: Optional[List[str]],
+                  kwargs: Dict[str, Any]) -> str:
+        """Look up text through the render cache, resolving on a miss."""
         locale = locale or self.default_locale
+        cache_key = None
+        if self.render_cache is not None:
+            cache_key = self.render_cache.make_key(
+                "text", locale, key,
+                tuple(fallback_chain) if fallback_chain else None,
+                tuple(sorted(kwargs.items()))
+            )
+            if cache_key is not None:
+                cached = self.render_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+        
+        text = self._resolve_text(key, locale, fallback_chain, kwargs)
+        if cache_key is not None:
+            self.render_cache.put(cache_key, text)
+        return text
+
+    def _resolve_text(self, key: str, locale: str,
+                      fallback_chain: Optional[List[str]],
+                      params: Dict[str, Any]) -> str:
+        """
+        Resolve and format text through the fallback chain.
+        
+        Args:
+            key: Translation key
+            locale: Requested locale
+            fallback_chain: Optional custom fallback chain
+            params: Format string parameters
+            
+        Returns:
+            str: Translated text
+        """
         if locale not in self.metadata_cache:
-            self.logger.warning(f"Locale {locale} not found in metadata")
-            locale = self.default_locale
+            negotiated = self.negotiate_locale(locale)
+            if negotiated == self.default_locale:
+                self.logger.warning(f"Locale {locale} not found in metadata")
+            locale = negotiated
             
         # Use custom fallback chain or get from metadata
         fallback_chain = fallback_chain or self.metadata_cache[locale].fallback_chain
@@ -128,7 +532,7 @@ class LocaleManager:
                 translations = self._load_locale_translations(fallback_locale)
                 text = self._get_nested_value(translations, key)
                 if text:
-                    return self._format_text(text, kwargs, locale)
+                    return self._format_text(text, params, locale)
             except Exception as e:
                 self.logger.debug(f"Fallback to next locale due to: {e}")
                 continue
@@ -146,6 +550,8 @@ class LocaleManager:
         Returns:
             Optional[str]: Found value or None
         """
+        if isinstance(data, FlatCatalog):
+            return data.get(key)
         current = data
         for part in key.split('.'):
             if not isinstance(current, dict):
@@ -166,22 +572,101 @@ class LocaleManager:
         Returns:
             str: Formatted text
         """
-        # Get text direction
-        direction = self.metadata_cache[locale].direction
-        
-        # Handle RTL text if needed
-        if direction == TextDirection.RTL:
-            text = self._handle_rtl_text(text)
-            
-        # Format with parameters
+        # Format with parameters; untyped string values are isolated by
+        # the compiled template since their direction is unknown
         try:
-            return text.format(**params)
+            return self._compile_template(text, locale).render(params)
         except KeyError as e:
             self.logger.warning(f"Missing format parameter: {e}")
-            return text
         except ValueError as e:
             self.logger.warning(f"Invalid format string: {e}")
-            return text
+        except TypeError as e:
+            # e.g. a string or None passed where a number is formatted
+            self.logger.warning(f"Invalid format parameter: {e}")
+        
+        # Handle RTL text if needed
+        if self.metadata_cache[locale].direction == TextDirection.RTL:
+            text = self._handle_rtl_text(text)
+        return text
+
+    def _compile_template(self, text: str,
+                          locale: str) -> Union[CompiledTemplate, CompiledMessage]:
+        """
+        Get the compiled template for text rendered in a locale.
+        
+        Typed placeholders ({count:number}, {when:date:long}) are bound to
+        the locale's formatters once, when the template is first used.
+        Plural/select messages are compiled from the AST parsed at load.
+        
+        Args:
+            text: Template text
+            locale: Locale the template is rendered for
+            
+        Returns:
+            Union[CompiledTemplate, CompiledMessage]: Cached compiled template
+            
+        Raises:
+            ValueError: If the template is malformed
+        """
+        cache_key = (locale, text)
+        compiled = self._template_cache.get(cache_key)
+        if compiled is None:
+            is_rtl = self.metadata_cache[locale].direction == TextDirection.RTL
+            factories = {
+                "": lambda style: self._get_formatter("text", locale, style),
+                "number": lambda style: self._get_formatter("number", locale, style),
+                "date": lambda style: self._get_formatter("date", locale, style)
+            }
+            # Text may come from a fallback locale's catalog
+            ast = next((asts[text] for asts in self._message_asts.values() if text in asts), None)
+            if ast is not None:
+                compiled = compile_message(
+                    text, ast, factories, self._get_plural_selector(locale),
+                    mark="\u200F" if is_rtl else ""
+                )
+            else:
+                if is_rtl:
+                    text = self._handle_rtl_text(text)
+                compiled = compile_template(text, factories)
+            self._template_cache[cache_key] = compiled
+        return compiled
+
+    def _get_plural_selector(self, locale: str) -> PluralSelector:
+        """
+        Get the compiled plural category selector for a locale.
+        
+        Args:
+            locale: Locale code
+            
+        Returns:
+            PluralSelector: Function mapping a number to its plural category
+        """
+        selector = self._plural_selectors.get(locale)
+        if selector is None:
+            rules = self.get_locale_info(locale).plural_rules
+            try:
+                selector = compile_plural_rules(rules)
+            except ValueError as e:
+                self.logger.error(f"Invalid plural rules for {locale}: {e}")
+                selector = lambda number: "other"
+            self._plural_selectors[locale] = selector
+        return selector
+
+    def get_plural_category(self, number: float, locale: str) -> str:
+        """
+        Get the plural category of a number in a locale.
+        
+        Args:
+            number: Number to classify
+            locale: Target locale
+            
+        Returns:
+            str: Plural category (e.g. "one", "few", "other")
+            
+        Raises:
+            ValueError: If locale not found
+        """
+        return self._get_plural_selector(locale)(number)
 
     def _handle_rtl_text(self, text: str) -> str:
         """
@@ -193,8 +678,9 @@ class LocaleManager:
         Returns:
             str: Formatted RTL text
         """
-        # Add RTL marks and handle mixed content
-        if self._has_mixed_content(text):
+        # Add RTL marks and handle mixed content; placeholders are left
+        # intact since substituted values carry their own isolates
+        if self._has_mixed_content(FORMAT_FIELD_PATTERN.sub('', text)):
             return self._format_mixed_direction_text(text)
         return f"\u200F{text}\u200F"  # RLM marks
 
@@ -208,9 +694,7 @@ class LocaleManager:
         Returns:
             bool: True if mixed content
         """
-        has_rtl = bool(re.search(r'[\u0591-\u07FF\uFB1D-\uFDFD\uFE70-\uFEFC]', text))
-        has_ltr = bool(re.search(r'[A-Za-z]', text))
-        return has_rtl and has_ltr
+        return has_mixed_direction(text)
 
     def _format_mixed_direction_text(self, text: str) -> str:
         """
@@ -222,38 +706,121 @@ class LocaleManager:
         Returns:
             str: Properly formatted text
         """
-        # Split into RTL and LTR segments and format each appropriately
+        # Split literal text into RTL and LTR segments, keeping fields whole
         segments = []
-        current_segment = []
-        current_direction = None
-        
-        for char in text:
-            char_direction = unicodedata.bidirectional(char)
-            if char_direction in ('R', 'AL'):
-                if current_direction == 'LTR':
-                    segments.append(('LTR', ''.join(current_segment)))
-                    current_segment = []
-                current_direction = 'RTL'
-            elif char_direction == 'L':
-                if current_direction == 'RTL':
-                    segments.append(('RTL', ''.join(current_segment)))
-                    current_segment = []
-                current_direction = 'LTR'
-            current_segment.append(char)
-            
-        if current_segment:
-            segments.append((current_direction, ''.join(current_segment)))
-            
+        for index, part in enumerate(FORMAT_FIELD_PATTERN.split(text)):
+            if index % 2:
+                segments.append((None, part))
+            elif part:
+                segments.extend(direction_runs(part))
+        
         # Format each segment with appropriate directional marks
         formatted_segments = []
         for direction, segment in segments:
-            if direction == 'RTL':
-                formatted_segments.append(f"\u200F{segment}\u200F")
-            else:
-                formatted_segments.append(f"\u200E{segment}\u200E")
+            if direction is None:
+                formatted_segments.append(segment)
+                continue
+            mark = "\u200F" if direction == TextDirection.RTL.value else "\u200E"
+            formatted_segments.append(f"{mark}{segment}{mark}")
                 
         return ''.join(formatted_segments)
 
+    MAX_NEGOTIATION_CACHE = 4096
+
+    @staticmethod
+    def _normalize_tag(tag: str) -> str:
+        """Normalize a language tag for case-insensitive matching."""
+        return tag.strip().replace('_', '-').lower()
+
+    @staticmethod
+    def parse_accept_language(header: str) -> List[str]:
+        """
+        Parse an Accept-Language header into tags ordered by preference.
+        
+        Args:
+            header: Header value, e.g. "es-MX,es;q=0.9,en;q=0.5"
+            
+        Returns:
+            List[str]: Language tags, highest quality first (q=0 dropped)
+        """
+        weighted = []
+        for position, item in enumerate(header.split(',')):
+            tag, _, params = item.strip().partition(';')
+            tag = tag.strip()
+            if not tag or tag == '*':
+                continue
+            quality = 1.0
+            params = params.strip()
+            if params.startswith('q='):
+                try:
+                    quality = float(params[2:])
+                except ValueError:
+                    continue
+            if quality > 0:
+                weighted.append((-quality, position, tag))
+        return [tag for _, _, tag in sorted(weighted)]
+
+    def negotiate(self, preferences: Union[str, Sequence[str]]) -> Tuple[str, ...]:
+        """
+        Resolve preferred languages to an ordered chain of available locales.
+        
+        Each preference is matched exactly, then by truncating subtags
+        (es-MX -> es). The best match's fallback chain and the default
+        locale are appended. Results are memoized per preference value.
+        
+        Args:
+            preferences: Accept-Language header or sequence of language tags
+            
+        Returns:
+            Tuple[str, ...]: Available locales in resolution order
+        """
+        cache_key = preferences if isinstance(preferences, str) else tuple(preferences)
+        cached = self._negotiation_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        if isinstance(preferences, str):
+            tags = self.parse_accept_language(preferences)
+        else:
+            tags = list(preferences)
+        
+        resolved: List[str] = []
+        for tag in tags:
+            parts = self._normalize_tag(tag).split('-')
+            while parts:
+                code = self._locale_lookup.get('-'.join(parts))
+                if code is not None:
+                    if code not in resolved:
+                        resolved.append(code)
+                    break
+                parts.pop()
+        
+        if resolved:
+            tail = self.metadata_cache[resolved[0]].fallback_chain
+        else:
+            tail = []
+        for code in [*tail, self.default_locale]:
+            if code not in resolved:
+                resolved.append(code)
+        
+        result = tuple(resolved)
+        if len(self._negotiation_cache) >= self.MAX_NEGOTIATION_CACHE:
+            self._negotiation_cache.clear()
+        self._negotiation_cache[cache_key] = result
+        return result
+
+    def negotiate_locale(self, preferences: Union[str, Sequence[str]]) -> str:
+        """
+        Get the best available locale for the given preferences.
+        
+        Args:
+            preferences: Accept-Language header or sequence of language tags
+            
+        Returns:
+            str: Best matching locale, or the default locale
+        """
+        return self.negotiate(preferences)[0]
+
     def get_locale_info(self, locale: str) -> LocaleMetadata:
         """
         Get locale metadata.
@@ -271,6 +838,132 @@ class LocaleManager:
             raise ValueError(f"Locale {locale} not found")
         return self.metadata_cache[locale]
 
+    def _get_formatter(self, kind: str, locale: str,
+                       style: Optional[str] = None) -> Formatter:
+        """
+        Get a formatter bound to a locale's number or date conventions.
+        
+        Args:
+            kind: "text", "number" or "date"
+            locale: Target locale
+            style: Optional style; for numbers "integer" or a count of
+                decimal places, for dates a date_format key
+            
+        Returns:
+            Formatter: Cached formatter
+            
+        Raises:
+            ValueError: If locale not found
+        """
+        cache_key = (kind, locale, style)
+        formatter = self._bound_formatters.get(cache_key)
+        if formatter is None:
+            if kind == "text":
+                formatter = self._bind_text_formatter(locale)
+            elif kind == "number":
+                formatter = self._bind_number_formatter(locale, style)
+            else:
+                formatter = self._bind_date_formatter(locale, style)
+            self._bound_formatters[cache_key] = formatter
+        return formatter
+
+    def _bind_text_formatter(self, locale: str) -> Formatter:
+        """Build a formatter isolating string values for a locale's direction."""
+        context = self.get_locale_info(locale).direction.value
+        
+        def format_text_value(value: Any) -> str:
+            if isinstance(value, str):
+                return isolate(value, context)
+            return format(value)
+        return format_text_value
+
+    def _bind_number_formatter(self, locale: str, style: Optional[str]) -> Formatter:
+        """Build a number formatter for a locale's separators and digits."""
+        format_info = self.get_locale_info(locale).number_format
+        if style == "integer":
+            decimal_places = 0
+        elif style and style.isdigit():
+            decimal_places = int(style)
+        else:
+            decimal_places = format_info.get('decimal_places', 2)
+        
+        # Swap separators in one pass so e.g. "." thousands and "," decimals
+        # don't overwrite each other
+        mapping = {
+            ',': format_info.get('thousand_sep', ','),
+            '.': format_info.get('decimal_sep', '.')
+        }
+        digits = format_info.get('digits')
+        if digits and len(digits) == 10:
+            mapping.update(zip("0123456789", digits))
+        table = str.maketrans(mapping)
+        spec = f",.{decimal_places}f"
+        return lambda number: format(number, spec).translate(table)
+
+    def _bind_date_formatter(self, locale: str, style: Optional[str]) -> Formatter:
+        """Build a date formatter for one of a locale's date formats."""
+        date_formats = self.get_locale_info(locale).date_format
+        date_format = date_formats.get(style or 'default', date_formats.get('default'))
+        
+        def format_date_value(date_obj: Any) -> str:
+            try:
+                return date_obj.strftime(date_format)
+            except Exception as e:
+                self.logger.error(f"Date formatting error: {e}")
+                return str(date_obj)
+        return format_date_value
+
+    def get_collator(self, locale: str) -> Collator:
+        """
+        Get the cached collator for a locale.
+        
+        Tailorings come from the locale's "collation" metadata, falling
+        back to the built-in defaults for the language.
+        
+        Args:
+            locale: Locale code (negotiated if not available)
+            
+        Returns:
+            Collator: Locale collator
+        """
+        # Keyed by the resolved locale so arbitrary requested codes share
+        # one collator per available locale
+        resolved = locale if locale in self.metadata_cache else self.negotiate_locale(locale)
+        collator = self._collators.get(resolved)
+        if collator is None:
+            tailoring = self.metadata_cache[resolved].collation.get("tailoring")
+            collator = Collator(resolved, tailoring)
+            self._collators[resolved] = collator
+        return collator
+
+    def sort_key(self, name: str, locale: str) -> SortKey:
+        """
+        Get a locale-aware sort key for a name.
+        
+        Args:
+            name: Name to sort
+            locale: Target locale
+            
+        Returns:
+            SortKey: Memoized sort key
+        """
+        return self.get_collator(locale).sort_key(name)
+
+    def sorted_names(self, names: Iterable[str], locale: str,
+                     reverse: bool = False) -> List[str]:
+        """
+        Sort names using a locale's collation order.
+        
+        Args:
+            names: Names to sort
+            locale: Target locale
+            reverse: Sort descending
+            
+        Returns:
+            List[str]: Sorted names
+        """
+        return self.get_collator(locale).sorted(names, reverse=reverse)
+
     def format_number(self, number: float, locale: str) -> str:
         """
         Format number according to locale conventions.
@@ -282,17 +975,7 @@ class LocaleManager:
         Returns:
             str: Formatted number
         """
-        locale_info = self.get_locale_info(locale)
-        format_info = locale_info.number_format
-        
-        # Convert to string with proper decimal places
-        str_num = f"{number:,.{format_info.get('decimal_places', 2)}f}"
-        
-        # Replace decimal and thousand separators
-        str_num = str_num.replace(',', format_info.get('thousand_sep', ','))
-        str_num = str_num.replace('.', format_info.get('decimal_sep', '.'))
-        
-        return str_num
+        return self._get_formatter("number", locale)(number)
 
     def format_date(self, date_obj: Any, locale: str,
                    format_key: str = 'default') -> str:
@@ -307,12 +990,4 @@ class LocaleManager:
         Returns:
             str: Formatted date
         """
-        locale_info = self.get_locale_info(locale)
-        date_formats = locale_info.date_format
-        date_format = date_formats.get(format_key, date_formats.get('default'))
-        
-        try:
-            return date_obj.strftime(date_format)
-        except Exception as e:
-            self.logger.error(f"Date formatting error: {e}")
-            return str(date_obj)
\ No newline at end of file
+        return self._get_formatter("date", locale, format_key)(date_obj)
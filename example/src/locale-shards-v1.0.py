@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Locale Shards v1.0
+Locale-sharded rendering across worker processes.
+
+Each shard is a worker process with its own LocaleManager that only loads
+the locales it owns (plus their fallback locales on demand), so memory per
+process stays bounded as locales are added. A ShardRouter in the calling
+process assigns locales to shards, splits render/format batches by owning
+shard, sends every sub-batch over a pipe before collecting any result (so
+shards work in parallel), and reassembles results in request order.
+
+Locales are assigned by catalog size initially and rebalanced from the
+observed per-shard load; a moved locale is unloaded from its old shard.
+"""
+
+import logging
+import multiprocessing
+import resource
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from catalog_store_v1_0 import CatalogStore, open_store
+
+# (key, locale, params) as passed to LocaleManager.get_text
+RenderRequest = Tuple[str, Optional[str], Mapping[str, Any]]
+
+@dataclass
+class ShardLoad:
+    """Load reported by a shard process."""
+    shard: int
+    locales: List[str] = field(default_factory=list)
+    loaded_locales: List[str] = field(default_factory=list)
+    batches: int = 0
+    items: int = 0
+    busy_seconds: float = 0.0
+    max_rss_kb: int = 0
+
+def _shard_main(conn: Any, locale_dir: Union[str, CatalogStore],
+                config: Dict[str, Any]) -> None:
+    """
+    Shard worker loop: serve commands received on a pipe until "stop".
+
+    Commands are (name, payload) tuples; every command gets one reply of
+    ("ok", result) or ("error", message).
+    """
+    from locale_manager_v1_5 import LocaleManager
+    manager = LocaleManager(locale_dir, config)
+    owned: List[str] = []
+    batches = items = 0
+    busy = 0.0
+    while True:
+        command, payload = conn.recv()
+        if command == "stop":
+            conn.send(("ok", None))
+            break
+        start = time.perf_counter()
+        try:
+            if command == "render":
+                result = [manager.get_text(key, locale=locale, **params)
+                          for key, locale, params in payload]
+            elif command == "format":
+                kind, locale, values = payload
+                formatter = manager.format_number if kind == "number" else manager.format_date
+                result = [formatter(value, locale) for value in values]
+            elif command == "assign":
+                dropped = [locale for locale in owned if locale not in payload]
+                for locale in dropped:
+                    manager.unload_locale(locale)
+                owned = list(payload)
+                result = dropped
+            elif command == "load":
+                result = ShardLoad(
+                    shard=payload,
+                    locales=list(owned),
+                    loaded_locales=sorted(manager.cached_translations),
+                    batches=batches,
+                    items=items,
+                    busy_seconds=busy,
+                    max_rss_kb=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                )
+            else:
+                raise ValueError(f"Unknown shard command: {command}")
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+            continue
+        if command in ("render", "format"):
+            batches += 1
+            items += len(result)
+            busy += time.perf_counter() - start
+        conn.send(("ok", result))
+    conn.close()
+
+def assign_locales(weights: Mapping[str, float], shard_count: int) -> Dict[str, int]:
+    """
+    Assign locales to shards, balancing total weight.
+
+    Greedy longest-processing-time assignment: heaviest locale first, each
+    to the currently lightest shard.
+
+    Args:
+        weights: Per-locale weight (catalog size, observed load, ...)
+        shard_count: Number of shards
+
+    Returns:
+        Dict[str, int]: Locale to shard index
+    """
+    totals = [0.0] * shard_count
+    assignment = {}
+    for locale in sorted(weights, key=lambda l: (-weights[l], l)):
+        shard = min(range(shard_count), key=totals.__getitem__)
+        assignment[locale] = shard
+        totals[shard] += weights[locale]
+    return assignment
+
+class ShardRouter:
+    """Routes render/format batches to locale-owning shard processes."""
+
+    def __init__(self, locale_dir: Union[str, Path, CatalogStore], config: Dict[str, Any],
+                 shard_count: int = 2,
+                 assignment: Optional[Mapping[str, int]] = None):
+        """
+        Start shard processes.
+
+        Args:
+            locale_dir: Directory containing locale files, a zip/tar
+                bundle, or a CatalogStore
+            config: Configuration dictionary with locale settings
+            shard_count: Number of worker processes
+            assignment: Optional fixed locale to shard mapping; by default
+                locales are balanced by catalog file size
+
+        Raises:
+            ValueError: If shard_count is not positive
+        """
+        if shard_count <= 0:
+            raise ValueError("Shard count must be positive")
+        # Paths are reopened by each shard; store objects are handed over
+        self.source = locale_dir if isinstance(locale_dir, CatalogStore) else str(locale_dir)
+        self.store = open_store(self.source)
+        self.config = dict(config)
+        self.default_locale = self.config.get("default_locale", "en")
+        self.shard_count = shard_count
+        self.logger = logging.getLogger(__name__)
+        self._routed: Dict[str, int] = {}
+        self._connections = []
+        self._processes = []
+        for _ in range(shard_count):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_shard_main, args=(child, self.source, self.config),
+                daemon=True
+            )
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+        self.assignment: Dict[str, int] = {}
+        self._apply_assignment(dict(assignment) if assignment is not None
+                               else assign_locales(self._catalog_sizes(), shard_count))
+
+    def _catalog_sizes(self) -> Dict[str, float]:
+        """Catalog size in bytes per locale."""
+        return {
+            locale: float(self.store.size(f"{locale}.json"))
+            for locale in self.store.locales()
+        }
+
+    def _call_all(self, commands: Mapping[int, Tuple[str, Any]]) -> Dict[int, Any]:
+        """Send commands to several shards, then collect every reply."""
+        for shard, command in commands.items():
+            self._connections[shard].send(command)
+        results = {}
+        errors = []
+        for shard in commands:
+            status, result = self._connections[shard].recv()
+            if status == "error":
+                errors.append(f"shard {shard}: {result}")
+            results[shard] = result
+        if errors:
+            raise ValueError("; ".join(errors))
+        return results
+
+    def _apply_assignment(self, assignment: Dict[str, int]) -> List[str]:
+        """Send each shard its owned locales; returns the moved locales."""
+        moved = [locale for locale, shard in assignment.items()
+                 if self.assignment.get(locale, shard) != shard]
+        owned: Dict[int, List[str]] = {shard: [] for shard in range(self.shard_count)}
+        for locale, shard in assignment.items():
+            owned[shard].append(locale)
+        self._call_all({shard: ("assign", sorted(locales)) for shard, locales in owned.items()})
+        self.assignment = assignment
+        self._routed.clear()
+        return moved
+
+    def shard_for(self, locale: Optional[str]) -> int:
+        """
+        Get the shard owning a locale.
+
+        Regional variants without their own catalog ("es-MX") go to the
+        shard of their base language; unknown locales to the default
+        locale's shard.
+
+        Args:
+            locale: Requested locale
+
+        Returns:
+            int: Shard index
+        """
+        locale = locale or self.default_locale
+        shard = self.assignment.get(locale)
+        if shard is None:
+            shard = self._routed.get(locale)
+            if shard is None:
+                base = locale.replace('_', '-').split('-')[0].lower()
+                shard = self.assignment.get(base, self.assignment.get(self.default_locale, 0))
+                self._routed[locale] = shard
+        return shard
+
+    def render_batch(self, requests: Sequence[RenderRequest]) -> List[str]:
+        """
+        Render a batch of lookups on their owning shards.
+
+        Args:
+            requests: (key, locale, params) tuples
+
+        Returns:
+            List[str]: Rendered texts in request order
+
+        Raises:
+            ValueError: If a shard fails
+        """
+        positions: Dict[int, List[int]] = {}
+        batches: Dict[int, List[RenderRequest]] = {}
+        for index, (key, locale, params) in enumerate(requests):
+            shard = self.shard_for(locale)
+            positions.setdefault(shard, []).append(index)
+            batches.setdefault(shard, []).append((key, locale, dict(params)))
+        results = self._call_all({shard: ("render", batch) for shard, batch in batches.items()})
+        texts: List[str] = [""] * len(requests)
+        for shard, indexes in positions.items():
+            for index, text in zip(indexes, results[shard]):
+                texts[index] = text
+        return texts
+
+    def format_batch(self, kind: str, values: Sequence[Any], locale: str) -> List[str]:
+        """
+        Format numbers or dates on the shard owning a locale.
+
+        Args:
+            kind: "number" or "date"
+            values: Values to format
+            locale: Target locale
+
+        Returns:
+            List[str]: Formatted values
+
+        Raises:
+            ValueError: If kind is unknown or the shard fails
+        """
+        if kind not in ("number", "date"):
+            raise ValueError(f"Unknown format kind: {kind}")
+        shard = self.shard_for(locale)
+        return self._call_all({shard: ("format", (kind, locale, list(values)))})[shard]
+
+    def load(self) -> List[ShardLoad]:
+        """
+        Get the current load of every shard.
+
+        Returns:
+            List[ShardLoad]: One entry per shard
+        """
+        results = self._call_all({shard: ("load", shard) for shard in range(self.shard_count)})
+        return [results[shard] for shard in range(self.shard_count)]
+
+    def rebalance(self, locale_load: Optional[Mapping[str, float]] = None) -> List[str]:
+        """
+        Reassign locales to even out load.
+
+        Args:
+            locale_load: Per-locale weight; by default each shard's busy
+                time is split across its locales in proportion to catalog
+                size (plain catalog size before any load is observed)
+
+        Returns:
+            List[str]: Locales that moved to another shard
+        """
+        if locale_load is None:
+            sizes = self._catalog_sizes()
+            loads = self.load()
+            locale_load = dict(sizes)
+            if any(shard_load.busy_seconds for shard_load in loads):
+                for shard_load in loads:
+                    owned_size = sum(sizes.get(l, 0.0) for l in shard_load.locales) or 1.0
+                    for locale in shard_load.locales:
+                        share = sizes.get(locale, 0.0) / owned_size
+                        locale_load[locale] = share * shard_load.busy_seconds
+        moved = self._apply_assignment(assign_locales(locale_load, self.shard_count))
+        if moved:
+            self.logger.info(f"Rebalanced locales: {', '.join(sorted(moved))}")
+        return moved
+
+    def close(self) -> None:
+        """Stop all shard processes."""
+        for connection, process in zip(self._connections, self._processes):
+            if process.is_alive():
+                try:
+                    connection.send(("stop", None))
+                    connection.recv()
+                except (EOFError, OSError):
+                    pass
+            connection.close()
+            process.join(timeout=5)
+        self._connections.clear()
+        self._processes.clear()
+
+    def __enter__(self) -> "ShardRouter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
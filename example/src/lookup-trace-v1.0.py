@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Lookup Trace v1.0
+Sampled recording of production LocaleManager.get_text and
+GreetingGenerator.create_greeting calls into a compact binary trace, and
+a replay load generator reporting latency percentiles and throughput.
+
+Trace format (little endian):
+- Header: magic b"LCTR", u8 format version
+- String definition: u8 0xFF, u32 id, u16 length, UTF-8 bytes
+- Call record: u8 kind, f64 seconds since start, u32 duration (ns),
+  u32 key id, u32 locale id, u32 parameter-shape id
+
+Keys, locales and parameter shapes are interned, so a record is 25 bytes.
+Parameter values are never stored: a shape keeps each parameter's name and
+type (and string length), e.g. "name:str:5,count:int".
+"""
+
+import argparse
+import datetime
+import itertools
+import struct
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional
+
+MAGIC = b"LCTR"
+FORMAT_VERSION = 1
+STRING_TAG = 0xFF
+
+KIND_GET_TEXT = 0
+KIND_GREETING = 1
+KIND_NAMES = {"get_text": KIND_GET_TEXT, "greeting": KIND_GREETING}
+
+_RECORD = struct.Struct("<BdIIII")
+_STRING = struct.Struct("<BIH")
+_MAX_DURATION_NS = 0xFFFFFFFF
+
+def params_shape(params: Mapping[str, Any]) -> str:
+    """
+    Describe parameters without their values.
+
+    Args:
+        params: Call parameters
+
+    Returns:
+        str: Comma-separated name:type[:length] entries
+    """
+    parts = []
+    for name in sorted(params):
+        value = params[name]
+        if isinstance(value, str):
+            parts.append(f"{name}:str:{len(value)}")
+        else:
+            parts.append(f"{name}:{type(value).__name__}")
+    return ",".join(parts)
+
+def params_from_shape(shape: str) -> Dict[str, Any]:
+    """
+    Build placeholder parameters matching a recorded shape.
+
+    Args:
+        shape: Output of params_shape
+
+    Returns:
+        Dict[str, Any]: Synthetic parameters of the recorded types
+    """
+    params: Dict[str, Any] = {}
+    for entry in filter(None, shape.split(",")):
+        name, type_name, *rest = entry.split(":")
+        if type_name == "str":
+            params[name] = "x" * int(rest[0]) if rest else "x"
+        elif type_name == "int":
+            params[name] = 1
+        elif type_name == "float":
+            params[name] = 1.5
+        elif type_name in ("date", "datetime"):
+            params[name] = datetime.datetime.now()
+        else:
+            params[name] = ""
+    return params
+
+@dataclass
+class TraceRecord:
+    """A single sampled call."""
+    kind: str
+    timestamp: float
+    duration_ns: int
+    key: str
+    locale: str
+    shape: str
+
+class TraceRecorder:
+    """Samples calls into a binary trace file with bounded overhead."""
+
+    def __init__(self, path: str, sample_rate: float = 0.01,
+                 max_records: int = 1_000_000, buffer_bytes: int = 64 * 1024):
+        """
+        Initialize trace recorder.
+
+        Args:
+            path: Trace file to write
+            sample_rate: Fraction of calls recorded (every Nth call)
+            max_records: Recording stops after this many records
+            buffer_bytes: Records are written in chunks of this size
+
+        Raises:
+            ValueError: If sample_rate is not in (0, 1]
+        """
+        if not 0 < sample_rate <= 1:
+            raise ValueError("Sample rate must be in (0, 1]")
+        self.path = path
+        self.max_records = max_records
+        self.buffer_bytes = buffer_bytes
+        self.records = 0
+        self._interval = max(1, round(1 / sample_rate))
+        # next() on itertools.count is atomic under the GIL, so sampling
+        # needs no lock; only record() serializes writers
+        self._calls = itertools.count(1)
+        self._strings: Dict[str, int] = {}
+        self._buffer = bytearray(MAGIC + bytes([FORMAT_VERSION]))
+        self._start = time.monotonic()
+        self._lock = threading.Lock()
+        self._file = open(path, 'wb')
+        self.active = True
+
+    def should_sample(self) -> bool:
+        """
+        Decide whether to record the current call.
+
+        Returns:
+            bool: True for every Nth call while recording is active
+        """
+        return self.active and next(self._calls) % self._interval == 0
+
+    def _intern(self, value: str) -> int:
+        """Get the id of a string, writing its definition on first use."""
+        string_id = self._strings.get(value)
+        if string_id is None:
+            string_id = self._strings[value] = len(self._strings)
+            encoded = value.encode('utf-8')
+            if len(encoded) > 0xFFFF:
+                # Cut on a character boundary so the string still decodes
+                encoded = encoded[:0xFFFF].decode('utf-8', 'ignore').encode('utf-8')
+            self._buffer += _STRING.pack(STRING_TAG, string_id, len(encoded))
+            self._buffer += encoded
+        return string_id
+
+    def record(self, kind: str, key: str, locale: Optional[str],
+               params: Mapping[str, Any], duration_ns: int) -> None:
+        """
+        Append a sampled call to the trace.
+
+        Args:
+            kind: "get_text" or "greeting"
+            key: Translation key, or greeting style
+            locale: Requested locale
+            params: Call parameters (only their shape is stored)
+            duration_ns: Call duration in nanoseconds
+        """
+        with self._lock:
+            if not self.active:
+                return
+            self._buffer += _RECORD.pack(
+                KIND_NAMES[kind],
+                time.monotonic() - self._start,
+                min(duration_ns, _MAX_DURATION_NS),
+                self._intern(key),
+                self._intern(locale or ""),
+                self._intern(params_shape(params))
+            )
+            self.records += 1
+            if len(self._buffer) >= self.buffer_bytes:
+                self._flush()
+            if self.records >= self.max_records:
+                self._close()
+
+    def _flush(self) -> None:
+        self._file.write(self._buffer)
+        self._buffer.clear()
+
+    def _close(self) -> None:
+        self._flush()
+        self._file.close()
+        self.active = False
+
+    def close(self) -> None:
+        """Flush buffered records and close the trace file."""
+        with self._lock:
+            if self.active:
+                self._close()
+
+    def __enter__(self) -> "TraceRecorder":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+def read_trace(path: str, chunk_size: int = 64 * 1024) -> Iterator[TraceRecord]:
+    """
+    Read records from a trace file, one chunk at a time.
+
+    Args:
+        path: Trace file
+        chunk_size: Bytes read per chunk
+
+    Yields:
+        TraceRecord: Recorded calls in order
+
+    Raises:
+        ValueError: If the file is not a supported trace or ends mid-entry
+    """
+    kinds = {value: name for name, value in KIND_NAMES.items()}
+    strings: Dict[int, str] = {}
+    with open(path, 'rb') as f:
+        header = f.read(5)
+        if header[:4] != MAGIC or len(header) < 5 or header[4] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported trace file: {path}")
+        data = b""
+        offset = 0
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            # Carry over the incomplete entry at the end of the previous chunk
+            data = data[offset:] + chunk
+            offset = 0
+            end = len(data)
+            while offset < end:
+                if data[offset] == STRING_TAG:
+                    if offset + _STRING.size > end:
+                        break
+                    _, string_id, length = _STRING.unpack_from(data, offset)
+                    start = offset + _STRING.size
+                    if start + length > end:
+                        break
+                    strings[string_id] = data[start:start + length].decode('utf-8')
+                    offset = start + length
+                    continue
+                if offset + _RECORD.size > end:
+                    break
+                kind, timestamp, duration, key_id, locale_id, shape_id = \
+                    _RECORD.unpack_from(data, offset)
+                offset += _RECORD.size
+                yield TraceRecord(kinds[kind], timestamp, duration,
+                                  strings[key_id], strings[locale_id], strings[shape_id])
+        if offset < len(data):
+            raise ValueError(f"Truncated trace file: {path}")
+
+@dataclass
+class ReplayReport:
+    """Latency and throughput of a replay run."""
+    calls: int
+    elapsed: float
+    p50_us: float
+    p99_us: float
+    max_us: float
+
+    @property
+    def throughput(self) -> float:
+        """Calls per second."""
+        return self.calls / self.elapsed if self.elapsed else 0.0
+
+def _percentile(sorted_values: List[int], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index] / 1000
+
+def replay(records: List[TraceRecord], locale_manager: Any,
+           generator: Optional[Any] = None, real_time: bool = False,
+           speed: float = 1.0) -> ReplayReport:
+    """
+    Drive a LocaleManager (and optional GreetingGenerator) through a trace.
+
+    Args:
+        records: Trace records to replay
+        locale_manager: LocaleManager under test
+        generator: GreetingGenerator for greeting records (skipped if None)
+        real_time: Reproduce the recorded pacing instead of running flat out
+        speed: Pacing multiplier when real_time is set
+
+    Returns:
+        ReplayReport: Latency percentiles and throughput
+    """
+    calls: List[Callable[[], Any]] = []
+    offsets: List[float] = []
+    for record in records:
+        params = params_from_shape(record.shape)
+        locale = record.locale or None
+        if record.kind == "get_text":
+            calls.append(lambda r=record, p=params, l=locale:
+                         locale_manager.get_text(r.key, locale=l, **p))
+        elif generator is not None:
+            name = params.get("name", "x")
+            calls.append(lambda r=record, n=name, l=locale:
+                         generator.create_greeting(n, style=r.key or None, locale=l))
+        else:
+            continue
+        offsets.append(record.timestamp)
+
+    durations = []
+    base = offsets[0] if offsets else 0.0
+    start = time.perf_counter()
+    for call, offset in zip(calls, offsets):
+        if real_time:
+            delay = (offset - base) / speed - (time.perf_counter() - start)
+            if delay > 0:
+                time.sleep(delay)
+        call_start = time.perf_counter_ns()
+        call()
+        durations.append(time.perf_counter_ns() - call_start)
+    elapsed = time.perf_counter() - start
+
+    durations.sort()
+    return ReplayReport(
+        calls=len(durations),
+        elapsed=elapsed,
+        p50_us=_percentile(durations, 0.50),
+        p99_us=_percentile(durations, 0.99),
+        max_us=durations[-1] / 1000 if durations else 0.0
+    )
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point.
+
+    Args:
+        argv: Optional argument list
+
+    Returns:
+        int: Exit status
+    """
+    parser = argparse.ArgumentParser(description="Summarize or replay lookup traces")
+    commands = parser.add_subparsers(dest="command", required=True)
+    summary = commands.add_parser("summary", help="Show key/locale distribution")
+    summary.add_argument("trace")
+    summary.add_argument("--top", type=int, default=10)
+    run = commands.add_parser("replay", help="Replay against a catalog")
+    run.add_argument("trace")
+    run.add_argument("-l", "--locales", required=True, help="Locale directory")
+    run.add_argument("--real-time", action="store_true", help="Reproduce recorded pacing")
+    run.add_argument("--speed", type=float, default=1.0, help="Pacing multiplier")
+    run.add_argument("--repeat", type=int, default=1, help="Replay the trace N times")
+    args = parser.parse_args(argv)
+
+    records = list(read_trace(args.trace))
+    if args.command == "summary":
+        recorded = sorted(r.duration_ns for r in records)
+        print(f"{len(records)} records, recorded p50 {_percentile(recorded, 0.5):.1f} us, "
+              f"p99 {_percentile(recorded, 0.99):.1f} us")
+        for (kind, key, locale), count in Counter(
+                (r.kind, r.key, r.locale) for r in records).most_common(args.top):
+            print(f"{count:>8}  {kind:<9}{locale:<8}{key}")
+        return 0
+
+    from locale_manager_v1_5 import LocaleManager
+    from simple_io_v1_3 import ConfigManager, GreetingGenerator
+    config = ConfigManager().config
+    locale_manager = LocaleManager(args.locales, config)
+    generator = GreetingGenerator(config, locale_manager)
+    report = replay(records * args.repeat, locale_manager, generator,
+                    real_time=args.real_time, speed=args.speed)
+    print(f"calls       {report.calls}")
+    print(f"throughput  {report.throughput:,.0f} calls/s")
+    print(f"p50         {report.p50_us:.1f} us")
+    print(f"p99         {report.p99_us:.1f} us")
+    print(f"max         {report.max_us:.1f} us")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
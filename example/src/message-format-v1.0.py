@@ -0,0 +1,620 @@
+#!/usr/bin/env python3
+"""
+Message Format v1.0
+Compiles translation templates once into render plans with typed,
+locale-bound placeholders such as {count:number} and {when:date:long},
+and ICU-style plural/select messages such as
+{count, plural, one {# name} other {# names}}.
+
+A placeholder's type selects a formatter factory at compile time; the
+factory receives the optional style and returns a formatter already bound
+to the locale's conventions, so rendering does no per-call dispatch.
+Standard format specs ({value:>8}) keep their str.format meaning.
+"""
+
+import re
+import string
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+
+Formatter = Callable[[Any], str]
+FormatterFactory = Callable[[Optional[str]], Formatter]
+
+class CompiledTemplate:
+    """Template parsed once into literal text and bound field formatters."""
+
+    __slots__ = ('source', '_fields', '_tail', '_fallback')
+
+    def __init__(self, source: str, fields: List[Tuple[str, str, Formatter]],
+                 tail: str, fallback: bool = False):
+        """
+        Initialize compiled template.
+
+        Args:
+            source: Original template text
+            fields: (literal prefix, parameter name, formatter) triples
+            tail: Literal text after the last field
+            fallback: Render with str.format instead of the compiled plan
+        """
+        self.source = source
+        self._fields = fields
+        self._tail = tail
+        self._fallback = fallback
+
+    @property
+    def field_names(self) -> List[str]:
+        """Names of the parameters the template substitutes."""
+        return [name for _, name, _ in self._fields]
+
+    def render(self, params: Mapping[str, Any]) -> str:
+        """
+        Render the template.
+
+        Args:
+            params: Template parameters
+
+        Returns:
+            str: Rendered text
+
+        Raises:
+            KeyError: If a parameter is missing
+            ValueError: If a value cannot be formatted
+        """
+        if self._fallback:
+            return self.source.format(**params)
+        if not self._fields:
+            return self._tail
+        pieces = []
+        for literal, name, formatter in self._fields:
+            pieces.append(literal)
+            pieces.append(formatter(params[name]))
+        pieces.append(self._tail)
+        return ''.join(pieces)
+
+def _plain_number(style: Optional[str]) -> Formatter:
+    """Locale-independent number formatter (integer style truncates)."""
+    if style == "integer":
+        return lambda value: str(int(value))
+    return str
+
+# Factories for callers without locale conventions: typed placeholders
+# render with plain str() instead of failing as unknown format specs
+PLAIN_FACTORIES: Dict[str, FormatterFactory] = {
+    "number": _plain_number,
+    "date": lambda style: str
+}
+
+def _standard_formatter(spec: str) -> Formatter:
+    """Formatter applying a regular format spec."""
+    if not spec:
+        return lambda value: format(value)
+    return lambda value: format(value, spec)
+
+def _bind_field(spec: str, factories: Dict[str, FormatterFactory]) -> Formatter:
+    """
+    Resolve a placeholder spec to a typed or standard formatter.
+
+    Untyped placeholders use the factory registered under "" if present.
+    """
+    type_name, _, style = spec.partition(':')
+    factory = factories.get(type_name)
+    if factory is not None:
+        return factory(style or None)
+    return _standard_formatter(spec)
+
+def compile_template(source: str,
+                     factories: Optional[Dict[str, FormatterFactory]] = None
+                     ) -> CompiledTemplate:
+    """
+    Parse a template into a compiled render plan.
+
+    Placeholders of the form {name:type} or {name:type:style} use the
+    factory registered for their type. Plain {name} placeholders use the
+    "" factory, if one is registered. Templates using conversions,
+    attribute or index access, positional fields or nested specs fall
+    back to str.format.
+
+    Args:
+        source: Template text
+        factories: Formatter factories keyed by placeholder type
+
+    Returns:
+        CompiledTemplate: Compiled template
+
+    Raises:
+        ValueError: If the template is malformed
+    """
+    factories = factories or {}
+    fields = []
+    literal_prefix = []
+    for literal, field_name, spec, conversion in string.Formatter().parse(source):
+        literal_prefix.append(literal)
+        if field_name is None:
+            continue
+        if (conversion or not field_name.isidentifier() or '{' in (spec or '')):
+            return CompiledTemplate(source, [], source, fallback=True)
+        formatter = _bind_field(spec or '', factories)
+        fields.append((''.join(literal_prefix), field_name, formatter))
+        literal_prefix = []
+    return CompiledTemplate(source, fields, ''.join(literal_prefix))
+
+# ICU-style messages
+
+PluralSelector = Callable[[Union[int, float]], str]
+
+MESSAGE_PATTERN = re.compile(r'\{\s*\w+\s*,\s*(?:plural|select)\s*,')
+
+@dataclass(frozen=True)
+class TextNode:
+    """Literal message text."""
+    text: str
+
+@dataclass(frozen=True)
+class ArgumentNode:
+    """Simple or typed placeholder, e.g. {name} or {count:number}."""
+    name: str
+    spec: str = ''
+
+@dataclass(frozen=True)
+class PoundNode:
+    """The # inside a plural branch, rendered as the formatted count."""
+
+@dataclass(frozen=True)
+class PluralNode:
+    """{name, plural, offset:N =0 {...} one {...} other {...}}"""
+    name: str
+    offset: int
+    exact: Tuple[Tuple[float, Tuple], ...]
+    branches: Tuple[Tuple[str, Tuple], ...]
+
+@dataclass(frozen=True)
+class SelectNode:
+    """{name, select, female {...} male {...} other {...}}"""
+    name: str
+    branches: Tuple[Tuple[str, Tuple], ...]
+
+MessageAST = Tuple[Any, ...]
+
+def is_message(text: str) -> bool:
+    """
+    Check if text uses plural or select syntax.
+
+    Args:
+        text: Translation text
+
+    Returns:
+        bool: True if the text must be parsed as a message
+    """
+    return MESSAGE_PATTERN.search(text) is not None
+
+class _MessageParser:
+    """Recursive descent parser for ICU-style messages."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+
+    def error(self, message: str) -> ValueError:
+        return ValueError(f"{message} at position {self.pos} in {self.text!r}")
+
+    def parse(self) -> MessageAST:
+        nodes = self.parse_nodes(in_plural=False, nested=False)
+        if self.pos != len(self.text):
+            raise self.error("Unexpected '}'")
+        return nodes
+
+    def parse_nodes(self, in_plural: bool, nested: bool) -> MessageAST:
+        nodes = []
+        literal = []
+        text = self.text
+        while self.pos < len(text):
+            char = text[self.pos]
+            if char == '}':
+                if not nested:
+                    raise self.error("Unexpected '}'")
+                break
+            if char == '{':
+                if literal:
+                    nodes.append(TextNode(''.join(literal)))
+                    literal = []
+                nodes.append(self.parse_argument())
+            elif char == '#' and in_plural:
+                if literal:
+                    nodes.append(TextNode(''.join(literal)))
+                    literal = []
+                nodes.append(PoundNode())
+                self.pos += 1
+            else:
+                literal.append(char)
+                self.pos += 1
+        if literal:
+            nodes.append(TextNode(''.join(literal)))
+        return tuple(nodes)
+
+    def skip_space(self) -> None:
+        while self.pos < len(self.text) and self.text[self.pos].isspace():
+            self.pos += 1
+
+    def read_token(self) -> str:
+        self.skip_space()
+        start = self.pos
+        while (self.pos < len(self.text)
+               and self.text[self.pos] not in ',{}' and not self.text[self.pos].isspace()):
+            self.pos += 1
+        return self.text[start:self.pos]
+
+    def expect(self, char: str) -> None:
+        self.skip_space()
+        if self.pos >= len(self.text) or self.text[self.pos] != char:
+            raise self.error(f"Expected {char!r}")
+        self.pos += 1
+
+    def parse_argument(self) -> Any:
+        self.pos += 1  # '{'
+        end = self.pos
+        while end < len(self.text) and self.text[end] not in ',{}':
+            end += 1
+        if end >= len(self.text) or self.text[end] == '{':
+            raise self.error("Unterminated argument")
+        if self.text[end] == '}':
+            name, _, spec = self.text[self.pos:end].strip().partition(':')
+            self.pos = end + 1
+            return ArgumentNode(name.strip(), spec)
+        
+        name = self.text[self.pos:end].strip()
+        self.pos = end + 1
+        kind = self.read_token()
+        if kind not in ('plural', 'select'):
+            raise self.error(f"Unknown argument type {kind!r}")
+        self.expect(',')
+        offset = 0
+        exact = []
+        branches = []
+        while True:
+            selector = self.read_token()
+            if not selector:
+                break
+            if kind == 'plural' and selector.startswith('offset:'):
+                offset = int(selector[7:])
+                continue
+            self.expect('{')
+            body = self.parse_nodes(in_plural=kind == 'plural', nested=True)
+            self.expect('}')
+            if kind == 'plural' and selector.startswith('='):
+                exact.append((float(selector[1:]), body))
+            else:
+                branches.append((selector, body))
+        self.expect('}')
+        if 'other' not in dict(branches):
+            raise self.error(f"Missing 'other' branch for {name}")
+        if kind == 'plural':
+            return PluralNode(name, offset, tuple(exact), tuple(branches))
+        return SelectNode(name, tuple(branches))
+
+def parse_message(text: str) -> MessageAST:
+    """
+    Parse an ICU-style message into an AST.
+
+    Args:
+        text: Message text
+
+    Returns:
+        MessageAST: Tuple of message nodes
+
+    Raises:
+        ValueError: If the message is malformed
+    """
+    return _MessageParser(text).parse()
+
+_RULE_TOKEN = re.compile(r'\d+(?:\.\d+)?|\.\.|!=|[=%,]|[A-Za-z]+')
+
+def _compile_plural_condition(rule: str) -> Callable[[float, int], bool]:
+    """
+    Compile a plural rule condition such as "n % 100 between 3 and 10".
+
+    Supports operands n (absolute value) and i (integer part), "%",
+    = / != / is / is not / in / not in / between, value ranges "a..b",
+    comma-separated lists, "and" / "or" and "true".
+    """
+    tokens = [t.lower() for t in _RULE_TOKEN.findall(rule)]
+    pos = 0
+
+    def peek() -> Optional[str]:
+        return tokens[pos] if pos < len(tokens) else None
+
+    def take() -> str:
+        nonlocal pos
+        if pos >= len(tokens):
+            raise ValueError(f"Unexpected end of plural rule {rule!r}")
+        pos += 1
+        return tokens[pos - 1]
+
+    def number() -> float:
+        token = take()
+        try:
+            return float(token)
+        except ValueError:
+            raise ValueError(f"Expected number in plural rule {rule!r}, got {token!r}")
+
+    def ranges() -> List[Tuple[float, float]]:
+        items = []
+        while True:
+            low = number()
+            high = low
+            if peek() == '..':
+                take()
+                high = number()
+            items.append((low, high))
+            if peek() != ',':
+                return items
+            take()
+
+    def relation() -> Callable[[float, int], bool]:
+        if peek() == 'true':
+            take()
+            return lambda n, i: True
+        operand = take()
+        if operand not in ('n', 'i'):
+            raise ValueError(f"Unsupported operand {operand!r} in plural rule {rule!r}")
+        modulus = None
+        if peek() == '%':
+            take()
+            modulus = number()
+        negate = False
+        op = take()
+        if op == 'is' and peek() == 'not':
+            take()
+            negate = True
+        elif op == 'not':
+            take()  # 'in'
+            negate = True
+        elif op == '!=':
+            negate = True
+        if op == 'between':
+            low = number()
+            if take() != 'and':
+                raise ValueError(f"Expected 'and' in plural rule {rule!r}")
+            allowed = [(low, number())]
+        else:
+            allowed = ranges()
+        use_integer = operand == 'i'
+
+        def check(n: float, i: int) -> bool:
+            value = i if use_integer else n
+            if modulus is not None:
+                value = value % modulus
+            matched = any(low <= value <= high and (value == int(value) or low == high == value)
+                          for low, high in allowed)
+            return matched != negate
+        return check
+
+    def conjunction() -> Callable[[float, int], bool]:
+        relations = [relation()]
+        while peek() == 'and':
+            take()
+            relations.append(relation())
+        return lambda n, i: all(r(n, i) for r in relations)
+
+    conditions = [conjunction()]
+    while peek() == 'or':
+        take()
+        conditions.append(conjunction())
+    if pos != len(tokens):
+        raise ValueError(f"Unexpected token {tokens[pos]!r} in plural rule {rule!r}")
+    if len(conditions) == 1:
+        return conditions[0]
+    return lambda n, i: any(c(n, i) for c in conditions)
+
+def compile_plural_rules(rules: Mapping[str, str]) -> PluralSelector:
+    """
+    Compile a locale's plural_rules into a category selector.
+
+    Categories are tested in order with "other" last.
+
+    Args:
+        rules: Mapping of category to rule condition
+
+    Returns:
+        PluralSelector: Function mapping a number to its plural category
+
+    Raises:
+        ValueError: If a rule is malformed
+    """
+    compiled = [
+        (category, _compile_plural_condition(rule))
+        for category, rule in rules.items() if category != 'other'
+    ]
+
+    def select(value: Union[int, float]) -> str:
+        n = abs(value)
+        i = int(n)
+        for category, condition in compiled:
+            if condition(n, i):
+                return category
+        return 'other'
+    return select
+
+Renderer = Callable[[Mapping[str, Any], Any], str]
+
+class CompiledMessage:
+    """Plural/select message compiled from its AST into render closures."""
+
+    __slots__ = ('source', '_render')
+
+    def __init__(self, source: str, render: Renderer):
+        self.source = source
+        self._render = render
+
+    def render(self, params: Mapping[str, Any]) -> str:
+        """
+        Render the message.
+
+        Args:
+            params: Message parameters
+
+        Returns:
+            str: Rendered text
+
+        Raises:
+            KeyError: If a parameter is missing
+        """
+        return self._render(params, None)
+
+def _merge_text(nodes: MessageAST) -> MessageAST:
+    """Merge adjacent text nodes."""
+    merged = []
+    for node in nodes:
+        if isinstance(node, TextNode) and merged and isinstance(merged[-1], TextNode):
+            merged[-1] = TextNode(merged[-1].text + node.text)
+        elif not (isinstance(node, TextNode) and not node.text):
+            merged.append(node)
+    return tuple(merged)
+
+def _distribute_text(nodes: MessageAST) -> MessageAST:
+    """
+    Push literal text surrounding a single plural/select into its branches.
+
+    "You have {n, plural, one {# item} other {# items}}." becomes a plural
+    whose branches are "You have # item." and "You have # items.", so
+    rendering is a single branch lookup plus one concatenation.
+    """
+    choices = [i for i, node in enumerate(nodes) if isinstance(node, (PluralNode, SelectNode))]
+    if len(choices) != 1 or len(nodes) == 1:
+        return nodes
+    index = choices[0]
+    if not all(isinstance(node, TextNode) for i, node in enumerate(nodes) if i != index):
+        return nodes
+    before, choice, after = nodes[:index], nodes[index], nodes[index + 1:]
+
+    def wrap(branches: Tuple[Tuple[Any, Tuple], ...]) -> Tuple[Tuple[Any, Tuple], ...]:
+        return tuple((key, _merge_text(before + body + after)) for key, body in branches)
+
+    if isinstance(choice, PluralNode):
+        return (PluralNode(choice.name, choice.offset, wrap(choice.exact), wrap(choice.branches)),)
+    return (SelectNode(choice.name, wrap(choice.branches)),)
+
+# Plural values whose branch is memoized per compiled message
+MAX_MEMOIZED_VALUES = 256
+
+def compile_message(source: str, ast: MessageAST,
+                    factories: Dict[str, FormatterFactory],
+                    plural_selector: PluralSelector,
+                    mark: str = '') -> CompiledMessage:
+    """
+    Bind a parsed message to a locale's formatters and plural rules.
+
+    Args:
+        source: Original message text
+        ast: Parsed message
+        factories: Formatter factories keyed by placeholder type
+        plural_selector: Locale plural category selector
+        mark: Optional directional mark placed around the rendered text
+
+    Returns:
+        CompiledMessage: Compiled message
+    """
+    number_factory = factories.get('number')
+    integer_format = number_factory('integer') if number_factory else str
+    number_format = number_factory(None) if number_factory else str
+
+    def format_count(value: Any) -> str:
+        if isinstance(value, int) or (isinstance(value, float) and value.is_integer()):
+            return integer_format(value)
+        return number_format(value)
+
+    def compile_nodes(nodes: MessageAST) -> Renderer:
+        nodes = _distribute_text(nodes)
+        # Branches made only of text and a single # become prefix + count + suffix
+        if all(isinstance(node, (TextNode, PoundNode)) for node in nodes):
+            pounds = sum(isinstance(node, PoundNode) for node in nodes)
+            if pounds == 0:
+                text = ''.join(node.text for node in nodes)
+                return lambda params, count: text
+            if pounds == 1:
+                index = next(i for i, node in enumerate(nodes) if isinstance(node, PoundNode))
+                prefix = ''.join(node.text for node in nodes[:index])
+                suffix = ''.join(node.text for node in nodes[index + 1:])
+                return lambda params, count: prefix + format_count(count) + suffix
+        renderers = [compile_node(node) for node in nodes]
+        if len(renderers) == 1:
+            return renderers[0]
+        return lambda params, count: ''.join([r(params, count) for r in renderers])
+
+    def compile_node(node: Any) -> Renderer:
+        if isinstance(node, TextNode):
+            text = node.text
+            return lambda params, count: text
+        if isinstance(node, ArgumentNode):
+            name = node.name
+            formatter = _bind_field(node.spec, factories)
+            return lambda params, count: formatter(params[name])
+        if isinstance(node, PoundNode):
+            return lambda params, count: format_count(count)
+        if isinstance(node, PluralNode):
+            return compile_plural(node)
+        name = node.name
+        branches = {key: compile_nodes(body) for key, body in node.branches}
+        other = branches['other']
+        return lambda params, count: branches.get(str(params[name]), other)(params, count)
+
+    def compile_plural(node: PluralNode) -> Renderer:
+        name, offset = node.name, node.offset
+        exact = {value: compile_nodes(body) for value, body in node.exact}
+        branches = {key: compile_nodes(body) for key, body in node.branches}
+        other = branches['other']
+        resolved: Dict[Any, Renderer] = {}
+
+        def render_plural(params: Mapping[str, Any], count: Any) -> str:
+            value = params[name]
+            branch = resolved.get(value)
+            if branch is None:
+                branch = exact.get(value)
+                if branch is None:
+                    branch = branches.get(plural_selector(value - offset), other)
+                if len(resolved) < MAX_MEMOIZED_VALUES:
+                    resolved[value] = branch
+            return branch(params, value - offset)
+        return render_plural
+
+    render = compile_nodes(ast)
+    if mark:
+        inner = render
+        render = lambda params, count: mark + inner(params, count) + mark
+    return CompiledMessage(source, render)
+
+def benchmark(rounds: int = 200_000) -> Dict[str, float]:
+    """
+    Compare rendering a plural message with a plain str.format substitution.
+
+    Args:
+        rounds: Number of renders
+
+    Returns:
+        Dict[str, float]: Seconds taken by each approach
+    """
+    plain = "You have {count} messages"
+    source = "You have {count, plural, =0 {no messages} one {# message} other {# messages}}"
+    message = compile_message(
+        source, parse_message(source), {},
+        compile_plural_rules({"one": "n = 1", "other": "true"})
+    )
+    counts = [0, 1, 2, 5, 21]
+    results = {}
+
+    start = time.perf_counter()
+    for index in range(rounds):
+        plain.format(count=counts[index % 5])
+    results["str_format"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for index in range(rounds):
+        message.render({"count": counts[index % 5]})
+    results["compiled_plural"] = time.perf_counter() - start
+    return results
+
+if __name__ == "__main__":
+    timings = benchmark()
+    for label, seconds in timings.items():
+        print(f"{label:<18}{seconds * 1000:>10.1f} ms")
+    print(f"{'ratio':<18}{timings['compiled_plural'] / timings['str_format']:>10.2f}x")
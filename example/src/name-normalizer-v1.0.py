@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Name Normalizer v1.0
+Streaming pre-stage ahead of NameValidator that NFKC-normalizes names and
+drops duplicates, so canonically equivalent or width-variant spellings of
+the same name are validated, greeted and stored once.
+
+Deduplication is keyed on the casefolded NFKC form. ASCII names skip
+unicodedata entirely. Memory is bounded either by an exact set with a
+fixed window of recent keys or by an optional Bloom filter.
+"""
+
+import hashlib
+import math
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a name for display and validation.
+
+    Args:
+        name: Raw input name
+
+    Returns:
+        str: NFKC-normalized name without surrounding whitespace
+    """
+    if name.isascii():
+        return name.strip()
+    return unicodedata.normalize('NFKC', name).strip()
+
+def dedupe_key(normalized: str) -> str:
+    """
+    Get the deduplication key of a normalized name.
+
+    Args:
+        normalized: Output of normalize_name
+
+    Returns:
+        str: Casefolded key
+    """
+    if normalized.isascii():
+        return normalized.lower()
+    # Casefolding can produce non-NFKC sequences, so normalize again
+    return unicodedata.normalize('NFKC', normalized.casefold())
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Initialize Bloom filter.
+
+        Args:
+            capacity: Expected number of distinct items
+            error_rate: Target false positive rate
+
+        Raises:
+            ValueError: If capacity or error_rate is out of range
+        """
+        if capacity <= 0:
+            raise ValueError("Bloom filter capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("Bloom filter error rate must be between 0 and 1")
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> Iterator[int]:
+        """Bit positions for an item using double hashing."""
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.size
+
+    def add(self, item: str) -> bool:
+        """
+        Add an item.
+
+        Args:
+            item: Item to add
+
+        Returns:
+            bool: True if the item was (probably) already present
+        """
+        present = True
+        bits = self._bits
+        for position in self._positions(item):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not bits[byte] & mask:
+                present = False
+                bits[byte] |= mask
+        return present
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(item))
+
+@dataclass
+class DedupStats:
+    """Counters for a deduplication run."""
+    seen: int = 0
+    unique: int = 0
+
+    @property
+    def duplicates(self) -> int:
+        """Number of names dropped as duplicates."""
+        return self.seen - self.unique
+
+    @property
+    def dedupe_ratio(self) -> float:
+        """Fraction of input names dropped as duplicates."""
+        return self.duplicates / self.seen if self.seen else 0.0
+
+class NameDeduplicator:
+    """Streaming normalize-and-dedupe stage."""
+
+    def __init__(self, max_entries: int = 1_000_000,
+                 bloom_capacity: Optional[int] = None,
+                 error_rate: float = 0.001):
+        """
+        Initialize deduplicator.
+
+        Args:
+            max_entries: Maximum keys held by the exact set; the oldest keys
+                are forgotten beyond this, so only repeats within that
+                window are caught
+            bloom_capacity: Use a Bloom filter sized for this many names
+                instead of the exact set (may drop rare false positives)
+            error_rate: Bloom filter false positive rate
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.bloom = BloomFilter(bloom_capacity, error_rate) if bloom_capacity else None
+        # Oldest key first; popitem(last=False) evicts in O(1)
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+        self.stats = DedupStats()
+
+    def is_duplicate(self, normalized: str) -> bool:
+        """
+        Record a normalized name and report whether it was seen before.
+
+        Args:
+            normalized: Output of normalize_name
+
+        Returns:
+            bool: True if the name is a duplicate
+        """
+        key = dedupe_key(normalized)
+        self.stats.seen += 1
+        if self.bloom is not None:
+            duplicate = self.bloom.add(key)
+        elif key in self._seen:
+            duplicate = True
+        else:
+            duplicate = False
+            self._seen[key] = None
+            if len(self._seen) > self.max_entries:
+                self._seen.popitem(last=False)
+        if not duplicate:
+            self.stats.unique += 1
+        return duplicate
+
+    def process(self, names: Iterable[str]) -> Iterator[str]:
+        """
+        Normalize names and yield the first occurrence of each.
+
+        Empty names are passed through so the validator can report them.
+
+        Args:
+            names: Raw input names
+
+        Yields:
+            str: Normalized, unique names
+        """
+        for name in names:
+            normalized = normalize_name(name)
+            if not normalized or not self.is_duplicate(normalized):
+                yield normalized
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Output Writer v1.0
+Buffered writer for program output and batch greetings. Records are
+rendered into a reusable io.StringIO chunk, encoded to UTF-8 in large
+blocks and written with os.write when the sink exposes a file descriptor.
+
+A flush happens when the pending chunk reaches max_chars or max_records,
+when a record ends a line (flush_on_newline), or when a write arrives
+max_delay seconds after the last flush.
+"""
+
+import io
+import os
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, TextIO, Union
+
+@dataclass(frozen=True)
+class FlushPolicy:
+    """Controls when buffered output is written to the sink."""
+    max_chars: int = 64 * 1024
+    max_records: Optional[int] = None
+    max_delay: Optional[float] = None
+    flush_on_newline: bool = False
+
+    @classmethod
+    def interactive(cls) -> "FlushPolicy":
+        """Policy that flushes after every record, for prompts on a TTY."""
+        return cls(max_chars=1, max_records=1)
+
+    @classmethod
+    def line_buffered(cls) -> "FlushPolicy":
+        """Policy that flushes whenever a line is complete."""
+        return cls(flush_on_newline=True)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "FlushPolicy":
+        """
+        Build a policy from the "output" configuration section.
+
+        Recognized keys are max_buffer_chars, flush_every, flush_interval
+        and flush_on_newline; missing keys keep the defaults.
+
+        Args:
+            config: Configuration dictionary
+
+        Returns:
+            FlushPolicy: Configured policy
+
+        Raises:
+            ValueError: If the "output" section is not an object
+        """
+        section = config.get("output", {})
+        if not isinstance(section, Mapping):
+            raise ValueError("output must be an object")
+        return cls(
+            max_chars=section.get("max_buffer_chars", cls.max_chars),
+            max_records=section.get("flush_every", cls.max_records),
+            max_delay=section.get("flush_interval", cls.max_delay),
+            flush_on_newline=section.get("flush_on_newline", cls.flush_on_newline)
+        )
+
+class BufferedWriter:
+    """Chunked UTF-8 writer for stdout and file sinks."""
+
+    def __init__(self, sink: Union[TextIO, int, None] = None,
+                 policy: Optional[FlushPolicy] = None,
+                 encoding: str = 'utf-8'):
+        """
+        Initialize buffered writer.
+
+        Args:
+            sink: Text stream, binary stream or file descriptor (default stdout)
+            policy: Flush policy; defaults to interactive on a TTY
+            encoding: Output encoding
+        """
+        self.sink = sys.stdout if sink is None else sink
+        self.encoding = encoding
+        self._fd = self._resolve_fd(self.sink)
+        if policy is None:
+            is_tty = self._fd is not None and os.isatty(self._fd)
+            policy = FlushPolicy.interactive() if is_tty else FlushPolicy()
+        self.policy = policy
+        self._buffer = io.StringIO()
+        self._pending_chars = 0
+        self._pending_records = 0
+        self._last_flush = time.monotonic()
+        self.bytes_written = 0
+        self.closed = False
+
+    @staticmethod
+    def _resolve_fd(sink: Union[TextIO, int]) -> Optional[int]:
+        """Get the sink's file descriptor, if it has one."""
+        if isinstance(sink, int):
+            return sink
+        try:
+            return sink.fileno()
+        except (AttributeError, OSError, ValueError):
+            return None
+
+    def write(self, text: str) -> None:
+        """
+        Buffer a single record.
+
+        Args:
+            text: Text to write (no newline is added)
+            
+        Raises:
+            ValueError: If the writer is closed
+        """
+        if self.closed:
+            raise ValueError("Write to closed BufferedWriter")
+        self._buffer.write(text)
+        self._pending_chars += len(text)
+        self._pending_records += 1
+        if self._should_flush(text):
+            self.flush()
+
+    def writeline(self, text: str) -> None:
+        """
+        Buffer a record followed by a newline.
+
+        Args:
+            text: Text to write
+            
+        Raises:
+            ValueError: If the writer is closed
+        """
+        if self.closed:
+            raise ValueError("Write to closed BufferedWriter")
+        self._buffer.write(text)
+        self._pending_chars += len(text)
+        self.write("\n")
+
+    def writelines(self, lines: Iterable[str]) -> None:
+        """
+        Buffer many records, each followed by a newline.
+
+        Args:
+            lines: Texts to write
+        """
+        for line in lines:
+            self.writeline(line)
+
+    def _should_flush(self, text: str) -> bool:
+        """Check the flush policy after buffering a record."""
+        policy = self.policy
+        if self._pending_chars >= policy.max_chars:
+            return True
+        if policy.flush_on_newline and text.endswith("\n"):
+            return True
+        if policy.max_records and self._pending_records >= policy.max_records:
+            return True
+        if policy.max_delay is not None:
+            return time.monotonic() - self._last_flush >= policy.max_delay
+        return False
+
+    def flush(self) -> None:
+        """Encode the pending chunk and write it to the sink."""
+        data = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate(0)
+        self._pending_chars = 0
+        self._pending_records = 0
+        self._last_flush = time.monotonic()
+        if not data:
+            return
+        encoded = data.encode(self.encoding)
+        if self._fd is not None:
+            if not isinstance(self.sink, int):
+                # Keep ordering with anything already buffered in the stream
+                self.sink.flush()
+            view = memoryview(encoded)
+            while view:
+                written = os.write(self._fd, view)
+                view = view[written:]
+        elif isinstance(self.sink, (io.RawIOBase, io.BufferedIOBase)):
+            self.sink.write(encoded)
+        else:
+            self.sink.write(data)
+            self.sink.flush()
+        self.bytes_written += len(encoded)
+
+    def close(self) -> None:
+        """
+        Flush remaining output and reject further writes.
+
+        The sink itself is left open; closing twice is a no-op.
+        """
+        if not self.closed:
+            self.flush()
+            self.closed = True
+
+    def __enter__(self) -> "BufferedWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+def write_greetings(writer: BufferedWriter, names: Iterable[str],
+                    render: Callable[[str], str]) -> int:
+    """
+    Render and write a greeting per name.
+
+    Args:
+        writer: Output writer
+        names: Validated names
+        render: Callable producing a greeting for a name
+            (e.g. GreetingGenerator.create_greeting)
+
+    Returns:
+        int: Number of greetings written
+    """
+    count = 0
+    for name in names:
+        writer.writeline(render(name))
+        count += 1
+    return count
+
+def benchmark(count: int = 200_000, path: str = os.devnull) -> Dict[str, float]:
+    """
+    Compare a plain print loop with the buffered writer on the same sink.
+
+    Args:
+        count: Number of greetings to write
+        path: Output file (default os.devnull)
+
+    Returns:
+        Dict[str, float]: Seconds taken by each approach
+    """
+    names = [f"Name {i}" for i in range(count)]
+    render = "Hola {}".format
+    results = {}
+
+    with open(path, 'w', encoding='utf-8') as sink:
+        start = time.perf_counter()
+        for name in names:
+            print(render(name), file=sink)
+        results["print_loop"] = time.perf_counter() - start
+
+    with open(path, 'w', encoding='utf-8') as sink:
+        start = time.perf_counter()
+        with BufferedWriter(sink, FlushPolicy()) as writer:
+            write_greetings(writer, names, render)
+        results["buffered_writer"] = time.perf_counter() - start
+
+    return results
+
+if __name__ == "__main__":
+    timings = benchmark()
+    for label, seconds in timings.items():
+        print(f"{label:<16}{seconds * 1000:>10.1f} ms")
+    print(f"{'speedup':<16}{timings['print_loop'] / timings['buffered_writer']:>10.1f}x")
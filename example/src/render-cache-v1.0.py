@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Render Cache v1.0
+Bounded LRU/TTL cache for fully-resolved greetings and parameterized
+translation lookups, with hit-rate statistics and per-locale invalidation.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Optional, Tuple
+
+_MISSING = object()
+
+@dataclass
+class CacheStats:
+    """Snapshot of render cache counters."""
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    size: int
+    capacity: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+class RenderCache:
+    """Bounded LRU cache with optional TTL for rendered strings."""
+
+    def __init__(self, capacity: int = 1024, ttl: Optional[float] = None):
+        """
+        Initialize render cache.
+
+        Args:
+            capacity: Maximum number of cached entries
+            ttl: Optional time-to-live in seconds for each entry
+
+        Raises:
+            ValueError: If capacity or ttl is not positive
+        """
+        if capacity <= 0:
+            raise ValueError("Cache capacity must be positive")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("Cache TTL must be positive")
+        self.capacity = capacity
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def make_key(namespace: str, locale: Optional[str], *parts: Any) -> Optional[Tuple]:
+        """
+        Build a cache key, returning None if any part is unhashable.
+
+        The locale is always the second element so entries can be
+        invalidated per locale.
+
+        Args:
+            namespace: Key namespace (e.g. "text" or "greeting")
+            locale: Locale the value was rendered for
+            *parts: Remaining key components
+
+        Returns:
+            Optional[Tuple]: Cache key or None if it cannot be hashed
+        """
+        key = (namespace, locale) + parts
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Look up a cached value, refreshing its LRU position.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Any: Cached value or default
+        """
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                self._misses += 1
+                return default
+            value, expires_at = entry
+            if expires_at and expires_at <= time.monotonic():
+                del self._entries[key]
+                self._misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: str) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Rendered string
+        """
+        expires_at = time.monotonic() + self.ttl if self.ttl else 0.0
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self._entries[key] = (value, expires_at)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, locale: Optional[str] = None) -> int:
+        """
+        Drop cached entries for one locale, or everything.
+
+        Args:
+            locale: Locale whose entries are dropped; None clears all
+
+        Returns:
+            int: Number of entries removed
+        """
+        with self._lock:
+            if locale is None:
+                removed = len(self._entries)
+                self._entries.clear()
+            else:
+                stale = [key for key in self._entries if key[1] == locale]
+                for key in stale:
+                    del self._entries[key]
+                removed = len(stale)
+            self._invalidations += 1
+            return removed
+
+    def stats(self) -> CacheStats:
+        """
+        Get current cache statistics.
+
+        Returns:
+            CacheStats: Counter snapshot
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                size=len(self._entries),
+                capacity=self.capacity
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
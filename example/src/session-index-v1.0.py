@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Session Index v1.0
+Structured, incrementally updated index over Session_summary_NNN.md files.
+
+Each summary is parsed once into its header fields, version changes,
+artifacts, interface definitions, interface changes, known issues and
+next steps. Parsed summaries are cached in a JSON index next to the
+summaries; on update only files whose size, mtime and then content hash
+changed are parsed again, so queries such as the latest interface of a
+class are answered from memory without re-reading every summary.
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from artifact_files_v1_0 import parse_artifact_name, write_json_atomic
+
+SUMMARY_GLOB = "Session_summary_*.md"
+INDEX_FILE = ".session-index.json"
+INDEX_FORMAT = 1
+
+_HEADING = re.compile(r'^(#{1,3})\s+(.*?)\s*$')
+_HEADER_FIELD = re.compile(r'^([A-Z][A-Za-z ]+):\s*(.*?)\s*$')
+_ITEM = re.compile(r'^\s*(?:[-*]|\d+\.)\s+(?!\[[ xX]\])(.*\S)')
+_ARTIFACT = re.compile(r'[\w./-]*\w\.(?:py|json|md)\b')
+_DEFINITION = re.compile(r'^(?:class|def)\s+(\w+)')
+_SUMMARY_NUMBER = re.compile(r'(\d+)')
+
+# Sections (level-3 heading, or level-2 when it has no subsections) per field
+_ARTIFACT_SECTIONS = {"artifact relationships", "source code management"}
+_INTERFACE_CHANGE_SECTIONS = {"interface changes", "interface change justification"}
+_NEXT_STEP_SECTIONS = {"next steps", "future planning"}
+
+@dataclass
+class SessionSummary:
+    """Structured content of one session summary."""
+    file: str
+    number: int
+    title: str = ""
+    session_id: Optional[str] = None
+    previous_session: Optional[str] = None
+    current_version: Optional[str] = None
+    previous_version: Optional[str] = None
+    date: Optional[str] = None
+    version_changes: List[str] = field(default_factory=list)
+    artifacts: List[str] = field(default_factory=list)
+    interfaces: Dict[str, str] = field(default_factory=dict)
+    interface_changes: List[str] = field(default_factory=list)
+    known_issues: List[str] = field(default_factory=list)
+    next_steps: List[str] = field(default_factory=list)
+
+def _split_definitions(code_lines: List[str]) -> Dict[str, str]:
+    """Split an interface code block into top-level class/def entries."""
+    definitions: Dict[str, List[str]] = {}
+    current = None
+    for line in code_lines:
+        match = _DEFINITION.match(line)
+        if match:
+            current = match.group(1)
+            definitions[current] = [line.rstrip()]
+        elif current is not None and line.strip():
+            definitions[current].append(line.rstrip())
+    return {name: "\n".join(lines) for name, lines in definitions.items()}
+
+def parse_summary(text: str, file: str = "", number: int = 0) -> SessionSummary:
+    """
+    Parse a session summary.
+
+    Args:
+        text: Markdown content
+        file: File name recorded in the result
+        number: Session number (ordering key)
+
+    Returns:
+        SessionSummary: Parsed summary; missing sections stay empty
+    """
+    summary = SessionSummary(file=file, number=number)
+    header_fields = {}
+    sections: Dict[Tuple[str, str], List[str]] = {}
+    code: Dict[Tuple[str, str], List[str]] = {}
+    section = ("", "")
+    in_code = False
+    for line in text.splitlines():
+        if line.lstrip().startswith("```"):
+            in_code = not in_code
+            continue
+        if in_code:
+            code.setdefault(section, []).append(line)
+            continue
+        heading = _HEADING.match(line)
+        if heading:
+            level, title = len(heading.group(1)), heading.group(2)
+            if level == 1:
+                summary.title = title.split(":", 1)[-1].strip()
+            elif level == 2:
+                section = (title.lower(), "")
+            else:
+                section = (section[0], title.lower())
+            continue
+        if section == ("", ""):
+            match = _HEADER_FIELD.match(line)
+            if match:
+                header_fields[match.group(1).lower()] = match.group(2)
+            continue
+        sections.setdefault(section, []).append(line)
+
+    summary.session_id = header_fields.get("session id")
+    summary.previous_session = header_fields.get("previous session")
+    summary.current_version = header_fields.get("current version")
+    summary.previous_version = header_fields.get("previous version")
+    summary.date = header_fields.get("date")
+
+    for (part, subsection), lines in sections.items():
+        name = subsection or part
+        items = [match.group(1) for match in map(_ITEM.match, lines) if match]
+        if name == "version changes":
+            summary.version_changes.extend(items)
+        elif name in _ARTIFACT_SECTIONS:
+            for artifact in _ARTIFACT.findall("\n".join(lines)):
+                if artifact not in summary.artifacts:
+                    summary.artifacts.append(artifact)
+        elif name in _INTERFACE_CHANGE_SECTIONS or (
+                part == "changes from previous session" and subsection == "interface updates"):
+            summary.interface_changes.extend(items)
+        elif name == "known issues":
+            summary.known_issues.extend(items)
+        elif part in _NEXT_STEP_SECTIONS and subsection != "open questions":
+            summary.next_steps.extend(items)
+    for (part, subsection), lines in code.items():
+        if subsection == "current interface definition":
+            summary.interfaces.update(_split_definitions(lines))
+    return summary
+
+class SessionIndex:
+    """On-disk cached index of session summaries."""
+
+    def __init__(self, summary_dir: str, index_path: Optional[str] = None):
+        """
+        Initialize the index.
+
+        Args:
+            summary_dir: Directory containing Session_summary_NNN.md files
+            index_path: Cache file (default: .session-index.json in summary_dir)
+        """
+        self.summary_dir = Path(summary_dir)
+        self.index_path = Path(index_path) if index_path else self.summary_dir / INDEX_FILE
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._summaries: List[SessionSummary] = []
+        self._load()
+
+    def _load(self) -> None:
+        """Load the cache file, ignoring it if missing or outdated."""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("format") == INDEX_FORMAT:
+            self._entries = data.get("files", {})
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        self._summaries = sorted(
+            (SessionSummary(**entry["summary"]) for entry in self._entries.values()),
+            key=lambda summary: (summary.number, summary.file)
+        )
+
+    def update(self) -> List[str]:
+        """
+        Bring the index up to date with the summary directory.
+
+        Returns:
+            List[str]: Files that were (re)parsed or removed
+        """
+        changed = []
+        entries = {}
+        for path in sorted(self.summary_dir.glob(SUMMARY_GLOB)):
+            stat = path.stat()
+            entry = self._entries.get(path.name)
+            if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                entries[path.name] = entry
+                continue
+            raw = path.read_bytes()
+            digest = hashlib.sha256(raw).hexdigest()
+            if entry is None or entry["sha256"] != digest:
+                number_match = _SUMMARY_NUMBER.search(path.stem)
+                summary = parse_summary(raw.decode('utf-8'), path.name,
+                                        int(number_match.group(1)) if number_match else 0)
+                entry = {"sha256": digest, "summary": asdict(summary)}
+                changed.append(path.name)
+            entries[path.name] = dict(entry, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+        changed.extend(sorted(set(self._entries) - set(entries)))
+        stat_only = entries != self._entries
+        self._entries = entries
+        if changed or stat_only:
+            self._rebuild()
+            write_json_atomic(self.index_path, {"format": INDEX_FORMAT, "files": entries},
+                              indent=1)
+        return changed
+
+    @property
+    def summaries(self) -> List[SessionSummary]:
+        """Indexed summaries in session order."""
+        return list(self._summaries)
+
+    def latest(self) -> Optional[SessionSummary]:
+        """Most recent non-empty summary."""
+        for summary in reversed(self._summaries):
+            if summary.title or summary.session_id:
+                return summary
+        return None
+
+    def interface_history(self, name: str) -> List[Tuple[SessionSummary, str]]:
+        """
+        Get every recorded definition of a class or function.
+
+        Args:
+            name: Class or function name
+
+        Returns:
+            List[Tuple[SessionSummary, str]]: Summary and definition, oldest first
+        """
+        return [(summary, summary.interfaces[name])
+                for summary in self._summaries if name in summary.interfaces]
+
+    def latest_interface(self, name: str) -> Optional[Tuple[SessionSummary, str]]:
+        """
+        Get the most recent recorded definition of a class or function.
+
+        Args:
+            name: Class or function name
+
+        Returns:
+            Optional[Tuple[SessionSummary, str]]: Summary and definition
+        """
+        for summary in reversed(self._summaries):
+            if name in summary.interfaces:
+                return summary, summary.interfaces[name]
+        return None
+
+    def artifact_sessions(self, artifact: str) -> List[SessionSummary]:
+        """
+        Find the summaries listing an artifact.
+
+        Names are compared by artifact name, so "simple-io" matches
+        simple_io_v1.3.py; a version in the query must match exactly.
+
+        Args:
+            artifact: Artifact file name or part of it
+
+        Returns:
+            List[SessionSummary]: Matching summaries in session order
+        """
+        query, query_version = parse_artifact_name(artifact)
+
+        def matches(listed: str) -> bool:
+            name, version = parse_artifact_name(listed)
+            return query in name and (not query_version or version == query_version)
+
+        return [summary for summary in self._summaries
+                if any(map(matches, summary.artifacts))]
+
+def _describe(summary: SessionSummary) -> str:
+    return f"{summary.session_id or summary.file} ({summary.current_version or 'unversioned'})"
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point.
+
+    Args:
+        argv: Optional argument list
+
+    Returns:
+        int: Exit status (1 if the queried item is not found)
+    """
+    parser = argparse.ArgumentParser(description="Query the session summary index")
+    parser.add_argument("-d", "--dir", default=".", help="Directory with session summaries")
+    parser.add_argument("--index", help="Index cache file")
+    parser.add_argument("--json", action="store_true", help="Print JSON")
+    commands = parser.add_subparsers(dest="command", required=True)
+    interface = commands.add_parser("interface", help="Latest interface of a class or function")
+    interface.add_argument("name")
+    interface.add_argument("--history", action="store_true", help="Show every recorded version")
+    commands.add_parser("issues", help="Known issues of the latest session")
+    commands.add_parser("next", help="Next steps of the latest session")
+    artifact = commands.add_parser("artifact", help="Sessions listing an artifact")
+    artifact.add_argument("name")
+    commands.add_parser("sessions", help="List indexed sessions")
+    args = parser.parse_args(argv)
+
+    index = SessionIndex(args.dir, args.index)
+    index.update()
+    latest = index.latest()
+
+    if args.command == "interface":
+        found = index.interface_history(args.name) if args.history else \
+            [entry for entry in [index.latest_interface(args.name)] if entry]
+        if not found:
+            print(f"No recorded interface for {args.name}", file=sys.stderr)
+            return 1
+        if args.json:
+            print(json.dumps([{"session": s.session_id, "version": s.current_version,
+                               "definition": d} for s, d in found], indent=2))
+        else:
+            for summary, definition in found:
+                print(f"# {_describe(summary)}\n{definition}\n")
+        return 0
+
+    if args.command in ("issues", "next"):
+        items = [] if latest is None else (
+            latest.known_issues if args.command == "issues" else latest.next_steps
+        )
+        if args.json:
+            print(json.dumps(items, indent=2))
+        else:
+            for item in items:
+                print(f"- {item}")
+        return 0
+
+    summaries = index.artifact_sessions(args.name) if args.command == "artifact" else index.summaries
+    if args.json:
+        print(json.dumps([asdict(summary) for summary in summaries], indent=2))
+    else:
+        for summary in summaries:
+            print(f"{_describe(summary):<28}{summary.date or '':<12}{summary.title}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
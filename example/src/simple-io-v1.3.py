@@ -5,27 +5,41 @@ Enhanced version with internationalization support, configurable greeting format
 extended input validation, and unit test coverage.
 """
 
+import copy
 import json
 import re
+import time
+import unicodedata
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Any, Union
+from types import MappingProxyType
+from typing import Dict, Optional, Any, Union, Mapping, Pattern, Tuple
+from catalog_store_v1_0 import CatalogStore, open_store
+from output_writer_v1_0 import BufferedWriter, FlushPolicy
+from message_format_v1_0 import PLAIN_FACTORIES, compile_template
 
 class LocaleManager:
     """Handles program localization."""
     
-    def __init__(self, locale_dir: str, config: Dict):
+    def __init__(self, locale_dir: Union[str, Path, CatalogStore], config: Dict,
+                 render_cache: Optional[Any] = None):
         """
         Initialize locale manager.
         
         Args:
-            locale_dir: Directory containing locale files
+            locale_dir: Directory containing locale files, a zip/tar
+                bundle, or a CatalogStore
             config: Configuration dictionary with locale settings
+            render_cache: Optional RenderCache shared with GreetingGenerator,
+                invalidated when translations are reloaded
         """
-        self.locale_dir = Path(locale_dir)
+        self.store = open_store(locale_dir)
+        self.locale_dir = getattr(self.store, "path", None)
         self.config = config
         self.default_locale = config.get("default_locale", "en")
         self.fallback_locale = config.get("fallback_locale", "en")
+        self.render_cache = render_cache
         self.translations = self._load_translations()
     
     def _load_translations(self) -> Dict:
@@ -39,11 +53,10 @@ class LocaleManager:
         available_locales = self.config.get("available_locales", ["en"])
         
         for locale in available_locales:
-            locale_file = self.locale_dir / f"{locale}.json"
-            if locale_file.exists():
+            locale_file = f"{locale}.json"
+            if self.store.exists(locale_file):
                 try:
-                    with open(locale_file, 'r', encoding='utf-8') as f:
-                        translations[locale] = json.load(f)
+                    translations[locale] = self.store.load_json(locale_file)
                 except json.JSONDecodeError:
                     print(f"Warning: Invalid locale file {locale_file}. Skipping.")
                     if locale == self.default_locale:
@@ -51,6 +64,33 @@ class LocaleManager:
         
         if not translations:
             raise ValueError("No valid translations found")
+        if self.default_locale not in translations:
+            raise ValueError(f"Default locale {self.default_locale} not found")
+        return translations
+    
+    def reload_locale(self, locale: str) -> Dict:
+        """
+        Reload translations for a locale from its store.
+        
+        Cached renders are invalidated so stale text is never served.
+        
+        Args:
+            locale: Locale code to reload
+            
+        Returns:
+            Dict: Reloaded translations
+            
+        Raises:
+            ValueError: If the locale file is missing or invalid
+        """
+        try:
+            translations = self.store.load_json(f"{locale}.json")
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            raise ValueError(f"Cannot reload locale {locale}: {e}")
+        self.translations[locale] = translations
+        if self.render_cache is not None:
+            # Every locale falls back to the fallback locale
+            self.render_cache.invalidate(None if locale == self.fallback_locale else locale)
         return translations
     
     def get_text(self, key: str, locale: Optional[str] = None, **kwargs) -> str:
@@ -81,9 +121,32 @@ class LocaleManager:
         if not isinstance(text, str):
             text = self._fallback_text(key, **kwargs)
         
+        return self._format(text, kwargs)
+    
+    @staticmethod
+    def _format(text: str, params: Dict[str, Any]) -> str:
+        """
+        Substitute parameters, accepting typed placeholders.
+        
+        Typed placeholders such as {max_length:number:integer} are not
+        locale-aware here; they render with plain str().
+        
+        Args:
+            text: Template text
+            params: Format string parameters
+            
+        Returns:
+            str: Formatted text, or the template if formatting fails
+        """
         try:
-            return text.format(**kwargs)
-        except (KeyError, ValueError):
+            return text.format(**params)
+        except ValueError:
+            # Unknown format spec: retry with typed placeholder support
+            try:
+                return compile_template(text, PLAIN_FACTORIES).render(params)
+            except (KeyError, ValueError):
+                return text
+        except KeyError:
             return text
     
     def _fallback_text(self, key: str, **kwargs) -> str:
@@ -105,13 +168,23 @@ class LocaleManager:
                 text = text.get(part, f"Missing translation: {key}")
             
             if isinstance(text, str):
-                try:
-                    return text.format(**kwargs)
-                except (KeyError, ValueError):
-                    return text
+                return self._format(text, kwargs)
         
         return f"Missing translation: {key}"
 
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """Immutable, validated configuration with precomputed derived values."""
+    raw: Mapping[str, Any]
+    greeting_style: str
+    min_length: int
+    max_length: int
+    allowed_chars: str
+    name_pattern: Pattern[str]
+    default_locale: str
+    fallback_locale: str
+    available_locales: Tuple[str, ...]
+
 class ConfigManager:
     """Handles program configuration settings."""
     
@@ -130,35 +203,182 @@ class ConfigManager:
     def __init__(self, config_path: Optional[str] = None):
         """Initialize configuration manager."""
         self.config_path = config_path
-        self.config = self._load_config()
+        self.snapshot = self._snapshot_from_merged(self._load_config())
     
-    def _load_config(self) -> Dict:
+    @property
+    def config(self) -> Mapping[str, Any]:
+        """Read-only view of the current merged configuration."""
+        return self.snapshot.raw
+    
+    def reload(self) -> ConfigSnapshot:
+        """
+        Reload configuration and atomically swap in a new snapshot.
+        
+        The previous snapshot stays active if the file cannot be read or
+        parsed, or if the new configuration fails validation.
+        
+        Returns:
+            ConfigSnapshot: Newly active snapshot
+            
+        Raises:
+            ValueError: If the config file is unreadable or invalid
+        """
+        snapshot = self._snapshot_from_merged(self._load_config(strict=True))
+        self.snapshot = snapshot
+        return snapshot
+    
+    def _load_config(self, strict: bool = False) -> Dict:
         """
         Load configuration from file or use defaults.
         
+        Args:
+            strict: Raise instead of falling back to defaults when the
+                config file is missing, unreadable or not a JSON object
+        
         Returns:
-            Dict: Configuration dictionary
+            Dict: Configuration merged over DEFAULT_CONFIG
+            
+        Raises:
+            ValueError: If strict and the config file cannot be used
         """
-        if self.config_path and Path(self.config_path).exists():
+        if self.config_path and (strict or Path(self.config_path).exists()):
             try:
                 with open(self.config_path, 'r') as f:
-                    return {**self.DEFAULT_CONFIG, **json.load(f)}
-            except json.JSONDecodeError:
+                    data = json.load(f)
+                if not isinstance(data, Mapping):
+                    raise ValueError("expected a JSON object")
+                return self._deep_merge(self.DEFAULT_CONFIG, data)
+            except (OSError, ValueError) as e:
+                if strict:
+                    raise ValueError(f"Invalid config file {self.config_path}: {e}")
                 print(f"Warning: Invalid config file. Using defaults.")
-        return self.DEFAULT_CONFIG.copy()
+        return copy.deepcopy(self.DEFAULT_CONFIG)
+    
+    @classmethod
+    def _deep_merge(cls, base: Dict, override: Mapping) -> Dict:
+        """
+        Recursively merge override into a copy of base.
+        
+        Either side may be a read-only snapshot view (MappingProxyType),
+        which deepcopy cannot handle, so mappings are rebuilt as dicts.
+        
+        Args:
+            base: Default values
+            override: Values taking precedence
+            
+        Returns:
+            Dict: New merged dictionary sharing no mutable state with inputs
+        """
+        merged = {key: cls._thaw(value) for key, value in base.items()}
+        for key, value in override.items():
+            section = merged.get(key)
+            if isinstance(value, Mapping) and isinstance(section, dict):
+                merged[key] = cls._deep_merge(section, value)
+            else:
+                merged[key] = cls._thaw(value)
+        return merged
+    
+    @classmethod
+    def _thaw(cls, value: Any) -> Any:
+        """Recursively copy a value into plain, mutable dicts and lists."""
+        if isinstance(value, Mapping):
+            return {k: cls._thaw(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [cls._thaw(v) for v in value]
+        return copy.deepcopy(value)
+    
+    @classmethod
+    def _freeze(cls, value: Any) -> Any:
+        """Recursively convert dicts and lists to read-only equivalents."""
+        if isinstance(value, dict):
+            return MappingProxyType({k: cls._freeze(v) for k, v in value.items()})
+        if isinstance(value, list):
+            return tuple(cls._freeze(v) for v in value)
+        return value
+    
+    @classmethod
+    def build_snapshot(cls, config: Mapping[str, Any]) -> ConfigSnapshot:
+        """
+        Validate a configuration and build its frozen snapshot.
+        
+        Missing sections are filled from DEFAULT_CONFIG.
+        
+        Args:
+            config: Configuration dictionary
+            
+        Returns:
+            ConfigSnapshot: Validated snapshot
+            
+        Raises:
+            ValueError: If the configuration is invalid
+        """
+        return cls._snapshot_from_merged(cls._deep_merge(cls.DEFAULT_CONFIG, config))
+    
+    @classmethod
+    def _snapshot_from_merged(cls, merged: Dict[str, Any]) -> ConfigSnapshot:
+        """Validate an already merged configuration and freeze it."""
+        validation = merged["name_validation"]
+        if not isinstance(validation, dict):
+            raise ValueError("name_validation must be an object")
+        for field_name in ("greeting_style", "default_locale", "fallback_locale"):
+            if not isinstance(merged[field_name], str):
+                raise ValueError(f"{field_name} must be a string")
+        if not isinstance(merged.get("output", {}), dict):
+            raise ValueError("output must be an object")
+        if not isinstance(validation["allowed_chars"], str):
+            raise ValueError("allowed_chars must be a string")
+        if not isinstance(merged["available_locales"], list) or \
+                not all(isinstance(locale, str) for locale in merged["available_locales"]):
+            raise ValueError("available_locales must be a list of locale codes")
+        min_length = validation["min_length"]
+        max_length = validation["max_length"]
+        # bool is an int subclass, but True/False are not length limits
+        if any(isinstance(limit, bool) or not isinstance(limit, int)
+               for limit in (min_length, max_length)):
+            raise ValueError("Name length limits must be integers")
+        if min_length < 0 or max_length < min_length:
+            raise ValueError(
+                f"Invalid name length range: {min_length}-{max_length}"
+            )
+        try:
+            name_pattern = re.compile(validation["allowed_chars"])
+        except re.error as e:
+            raise ValueError(f"Invalid allowed_chars pattern: {e}")
+        
+        default_locale = merged["default_locale"]
+        fallback_locale = merged["fallback_locale"]
+        # Resolved list always contains the default and fallback locales
+        locales = [default_locale, *merged["available_locales"], fallback_locale]
+        available_locales = tuple(dict.fromkeys(locales))
+        
+        return ConfigSnapshot(
+            raw=cls._freeze(merged),
+            greeting_style=merged["greeting_style"],
+            min_length=min_length,
+            max_length=max_length,
+            allowed_chars=validation["allowed_chars"],
+            name_pattern=name_pattern,
+            default_locale=default_locale,
+            fallback_locale=fallback_locale,
+            available_locales=available_locales
+        )
 
 class NameValidator:
     """Handles input name validation."""
     
-    def __init__(self, config: Dict, locale_manager: LocaleManager):
+    def __init__(self, config: Union[Mapping, ConfigSnapshot],
+                 locale_manager: LocaleManager):
         """
         Initialize validator with configuration.
         
         Args:
-            config: Configuration dictionary containing validation rules
+            config: Configuration dictionary or snapshot containing validation rules
             locale_manager: LocaleManager instance for error messages
         """
-        self.config = config["name_validation"]
+        if not isinstance(config, ConfigSnapshot):
+            config = ConfigManager.build_snapshot(config)
+        self.snapshot = config
+        self.config = config.raw["name_validation"]
         self.locale_manager = locale_manager
     
     def validate(self, name: str, locale: Optional[str] = None) -> str:
@@ -175,6 +395,9 @@ class NameValidator:
         Raises:
             ValueError: If name is invalid
         """
+        # NFKC folds canonical and width variants (e.g. "Ｊｏｈｎ") into one form
+        if not name.isascii():
+            name = unicodedata.normalize('NFKC', name)
         name = name.strip()
         
         if not name:
@@ -182,25 +405,26 @@ class NameValidator:
                 self.locale_manager.get_text("errors.empty_name", locale=locale)
             )
             
-        if len(name) < self.config["min_length"]:
+        snapshot = self.snapshot
+        if len(name) < snapshot.min_length:
             raise ValueError(
                 self.locale_manager.get_text(
                     "errors.name_too_short",
                     locale=locale,
-                    min_length=self.config["min_length"]
+                    min_length=snapshot.min_length
                 )
             )
             
-        if len(name) > self.config["max_length"]:
+        if len(name) > snapshot.max_length:
             raise ValueError(
                 self.locale_manager.get_text(
                     "errors.name_too_long",
                     locale=locale,
-                    max_length=self.config["max_length"]
+                    max_length=snapshot.max_length
                 )
             )
             
-        if not re.match(self.config["allowed_chars"], name):
+        if not snapshot.name_pattern.match(name):
             raise ValueError(
                 self.locale_manager.get_text("errors.invalid_chars", locale=locale)
             )
@@ -210,36 +434,51 @@ class NameValidator:
 class GreetingGenerator:
     """Generates formatted greetings."""
     
-    def __init__(self, config: Dict, locale_manager: LocaleManager):
+    def __init__(self, config: Dict, locale_manager: LocaleManager,
+                 cache: Optional[Any] = None,
+                 trace_recorder: Optional[Any] = None):
         """
         Initialize generator with configuration.
         
         Args:
             config: Configuration dictionary containing greeting settings
             locale_manager: LocaleManager instance for translations
+            cache: Optional RenderCache for fully-resolved greetings
+            trace_recorder: Optional TraceRecorder sampling greeting calls
         """
         self.config = config
         self.locale_manager = locale_manager
+        self.cache = cache
+        self.trace_recorder = trace_recorder
     
-    def _get_time_greeting(self, locale: Optional[str] = None) -> str:
+    def _get_time_key(self) -> str:
+        """
+        Get the translation key for the current time bucket.
+        
+        Returns:
+            str: Time greeting translation key
+        """
+        hour = datetime.now().hour
+        if hour < 12:
+            return "time_greetings.morning"
+        elif hour < 17:
+            return "time_greetings.afternoon"
+        return "time_greetings.evening"
+    
+    def _get_time_greeting(self, locale: Optional[str] = None,
+                           key: Optional[str] = None) -> str:
         """
         Get time-appropriate greeting.
         
         Args:
             locale: Optional locale for greeting
+            key: Optional precomputed time greeting key
             
         Returns:
             str: Time-based greeting prefix
         """
-        hour = datetime.now().hour
-        if hour < 12:
-            key = "time_greetings.morning"
-        elif hour < 17:
-            key = "time_greetings.afternoon"
-        else:
-            key = "time_greetings.evening"
-        
-        return self.locale_manager.get_text(key, locale=locale)
+        return self.locale_manager.get_text(key or self._get_time_key(),
+                                            locale=locale)
     
     def create_greeting(self, name: str, style: Optional[str] = None,
                        locale: Optional[str] = None) -> str:
@@ -254,21 +493,52 @@ class GreetingGenerator:
         Returns:
             str: Formatted greeting string
         """
+        recorder = self.trace_recorder
+        if recorder is not None and recorder.should_sample():
+            start = time.perf_counter_ns()
+            greeting = self._create_greeting(name, style, locale)
+            recorder.record("greeting", style or "", locale, {"name": name},
+                            time.perf_counter_ns() - start)
+            return greeting
+        return self._create_greeting(name, style, locale)
+    
+    def _create_greeting(self, name: str, style: Optional[str],
+                         locale: Optional[str]) -> str:
+        """Build a greeting, using the render cache when configured."""
         style = style or self.config["greeting_style"]
+        # Resolve the default so per-locale invalidation also covers it
+        locale = locale or self.locale_manager.default_locale
+        # Time greetings are keyed by bucket so they roll over correctly
+        time_key = self._get_time_key() if style == "time" else None
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(
+                "greeting", locale, name, style, time_key
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         template = self.locale_manager.get_text(
             f"greeting_templates.{style}",
             locale=locale
         )
         
         if style == "time":
-            return template.format(
-                time_greeting=self._get_time_greeting(locale),
+            greeting = template.format(
+                time_greeting=self._get_time_greeting(locale, time_key),
                 name=name
             )
-        return template.format(name=name)
+        else:
+            greeting = template.format(name=name)
+        
+        if cache_key is not None:
+            self.cache.put(cache_key, greeting)
+        return greeting
 
 def get_user_name(validator: NameValidator, locale_manager: LocaleManager,
-                  locale: Optional[str] = None) -> str:
+                  locale: Optional[str] = None,
+                  writer: Optional[BufferedWriter] = None) -> str:
     """
     Get and validate user name from input.
     
@@ -276,14 +546,56 @@ def get_user_name(validator: NameValidator, locale_manager: LocaleManager,
         validator: NameValidator instance
         locale_manager: LocaleManager instance
         locale: Optional locale for prompts and errors
+        writer: Output writer for prompts and errors (default: stdout)
         
     Returns:
         str: Validated name string
     """
+    writer = writer or BufferedWriter()
     while True:
         try:
             prompt = locale_manager.get_text("prompts.enter_name", locale=locale)
-            name = input(f"{prompt}: ")
+            writer.write(f"{prompt}: ")
+            # The prompt must be visible before input() blocks
+            writer.flush()
+            name = input()
             return validator.validate(name, locale=locale)
         except ValueError as e:
-            print(e)
\ No newline at end of file
+            writer.writeline(str(e))
+
+def main(config_path: Optional[str] = None, locale_dir: str = "locales",
+         writer: Optional[BufferedWriter] = None):
+    """
+    Main program flow.
+    
+    All output goes through a BufferedWriter, flushed once at exit.
+    The default stdout writer takes its flush policy from the "output"
+    configuration section when one is given.
+    
+    Args:
+        config_path: Optional path to configuration file
+        locale_dir: Locale directory, bundle or compiled catalog
+        writer: Optional output writer (default: stdout)
+    """
+    configure_writer = writer is None
+    writer = writer or BufferedWriter()
+    try:
+        config_manager = ConfigManager(config_path)
+        if configure_writer and "output" in config_manager.config:
+            writer.policy = FlushPolicy.from_config(config_manager.config)
+        locale_manager = LocaleManager(locale_dir, config_manager.config)
+        validator = NameValidator(config_manager.snapshot, locale_manager)
+        generator = GreetingGenerator(config_manager.config, locale_manager)
+        
+        name = get_user_name(validator, locale_manager, writer=writer)
+        writer.writeline(generator.create_greeting(name))
+        
+    except KeyboardInterrupt:
+        writer.writeline("\nProgram terminated by user")
+    except Exception as e:
+        writer.writeline(f"An unexpected error occurred: {e}")
+    finally:
+        writer.close()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Catalog Compiler
+Version 1.0
+Test coverage for catalog linting and the compiled catalog artifact
+"""
+
+import unittest
+import json
+import shutil
+import tempfile
+from pathlib import Path
+from catalog_compiler_v1_0 import CatalogCompiler
+from locale_manager_v1_5 import LocaleManager
+from test_locale_manager import TEST_METADATA
+
+class TestCatalogCompiler(unittest.TestCase):
+    """Test cases for the catalog linter and compiled artifact."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.locale_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.locale_dir)
+        self.write_json("metadata.json", {
+            locale: TEST_METADATA[locale] for locale in ("en", "es")
+        })
+        self.write_json("en.json", {
+            "greeting_templates": {"default": "Hello {name}"},
+            "errors": {"name_too_long": "Name cannot exceed {max_length} characters"},
+            "reports": {"names": "{count, plural, one {# name} other {# names}}"}
+        })
+        self.write_json("es.json", {
+            "greeting_templates": {"default": "Hola {name}"},
+            "errors": {"name_too_long": "El nombre no puede exceder los {max_length} caracteres"},
+            "reports": {"names": "{count, plural, =0 {Sin nombres} one {# nombre} other {# nombres}}"}
+        })
+
+    def write_json(self, filename, data):
+        """Write a JSON file into the locale directory."""
+        with open(self.locale_dir / filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+
+    def test_valid_catalog_compiles_and_loads(self):
+        """Test a valid catalog compiles and LocaleManager loads the artifact."""
+        artifact = self.locale_dir / "build" / "catalog.json"
+        report = CatalogCompiler(str(self.locale_dir)).compile(str(artifact))
+        self.assertTrue(report.ok, report.errors)
+        manager = LocaleManager(str(artifact), {"default_locale": "en", "fallback_locale": "en"})
+        self.assertEqual(manager.get_text("greeting_templates.default", locale="es", name="Ana"),
+                         "Hola Ana")
+        self.assertEqual(manager.get_text("reports.names", locale="es", count=0), "Sin nombres")
+
+    def test_missing_key_blocks_compile(self):
+        """Test a missing key is an error and no artifact is written."""
+        self.write_json("es.json", {"greeting_templates": {"default": "Hola {name}"}})
+        artifact = self.locale_dir / "catalog.json"
+        report = CatalogCompiler(str(self.locale_dir)).compile(str(artifact))
+        self.assertFalse(report.ok)
+        self.assertEqual(report.locales["es"].missing_keys,
+                         ["errors.name_too_long", "reports.names"])
+        self.assertFalse(artifact.exists())
+
+    def test_placeholder_mismatch(self):
+        """Test a renamed placeholder is reported."""
+        self.write_json("es.json", {
+            "greeting_templates": {"default": "Hola {nombre}"},
+            "errors": {"name_too_long": "El nombre no puede exceder los {max_length} caracteres"},
+            "reports": {"names": "{count, plural, one {# nombre} other {# nombres}}"}
+        })
+        report = CatalogCompiler(str(self.locale_dir)).lint()
+        self.assertEqual(report.locales["es"].placeholder_mismatches,
+                         {"greeting_templates.default": (["name"], ["nombre"])})
+
+    def test_icu_message_arguments(self):
+        """Test plural messages are linted by their arguments, not rejected."""
+        report = CatalogCompiler(str(self.locale_dir)).lint()
+        self.assertTrue(report.ok, report.errors)
+        self.write_json("es.json", {
+            "greeting_templates": {"default": "Hola {name}"},
+            "errors": {"name_too_long": "El nombre no puede exceder los {max_length} caracteres"},
+            "reports": {"names": "{total, plural, one {# nombre} other {# nombres}}"}
+        })
+        report = CatalogCompiler(str(self.locale_dir)).lint()
+        self.assertEqual(report.locales["es"].placeholder_mismatches,
+                         {"reports.names": (["count"], ["total"])})
+
+    def test_plural_categories_checked_against_rules(self):
+        """Test plural branches are compared with the locale's plural_rules."""
+        self.write_json("es.json", {
+            "greeting_templates": {"default": "Hola {name}"},
+            "errors": {"name_too_long": "El nombre no puede exceder los {max_length} caracteres"},
+            "reports": {"names": "{count, plural, few {# nombres} other {# nombres}}"}
+        })
+        report = CatalogCompiler(str(self.locale_dir)).lint()
+        self.assertEqual(report.warnings, [
+            "es: plural count in reports.names lacks categories ['one']",
+            "es: plural count in reports.names uses unknown categories ['few']"
+        ])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Context Packer
+Version 1.0
+Test coverage for context bundle planning and atomic artifact writes
+"""
+
+import unittest
+import json
+import shutil
+import tempfile
+from pathlib import Path
+from artifact_files_v1_0 import write_json_atomic
+from context_packer_v1_0 import CHANGED, CORE, CURRENT, DEPENDENCY, ContextPacker
+from interface_diff_v1_0 import InterfaceDiffer
+
+PACKER_SOURCES = {
+    "app_v1.0.py": "from helper_v1_0 import helper\n",
+    "app-v1.1.py": "from helper_v1_0 import helper\n\ndef run():\n    return helper()\n",
+    "helper-v1.0.py": "def helper():\n    return 1\n",
+    "widget-v1.0.py": "class Widget:\n    pass\n",
+    "plugin-v1.0.py": "from helper_v1_0 import helper\n",
+    "aaa-lib-v1.0.py": "def unrelated():\n    pass\n",
+    "tool-v1.0.py": "from toolutil_v1_0 import util\n\nif __name__ == '__main__':\n    util()\n",
+    "toolutil-v1.0.py": "def util():\n    pass\n",
+    "test-app.py": "from app_v1_1 import run\n",
+}
+
+PACKER_SUMMARY = """# Session Summary: Widgets
+Session ID: SESSION_002
+
+### Artifact Relationships
+- app-v1.1.py - Main program
+
+### Current Interface Definition
+```python
+class Widget:
+    pass
+```
+"""
+
+class TestContextPacker(unittest.TestCase):
+    """Test cases for context bundle planning."""
+
+    def setUp(self):
+        """Set up a project with a main program, a library, a tool and a test."""
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root)
+        (self.root / "src").mkdir()
+        for name, text in PACKER_SOURCES.items():
+            (self.root / "src" / name).write_text(text, encoding='utf-8')
+        (self.root / "requirements-doc-v1.md").write_text("# Requirements\n", encoding='utf-8')
+        (self.root / "Session_summary_002.md").write_text(PACKER_SUMMARY, encoding='utf-8')
+
+    def test_ranking_and_exclusions(self):
+        """Test tiers, reachability ranking and excluded tools and tests."""
+        plan = ContextPacker(str(self.root)).plan(100_000)
+        self.assertEqual([(item["tier"], item["path"]) for item in plan.included], [
+            (CORE, "requirements-doc-v1.md"),
+            (CORE, "Session_summary_002.md"),
+            (CHANGED, "src/app-v1.1.py"),
+            (CHANGED, "src/widget-v1.0.py"),
+            (DEPENDENCY, "src/helper-v1.0.py"),
+            (CURRENT, "src/plugin-v1.0.py"),
+            (CURRENT, "src/aaa-lib-v1.0.py"),
+        ])
+        self.assertEqual(plan.excluded, ["src/test-app.py", "src/tool-v1.0.py",
+                                         "src/toolutil-v1.0.py"])
+        self.assertEqual(plan.trimmed, {"src/app_v1.0.py": "src/app-v1.1.py"})
+
+    def test_tool_caches_not_packed(self):
+        """Test hidden files such as the interface-diff cache are not candidates."""
+        src = self.root / "src"
+        differ = InterfaceDiffer(str(src))
+        differ.summary("app-v1.1.py")
+        differ.save()
+        (src / ".notes.md").write_text("# Notes\n", encoding='utf-8')
+        packer = ContextPacker(str(self.root), cache_path=str(src / ".context-pack-cache.json"))
+        plan = packer.plan(100_000)
+        self.assertTrue((src / ".interface-cache.json").is_file())
+        packed = [item["path"] for item in plan.included] + plan.skipped + plan.excluded
+        self.assertFalse([path for path in packed if Path(path).name.startswith(".")])
+        self.assertIn("src/app-v1.1.py", packed)
+
+    def test_budget_keeps_interface_sources(self):
+        """Test a tight budget packs recorded interfaces before other sources."""
+        included = [item["path"] for item in ContextPacker(str(self.root)).plan(40).included]
+        self.assertIn("src/widget-v1.0.py", included)
+        self.assertNotIn("src/aaa-lib-v1.0.py", included)
+
+    def test_write_json_atomic_keeps_old_file(self):
+        """Test a failed write leaves the previous file and no temporary file."""
+        path = self.root / "cache" / "data.json"
+        write_json_atomic(path, {"version": 1})
+        with self.assertRaises(TypeError):
+            write_json_atomic(path, {"version": object()})
+        self.assertEqual(json.loads(path.read_text(encoding='utf-8')), {"version": 1})
+        self.assertEqual([p.name for p in path.parent.iterdir()], ["data.json"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,10 +8,23 @@ Added comprehensive testing for internationalization features
 
 import unittest
 from unittest.mock import patch, mock_open, MagicMock
+import io
 import json
+import shutil
+import tempfile
+import zipfile
 from datetime import datetime
 from pathlib import Path
-from simple_io_v1_3 import ConfigManager, NameValidator, GreetingGenerator, LocaleManager
+from simple_io_v1_3 import (
+    ConfigManager, NameValidator, GreetingGenerator, LocaleManager, get_user_name
+)
+from render_cache_v1_0 import RenderCache
+from output_writer_v1_0 import BufferedWriter, FlushPolicy
+from catalog_store_v1_0 import MemoryStore
+from name_normalizer_v1_0 import NameDeduplicator
+from bulk_greeting_v1_0 import (
+    BulkGreeter, EMPTY, INVALID_CHARS, OK, TOO_LONG, TOO_SHORT, np
+)
 
 class TestLocaleManager(unittest.TestCase):
     """Test cases for LocaleManager class."""
@@ -45,23 +58,12 @@ class TestLocaleManager(unittest.TestCase):
             "available_locales": ["en", "es"]
         }
         
-        # Mock file system for locale files
-        self.mock_file_system = {
-            "locales/en.json": json.dumps(self.test_locales["en"]),
-            "locales/es.json": json.dumps(self.test_locales["es"])
-        }
+        # In-memory catalog store standing in for the locale directory
+        self.store = MemoryStore(self.test_locales)
     
-    @patch('builtins.open', new_callable=mock_open)
-    def test_load_translations(self, mock_file):
+    def test_load_translations(self):
         """Test loading of translation files."""
-        def mock_open_file(filename, *args, **kwargs):
-            mock = mock_open(read_data=self.mock_file_system.get(str(filename), ""))()
-            mock.name = str(filename)
-            return mock
-            
-        mock_file.side_effect = mock_open_file
-        
-        locale_manager = LocaleManager("locales", self.config)
+        locale_manager = LocaleManager(self.store, self.config)
         self.assertEqual(
             locale_manager.translations["en"]["greeting_templates"]["default"],
             "Hello {name}"
@@ -71,22 +73,17 @@ class TestLocaleManager(unittest.TestCase):
             "Hola {name}"
         )
     
-    @patch('builtins.open', new_callable=mock_open)
-    def test_missing_default_locale(self, mock_file):
+    def test_missing_default_locale(self):
         """Test handling of missing default locale file."""
         config = self.config.copy()
         config["default_locale"] = "fr"
         
         with self.assertRaises(ValueError):
-            LocaleManager("locales", config)
+            LocaleManager(self.store, config)
     
-    @patch('builtins.open', new_callable=mock_open)
-    def test_get_text_with_params(self, mock_file):
+    def test_get_text_with_params(self):
         """Test text retrieval with parameters."""
-        mock_file.side_effect = lambda f, *a, **k: mock_open(
-            read_data=self.mock_file_system.get(str(f), ""))()
-        
-        locale_manager = LocaleManager("locales", self.config)
+        locale_manager = LocaleManager(self.store, self.config)
         text = locale_manager.get_text(
             "greeting_templates.default",
             locale="en",
@@ -94,13 +91,9 @@ class TestLocaleManager(unittest.TestCase):
         )
         self.assertEqual(text, "Hello John")
     
-    @patch('builtins.open', new_callable=mock_open)
-    def test_fallback_behavior(self, mock_file):
+    def test_fallback_behavior(self):
         """Test fallback to default locale."""
-        mock_file.side_effect = lambda f, *a, **k: mock_open(
-            read_data=self.mock_file_system.get(str(f), ""))()
-        
-        locale_manager = LocaleManager("locales", self.config)
+        locale_manager = LocaleManager(self.store, self.config)
         
         # Test fallback for missing key
         text = locale_manager.get_text("nonexistent.key", locale="es")
@@ -113,6 +106,28 @@ class TestLocaleManager(unittest.TestCase):
             name="John"
         )
         self.assertEqual(text, "Hello John")
+    
+    def test_typed_placeholder(self):
+        """Test typed placeholders render without locale conventions."""
+        store = MemoryStore({"en": {"errors": {
+            "name_too_long": "Name cannot exceed {max_length:number:integer} characters"
+        }}})
+        locale_manager = LocaleManager(store, self.config)
+        self.assertEqual(locale_manager.get_text("errors.name_too_long", max_length=50),
+                         "Name cannot exceed 50 characters")
+    
+    def test_bundle_store(self):
+        """Test loading catalogs from a zip bundle."""
+        bundle = Path(tempfile.mkdtemp()) / "locales.zip"
+        self.addCleanup(shutil.rmtree, bundle.parent)
+        with zipfile.ZipFile(bundle, "w") as zf:
+            for locale, translations in self.test_locales.items():
+                zf.writestr(f"locales/{locale}.json", json.dumps(translations))
+        
+        locale_manager = LocaleManager(str(bundle), self.config)
+        self.assertEqual(locale_manager.get_text("greeting_templates.formal", locale="es",
+                                                 name="Ana"), "Estimado/a Ana:")
+        self.assertEqual(locale_manager.store.locales(), ["en", "es"])
 
 class TestNameValidatorWithI18n(unittest.TestCase):
     """Test cases for NameValidator with internationalization."""
@@ -152,6 +167,41 @@ class TestNameValidatorWithI18n(unittest.TestCase):
             min_length=2
         )
 
+    def test_width_variants_normalized(self):
+        """Test fullwidth input is normalized before validation."""
+        self.assertEqual(self.validator.validate("Ｊｏｈｎ"), "John")
+
+class TestNameDeduplicator(unittest.TestCase):
+    """Test cases for the normalize-and-dedupe pre-stage."""
+    
+    def test_equivalent_names_deduped(self):
+        """Test NFC/NFD, width and case variants collapse to one name."""
+        names = ["José", "Jose\u0301", "ＪＯＳÉ", "  josé ", "Ana", "ana"]
+        dedup = NameDeduplicator()
+        self.assertEqual(list(dedup.process(names)), ["José", "Ana"])
+        self.assertEqual(dedup.stats.duplicates, 4)
+        self.assertAlmostEqual(dedup.stats.dedupe_ratio, 4 / 6)
+    
+    def test_bounded_window(self):
+        """Test the exact set forgets the oldest keys beyond max_entries."""
+        dedup = NameDeduplicator(max_entries=2)
+        self.assertEqual(list(dedup.process(["A1", "B2", "C3", "A1"])), ["A1", "B2", "C3", "A1"])
+    
+    def test_window_far_past_limit(self):
+        """Test the window keeps exactly the newest keys after many evictions."""
+        dedup = NameDeduplicator(max_entries=1000)
+        names = [f"Name{i}" for i in range(50_000)]
+        self.assertEqual(len(list(dedup.process(names))), 50_000)
+        self.assertEqual(len(dedup._seen), 1000)
+        self.assertEqual(list(dedup.process(["Name49999", "Name49000", "Name48999"])),
+                         ["Name48999"])
+    
+    def test_bloom_filter_mode(self):
+        """Test Bloom filter mode drops repeats."""
+        dedup = NameDeduplicator(bloom_capacity=1000)
+        names = [f"Name{i % 100}" for i in range(500)]
+        self.assertEqual(len(list(dedup.process(names))), 100)
+
 class TestGreetingGeneratorWithI18n(unittest.TestCase):
     """Test cases for GreetingGenerator with internationalization."""
     
@@ -188,6 +238,268 @@ class TestGreetingGeneratorWithI18n(unittest.TestCase):
         )
         self.assertEqual(greeting, "Buenos días Juan")
 
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestBulkGreeter(unittest.TestCase):
+    """Test cases for columnar validate-and-greet."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.config = {
+            "greeting_style": "default",
+            "name_validation": {
+                "min_length": 2,
+                "max_length": 8,
+                "allowed_chars": r"^[A-Za-z\s\-']+$"
+            }
+        }
+        templates = {"en": "Hello {name}", "es": "Hola {name}!"}
+        self.locale_manager = MagicMock()
+        self.locale_manager.get_text.side_effect = (
+            lambda key, locale=None, **kwargs: templates[locale or "en"]
+        )
+        self.greeter = BulkGreeter(
+            NameValidator(self.config, self.locale_manager),
+            GreetingGenerator(self.config, self.locale_manager)
+        )
+    
+    def test_error_codes_match_validator_order(self):
+        """Test each row gets the code of the first failing check."""
+        names, errors = self.greeter.validate(
+            ["John", "", "J", "Bartholomew", "R2D2", " Ｊｏｈｎ "]
+        )
+        self.assertEqual(errors.tolist(), [OK, EMPTY, TOO_SHORT, TOO_LONG, INVALID_CHARS, OK])
+        self.assertEqual(names[-1], "John")
+    
+    def test_grouped_greetings(self):
+        """Test greetings are built per (locale, style) group."""
+        result = self.greeter.process(
+            np.array(["Ana", "Juan", "x", "Eve"]), locales=["es", "es", "en", "en"]
+        )
+        self.assertEqual(result.greetings.tolist(), ["Hola Ana!", "Hola Juan!", "", "Hello Eve"])
+        self.assertEqual(result.valid_count, 3)
+        # One template lookup per group, not per row
+        self.assertEqual(self.locale_manager.get_text.call_count, 2)
+
+class TestConfigManager(unittest.TestCase):
+    """Test cases for ConfigManager snapshots."""
+    
+    def test_partial_override_deep_merges(self):
+        """Test partial name_validation overrides keep other defaults."""
+        override = json.dumps({"name_validation": {"max_length": 10}})
+        with patch('builtins.open', mock_open(read_data=override)), \
+                patch.object(Path, 'exists', return_value=True):
+            manager = ConfigManager("config.json")
+        self.assertEqual(manager.snapshot.max_length, 10)
+        self.assertEqual(manager.snapshot.min_length, 2)
+        self.assertIsNotNone(manager.snapshot.name_pattern.match("Anne-Marie"))
+        self.assertEqual(
+            ConfigManager.DEFAULT_CONFIG["name_validation"]["max_length"], 50
+        )
+    
+    def test_snapshot_is_frozen(self):
+        """Test snapshots cannot be mutated through the config view."""
+        manager = ConfigManager()
+        with self.assertRaises(TypeError):
+            manager.config["name_validation"]["min_length"] = 0
+        self.assertEqual(manager.snapshot.available_locales, ("en", "es", "fr"))
+    
+    def test_invalid_reload_keeps_snapshot(self):
+        """Test a failed reload leaves the previous snapshot active."""
+        manager = ConfigManager("config.json")
+        previous = manager.snapshot
+        bad = json.dumps({"name_validation": {"min_length": 9, "max_length": 3}})
+        with patch('builtins.open', mock_open(read_data=bad)), \
+                patch.object(Path, 'exists', return_value=True):
+            with self.assertRaises(ValueError):
+                manager.reload()
+        self.assertIs(manager.snapshot, previous)
+
+    def test_validator_accepts_frozen_config(self):
+        """Test the read-only config view can configure a validator."""
+        validator = NameValidator(ConfigManager().config, MagicMock())
+        self.assertEqual(validator.validate("Ana"), "Ana")
+
+    def test_config_merged_once(self):
+        """Test loading a config file deep-merges it a single time."""
+        override = json.dumps({"greeting_style": "formal"})
+        with patch('builtins.open', mock_open(read_data=override)), \
+                patch.object(Path, 'exists', return_value=True), \
+                patch.object(ConfigManager, '_deep_merge',
+                             wraps=ConfigManager._deep_merge) as merge:
+            manager = ConfigManager("config.json")
+        self.assertEqual(merge.call_count, 1)
+        self.assertEqual(manager.snapshot.greeting_style, "formal")
+
+    def test_corrupt_reload_keeps_snapshot(self):
+        """Test an unparsable or missing config file does not reset to defaults."""
+        override = json.dumps({"greeting_style": "formal"})
+        with patch('builtins.open', mock_open(read_data=override)), \
+                patch.object(Path, 'exists', return_value=True):
+            manager = ConfigManager("config.json")
+        previous = manager.snapshot
+        for data in ('{"greeting_style": ', '["formal"]'):
+            with patch('builtins.open', mock_open(read_data=data)), \
+                    patch.object(Path, 'exists', return_value=True):
+                with self.assertRaises(ValueError):
+                    manager.reload()
+        with patch('builtins.open', side_effect=FileNotFoundError("config.json")):
+            with self.assertRaises(ValueError):
+                manager.reload()
+        self.assertIs(manager.snapshot, previous)
+        self.assertEqual(manager.snapshot.greeting_style, "formal")
+
+    def test_field_types_validated(self):
+        """Test wrongly typed fields raise ValueError."""
+        for config in ({"available_locales": "en"}, {"available_locales": ["en", 1]},
+                       {"name_validation": None}, {"default_locale": 5},
+                       {"greeting_style": ["formal"]},
+                       {"name_validation": {"allowed_chars": None}}):
+            with self.assertRaises(ValueError, msg=config):
+                ConfigManager.build_snapshot(config)
+
+    def test_boolean_length_limit_rejected(self):
+        """Test True/False are not accepted as length limits."""
+        with self.assertRaises(ValueError):
+            ConfigManager.build_snapshot({"name_validation": {"min_length": True}})
+
+class TestRenderCache(unittest.TestCase):
+    """Test cases for RenderCache and cached greetings."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.cache = RenderCache(capacity=2)
+        self.locale_manager = MagicMock()
+        self.locale_manager.get_text.return_value = "Hola {name}"
+        self.locale_manager.default_locale = "es"
+        self.generator = GreetingGenerator(
+            {"greeting_style": "default"}, self.locale_manager, cache=self.cache
+        )
+    
+    def test_lru_eviction_and_stats(self):
+        """Test bounded capacity and hit-rate accounting."""
+        self.cache.put(("text", "en", "a"), "A")
+        self.cache.put(("text", "en", "b"), "B")
+        self.assertEqual(self.cache.get(("text", "en", "a")), "A")
+        self.cache.put(("text", "en", "c"), "C")
+        self.assertIsNone(self.cache.get(("text", "en", "b")))
+        stats = self.cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.evictions), (1, 1, 1))
+        self.assertEqual(stats.hit_rate, 0.5)
+    
+    def test_cached_greeting(self):
+        """Test repeated greetings skip translation lookups."""
+        self.assertEqual(self.generator.create_greeting("Juan", locale="es"), "Hola Juan")
+        self.assertEqual(self.generator.create_greeting("Juan", locale="es"), "Hola Juan")
+        self.assertEqual(self.locale_manager.get_text.call_count, 1)
+    
+    def test_invalidate_locale(self):
+        """Test per-locale invalidation."""
+        self.generator.create_greeting("Juan", locale="es")
+        self.assertEqual(self.cache.invalidate("fr"), 0)
+        self.assertEqual(self.cache.invalidate("es"), 1)
+        self.generator.create_greeting("Juan", locale="es")
+        self.assertEqual(self.locale_manager.get_text.call_count, 2)
+    
+    def test_default_locale_invalidated_by_code(self):
+        """Test greetings cached for the default locale are keyed by its code."""
+        self.generator.create_greeting("Juan")
+        self.assertEqual(self.cache.invalidate("es"), 1)
+    
+    def test_reload_invalidates_cache(self):
+        """Test reloading a locale drops its cached greetings."""
+        store = MemoryStore({"en": {"greeting_templates": {"default": "Hello {name}"}},
+                             "es": {"greeting_templates": {"default": "Hola {name}"}}})
+        manager = LocaleManager(store, {"default_locale": "en", "available_locales": ["en", "es"]},
+                                render_cache=self.cache)
+        generator = GreetingGenerator({"greeting_style": "default"}, manager, cache=self.cache)
+        self.assertEqual(generator.create_greeting("Juan", locale="es"), "Hola Juan")
+        store._files["es.json"] = {"greeting_templates": {"default": "¡Hola {name}!"}}
+        manager.reload_locale("es")
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(generator.create_greeting("Juan", locale="es"), "¡Hola Juan!")
+    
+    def test_time_greeting_keyed_by_bucket(self):
+        """Test time greetings are cached per time bucket."""
+        self.locale_manager.get_text.side_effect = (
+            lambda key, locale=None: "{time_greeting} {name}"
+            if key.startswith("greeting_templates") else key
+        )
+        with patch.object(self.generator, "_get_time_key",
+                          return_value="time_greetings.morning"):
+            morning = self.generator.create_greeting("Juan", style="time")
+        with patch.object(self.generator, "_get_time_key",
+                          return_value="time_greetings.evening"):
+            evening = self.generator.create_greeting("Juan", style="time")
+        self.assertEqual(morning, "time_greetings.morning Juan")
+        self.assertEqual(evening, "time_greetings.evening Juan")
+
+class TestBufferedWriter(unittest.TestCase):
+    """Test cases for BufferedWriter flush policies."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.sink = io.StringIO()
+    
+    def test_flush_on_size(self):
+        """Test output is held until max_chars is reached."""
+        writer = BufferedWriter(self.sink, FlushPolicy(max_chars=8))
+        writer.writeline("abc")
+        self.assertEqual(self.sink.getvalue(), "")
+        writer.writeline("defg")
+        self.assertEqual(self.sink.getvalue(), "abc\ndefg\n")
+        self.assertEqual(writer.bytes_written, 9)
+    
+    def test_flush_on_newline(self):
+        """Test a line-buffered writer flushes complete lines only."""
+        writer = BufferedWriter(self.sink, FlushPolicy.line_buffered())
+        writer.write("Hola ")
+        self.assertEqual(self.sink.getvalue(), "")
+        writer.writeline("Ana")
+        self.assertEqual(self.sink.getvalue(), "Hola Ana\n")
+    
+    def test_flush_on_interval(self):
+        """Test a write after max_delay flushes the pending chunk."""
+        with patch("output_writer_v1_0.time.monotonic", side_effect=[0.0, 0.5, 2.0, 2.0]):
+            writer = BufferedWriter(self.sink, FlushPolicy(max_delay=1.0))
+            writer.writeline("a")
+            self.assertEqual(self.sink.getvalue(), "")
+            writer.writeline("b")
+        self.assertEqual(self.sink.getvalue(), "a\nb\n")
+    
+    def test_close_flushes_and_rejects_writes(self):
+        """Test close flushes, is idempotent and leaves the sink open."""
+        writer = BufferedWriter(self.sink, FlushPolicy())
+        with writer:
+            writer.writeline("pending")
+            self.assertEqual(self.sink.getvalue(), "")
+        self.assertEqual(self.sink.getvalue(), "pending\n")
+        writer.close()
+        self.assertFalse(self.sink.closed)
+        with self.assertRaises(ValueError):
+            writer.write("late")
+    
+    def test_policy_from_config(self):
+        """Test the "output" config section overrides only the keys it sets."""
+        self.assertEqual(FlushPolicy.from_config({}), FlushPolicy())
+        policy = FlushPolicy.from_config({"output": {"flush_every": 10,
+                                                     "flush_on_newline": True}})
+        self.assertEqual(policy, FlushPolicy(max_records=10, flush_on_newline=True))
+        with self.assertRaises(ValueError):
+            FlushPolicy.from_config({"output": 64})
+        with self.assertRaises(ValueError):
+            ConfigManager.build_snapshot({"output": 64})
+    
+    def test_get_user_name_writes_through_writer(self):
+        """Test prompts and validation errors go through the writer."""
+        locale_manager = MagicMock()
+        locale_manager.get_text.return_value = "Name"
+        validator = MagicMock()
+        validator.validate.side_effect = [ValueError("Too short"), "Ana"]
+        writer = BufferedWriter(self.sink, FlushPolicy())
+        with patch("builtins.input", side_effect=["A", "Ana"]):
+            self.assertEqual(get_user_name(validator, locale_manager, writer=writer), "Ana")
+        self.assertEqual(self.sink.getvalue(), "Name: Too short\nName: ")
+
 def main():
     """Run the test suite."""
     unittest.main()
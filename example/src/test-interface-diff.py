@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Interface Diff
+Version 1.0
+Test coverage for interface summaries, compatibility rules and the cache
+"""
+
+import unittest
+import json
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+from interface_diff_v1_0 import (
+    InterfaceDiffer, diff_summaries, interface_updates_markdown, summarize_source
+)
+
+SOURCE_DIR = Path(__file__).resolve().parent
+
+class TestInterfaceDiff(unittest.TestCase):
+    """Test cases for interface summaries and diffs."""
+
+    def setUp(self):
+        """Set up a directory with two versions of a module."""
+        self.source_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.source_dir)
+        (self.source_dir / "greeter-v1.0.py").write_text(
+            "def greet(name):\n    pass\n\ndef _helper():\n    pass\n", encoding='utf-8')
+        (self.source_dir / "greeter-v1.1.py").write_text(
+            "def greet(name, style='default'):\n    pass\n\n"
+            "class Greeter:\n    def run(self) -> str:\n        pass\n", encoding='utf-8')
+
+    def assert_compatible(self, before, after, compatible):
+        """Diff two one-function sources and check the verdict."""
+        diff = diff_summaries(summarize_source(before), summarize_source(after))
+        self.assertEqual(diff["compatible"], compatible, f"{before!r} -> {after!r}")
+        return diff
+
+    def test_get_text_fallback_chain_added(self):
+        """Test LocaleManager.get_text gained an optional fallback_chain."""
+        diff = InterfaceDiffer(str(SOURCE_DIR), str(self.source_dir / "cache.json")).diff(
+            "simple-io-v1.3.py", "locale-manager-v1.5.py")
+        change = next(c for c in diff["changed"] if c["name"] == "LocaleManager.get_text")
+        self.assertEqual([p["name"] for p in change["parameters_added"]], ["fallback_chain"])
+        self.assertTrue(change["compatible"])
+
+    def test_breaking_parameter_rules(self):
+        """Test which parameter changes break existing callers."""
+        self.assert_compatible("def f(a): pass", "def f(a, b=1): pass", True)
+        self.assert_compatible("def f(a): pass", "def f(a, *args, **kwargs): pass", True)
+        self.assert_compatible("def f(a, *, b): pass", "def f(a, **kwargs): pass", True)
+        self.assert_compatible("def f(a, b): pass", "def f(a, **kwargs): pass", False)
+        self.assert_compatible("def f(a): pass", "def f(a, b): pass", False)
+        self.assert_compatible("def f(a, b): pass", "def f(a): pass", False)
+        self.assert_compatible("def f(a, b): pass", "def f(b, a): pass", False)
+        self.assert_compatible("def f(a=1): pass", "def f(a): pass", False)
+        self.assert_compatible("def f(a, b=1): pass", "def f(a, *, b=1): pass", False)
+        diff = self.assert_compatible("def f(a): pass", "", False)
+        self.assertEqual([entry["name"] for entry in diff["removed"]], ["f"])
+
+    def test_cache_reused_and_pruned(self):
+        """Test summaries and diffs come from the cache, and deleted sources are dropped."""
+        differ = InterfaceDiffer(str(self.source_dir))
+        expected = differ.diff("greeter-v1.0.py", "greeter-v1.1.py")
+        differ.save()
+        with patch("interface_diff_v1_0.summarize_source", side_effect=AssertionError):
+            differ = InterfaceDiffer(str(self.source_dir))
+            self.assertEqual(differ.diff("greeter-v1.0.py", "greeter-v1.1.py"), expected)
+            self.assertEqual(differ.history("greeter"), [expected])
+
+        (self.source_dir / "greeter-v1.0.py").unlink()
+        differ.save()
+        with open(self.source_dir / ".interface-cache.json", encoding='utf-8') as f:
+            cache = json.load(f)
+        self.assertEqual([Path(key).name for key in cache["files"]], ["greeter-v1.1.py"])
+        self.assertEqual(len(cache["summaries"]), 1)
+        self.assertEqual(cache["diffs"], {})
+
+    def test_markdown(self):
+        """Test the Interface Updates section lists additions and changes."""
+        differ = InterfaceDiffer(str(self.source_dir))
+        diff = differ.diff("greeter-v1.0.py", "greeter-v1.1.py")
+        self.assertTrue(diff["compatible"])
+        markdown = interface_updates_markdown(diff, differ.summary("greeter-v1.1.py"))
+        self.assertIn("# greeter-v1.1.py\ndef greet(name, style='default')\n\nclass Greeter:\n"
+                      "    def run(self) -> str\n```", markdown)
+        self.assertIn("- Added class `Greeter`\n", markdown)
+        self.assertIn("- Modified `greet`: added `style`\n", markdown)
+        self.assertTrue(markdown.endswith("- Backward compatible\n"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Key Usage
+Version 1.0
+Test coverage for static key analysis and trimmed catalog output
+"""
+
+import unittest
+import contextlib
+import io
+import json
+from key_usage_v1_0 import main as key_usage_main, scan_sources, trim_catalog
+from test_locale_manager import TEST_LOCALES, LocaleDirTestCase
+
+KEY_USAGE_SOURCE = """
+TOTAL_KEY = "reports.total"
+
+class Greeter:
+    def greet(self, manager, style, name, key=None):
+        manager.get_text("errors.name_too_long", max_length=5)
+        manager.get_text(f"greeting_templates.{style}", name=name)
+        return manager.get_text(key or self._get_time_key(), name=name)
+"""
+
+class TestKeyUsage(LocaleDirTestCase):
+    """Test cases for static key usage analysis."""
+
+    def setUp(self):
+        """Write a fixture source using exact, prefix and dynamic keys."""
+        super().setUp()
+        self.source = self.locale_dir / "app" / "greeter.py"
+        self.source.parent.mkdir()
+        self.source.write_text(KEY_USAGE_SOURCE, encoding='utf-8')
+
+    def test_scan_sources(self):
+        """Test literal keys, f-string prefixes and dynamic expressions are told apart."""
+        usage = scan_sources([str(self.source.parent)])
+        self.assertEqual(usage.exact, {"errors.name_too_long"})
+        self.assertEqual(usage.prefixes, {"greeting_templates."})
+        self.assertIn("reports.total", usage.literals)
+        self.assertEqual(usage.dynamic,
+                         [(str(self.source), 8, "key or self._get_time_key()")])
+
+        trimmed = trim_catalog(TEST_LOCALES["es"], usage)
+        self.assertEqual(set(trimmed), {"greeting_templates", "errors", "reports"})
+        self.assertEqual(trimmed["reports"], {"total": "Total: {amount:number}"})
+        self.assertNotIn("reports", trim_catalog(TEST_LOCALES["es"], usage,
+                                                 include_literals=False))
+
+    def test_report(self):
+        """Test the CLI warns about dynamic keys and writes trimmed catalogs."""
+        output = self.locale_dir / "trimmed"
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            status = key_usage_main([str(self.source), "-l", str(self.locale_dir),
+                                     "-o", str(output)])
+        self.assertEqual(status, 0)
+        self.assertEqual(stderr.getvalue().splitlines(), [
+            f"WARNING: {self.source}:8: dynamic key key or self._get_time_key()"
+        ])
+        self.assertEqual([line.split()[0] for line in stdout.getvalue().splitlines()],
+                         ["ar", "en", "es"])
+        self.assertTrue((output / "metadata.json").is_file())
+        with open(output / "ar.json", encoding='utf-8') as f:
+            self.assertEqual(json.load(f), {"greeting_templates": {"default": "مرحبا {name}"}})
+
+    def test_strict_writes_nothing(self):
+        """Test --strict fails on dynamic keys before writing any catalog."""
+        output = self.locale_dir / "trimmed"
+        stderr = io.StringIO()
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(stderr):
+            status = key_usage_main([str(self.source), "-l", str(self.locale_dir),
+                                     "-o", str(output), "--strict"])
+        self.assertEqual(status, 1)
+        self.assertIn("no catalogs written", stderr.getvalue())
+        self.assertFalse(output.exists())
+
+    def test_unparsable_source(self):
+        """Test a source with a syntax error is reported instead of raising."""
+        self.source.write_text("def broken(:\n", encoding='utf-8')
+        stderr = io.StringIO()
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(stderr):
+            status = key_usage_main([str(self.source), "-l", str(self.locale_dir),
+                                     "-o", str(self.locale_dir / "trimmed")])
+        self.assertEqual(status, 1)
+        self.assertTrue(stderr.getvalue().startswith(f"Error: Failed to parse {self.source}"))
+
+if __name__ == "__main__":
+    unittest.main()
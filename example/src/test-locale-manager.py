@@ -0,0 +1,626 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Enhanced LocaleManager
+Version 1.5
+Test coverage for locale negotiation and metadata-driven features
+"""
+
+import unittest
+import json
+import shutil
+import tempfile
+import threading
+import tracemalloc
+from datetime import date
+from pathlib import Path
+from locale_manager_v1_5 import LocaleManager, get_translator, use_translator
+from display_width_v1_0 import display_width, format_columns, pad, truncate
+from lookup_trace_v1_0 import TraceRecorder, read_trace, replay
+from locale_shards_v1_0 import ShardRouter
+from catalog_stream_v1_0 import FlatCatalog, load_flat_catalog
+from catalog_store_v1_0 import CatalogStore, MemoryStore
+from catalog_sync_v1_0 import (
+    CatalogPublisher, CatalogSubscriber, FileTransport, HttpTransport, serve_store
+)
+
+TEST_METADATA = {
+    "en": {
+        "name": "English",
+        "native_name": "English",
+        "direction": "ltr",
+        "fallback_chain": ["en"],
+        "number_format": {"decimal_sep": ".", "thousand_sep": ",", "decimal_places": 2},
+        "date_format": {"default": "%Y-%m-%d", "long": "%B %d, %Y"},
+        "plural_rules": {"one": "n = 1", "other": "true"}
+    },
+    "es": {
+        "name": "Spanish",
+        "native_name": "Español",
+        "direction": "ltr",
+        "fallback_chain": ["en"],
+        "number_format": {"decimal_sep": ",", "thousand_sep": ".", "decimal_places": 2},
+        "date_format": {"default": "%d/%m/%Y"},
+        "plural_rules": {"one": "n = 1", "other": "true"}
+    },
+    "ar": {
+        "name": "Arabic",
+        "native_name": "العربية",
+        "direction": "rtl",
+        "fallback_chain": ["en"],
+        "number_format": {"decimal_sep": "٫", "thousand_sep": "٬", "decimal_places": 2},
+        "date_format": {"default": "%Y-%m-%d"},
+        "plural_rules": {"zero": "n = 0", "one": "n = 1", "two": "n = 2", "other": "true"}
+    }
+}
+
+TEST_LOCALES = {
+    "en": {
+        "greeting_templates": {"default": "Hello {name}", "time": "{time_greeting} {name}"},
+        "errors": {"name_too_long": "Name cannot exceed {max_length:number:integer} characters"}
+    },
+    "es": {
+        "greeting_templates": {"default": "Hola {name}"},
+        "errors": {"name_too_long": "El nombre no puede exceder los {max_length:number:integer} caracteres"},
+        "reports": {
+            "total": "Total: {amount:number}",
+            "count": "{count:number:integer} nombres",
+            "since": "Desde {when:date}",
+            "names": "{count, plural, =0 {Sin nombres} one {# nombre} other {# nombres}}",
+            "greeting": "{gender, select, female {Estimada} male {Estimado} other {Estimado/a}} {name}"
+        }
+    },
+    "ar": {
+        "greeting_templates": {"default": "مرحبا {name}"},
+        "reports": {"greeting": "{gender, select, female {عزيزتي} other {عزيزي}} {name}"}
+    }
+}
+
+class LocaleDirTestCase(unittest.TestCase):
+    """Base test case providing a temporary locale directory."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.locale_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.locale_dir)
+        self.write_json("metadata.json", TEST_METADATA)
+        for locale, translations in TEST_LOCALES.items():
+            self.write_json(f"{locale}.json", translations)
+        self.config = {"default_locale": "en", "fallback_locale": "en"}
+        self.manager = LocaleManager(str(self.locale_dir), self.config)
+
+    def write_json(self, filename, data):
+        """Write a JSON file into the locale directory."""
+        with open(self.locale_dir / filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+
+class TestLocaleNegotiation(LocaleDirTestCase):
+    """Test cases for Accept-Language negotiation."""
+
+    def test_parse_accept_language(self):
+        """Test quality ordering and dropped entries."""
+        tags = LocaleManager.parse_accept_language("fr;q=0.5, es-MX, en;q=0, *;q=0.1")
+        self.assertEqual(tags, ["es-MX", "fr"])
+
+    def test_subtag_truncation(self):
+        """Test regional tags resolve to their base language."""
+        self.assertEqual(self.manager.negotiate_locale("es-MX"), "es")
+        self.assertEqual(self.manager.negotiate_locale(["AR_eg"]), "ar")
+        self.assertEqual(self.manager.negotiate("es-MX,ar;q=0.5"), ("es", "ar", "en"))
+
+    def test_no_match_uses_default(self):
+        """Test unmatched preferences fall back to the default locale."""
+        self.assertEqual(self.manager.negotiate("de-DE"), ("en",))
+
+    def test_negotiation_is_memoized(self):
+        """Test repeated headers reuse the cached result."""
+        first = self.manager.negotiate("es-MX,en;q=0.5")
+        self.assertIs(self.manager.negotiate("es-MX,en;q=0.5"), first)
+
+    def test_get_text_keeps_base_language(self):
+        """Test get_text resolves unknown regional locales by truncation."""
+        text = self.manager.get_text("greeting_templates.default", locale="es-MX", name="Ana")
+        self.assertEqual(text, "Hola Ana")
+
+class TestTranslator(LocaleDirTestCase):
+    """Test cases for locale-bound translators."""
+
+    def test_for_locale_is_cached_and_immutable(self):
+        """Test negotiated codes share one immutable translator."""
+        translator = self.manager.for_locale("es-MX")
+        self.assertIs(translator, self.manager.for_locale("es"))
+        self.assertEqual(translator.locale, "es")
+        self.assertEqual(translator.get_text("greeting_templates.default", name="Ana"),
+                         self.manager.get_text("greeting_templates.default", locale="es",
+                                               name="Ana"))
+        self.assertEqual(translator.get_text("no.such.key"), "Missing translation: no.such.key")
+        with self.assertRaises(AttributeError):
+            translator.locale = "en"
+
+    def test_rebound_after_catalog_replacement(self):
+        """Test catalog replacement hands out a new translator."""
+        translator = self.manager.for_locale("es")
+        self.manager.replace_catalog("es", {"greeting_templates": {"default": "Buenas {name}"}})
+        self.assertIsNot(self.manager.for_locale("es"), translator)
+        self.assertEqual(self.manager.for_locale("es").get_text(
+            "greeting_templates.default", name="Ana"), "Buenas Ana")
+
+    def test_templates_read_only_and_traced(self):
+        """Test the template cache is read-only and lookups are sampled."""
+        translator = self.manager.for_locale("es")
+        with self.assertRaises(TypeError):
+            translator._templates["greeting_templates.default"] = ("x", None)
+        trace_path = self.locale_dir / "translator.trace"
+        self.manager.trace_recorder = TraceRecorder(str(trace_path), sample_rate=1)
+        self.assertEqual(translator.get_text("greeting_templates.default", name="Ana"),
+                         "Hola Ana")
+        self.manager.trace_recorder.close()
+        self.manager.trace_recorder = None
+        self.assertIn("greeting_templates.default", translator._templates)
+        records = list(read_trace(str(trace_path)))
+        self.assertEqual([(r.key, r.locale) for r in records],
+                         [("greeting_templates.default", "es")])
+
+    def test_current_translator(self):
+        """Test the context-local current translator."""
+        with self.assertRaises(LookupError):
+            get_translator()
+        with use_translator(self.manager.for_locale("es")):
+            self.assertEqual(get_translator().locale, "es")
+        with self.assertRaises(LookupError):
+            get_translator()
+
+class TestBidiParameters(LocaleDirTestCase):
+    """Test cases for isolating user-supplied parameters."""
+
+    def test_ascii_name_in_ltr_template_unchanged(self):
+        """Test the ASCII fast path leaves LTR output untouched."""
+        text = self.manager.get_text("greeting_templates.default", locale="en", name="John")
+        self.assertEqual(text, "Hello John")
+
+    def test_accented_name_in_ltr_template_unchanged(self):
+        """Test non-ASCII LTR names in LTR templates get no isolates."""
+        text = self.manager.get_text("greeting_templates.default", locale="es", name="José")
+        self.assertEqual(text, "Hola José")
+        text = self.manager.get_text("greeting_templates.default", locale="en", name="山田")
+        self.assertEqual(text, "Hello 山田")
+
+    def test_rtl_name_in_ltr_template_isolated(self):
+        """Test RTL names are wrapped in right-to-left isolates."""
+        text = self.manager.get_text("greeting_templates.default", locale="en", name="محمد")
+        self.assertEqual(text, "Hello \u2067محمد\u2069")
+
+    def test_ltr_name_in_rtl_template_isolated(self):
+        """Test LTR names are wrapped in left-to-right isolates in RTL text."""
+        text = self.manager.get_text("greeting_templates.default", locale="ar", name="John")
+        self.assertIn("\u2066John\u2069", text)
+
+    def test_neutral_value_uses_first_strong_isolate(self):
+        """Test values without strong characters get FSI/PDI."""
+        text = self.manager.get_text("greeting_templates.default", locale="ar", name="123")
+        self.assertIn("\u2068123\u2069", text)
+
+class TestTypedPlaceholders(LocaleDirTestCase):
+    """Test cases for locale-bound typed placeholders."""
+
+    def test_number_placeholder(self):
+        """Test {x:number} uses the locale's separators."""
+        text = self.manager.get_text("reports.total", locale="es", amount=1234.5)
+        self.assertEqual(text, "Total: 1.234,50")
+
+    def test_integer_style(self):
+        """Test {x:number:integer} drops decimal places."""
+        text = self.manager.get_text("reports.count", locale="es", count=12000)
+        self.assertEqual(text, "12.000 nombres")
+
+    def test_date_placeholder(self):
+        """Test {x:date} uses the locale's default date format."""
+        text = self.manager.get_text("reports.since", locale="es", when=date(2025, 1, 10))
+        self.assertEqual(text, "Desde 10/01/2025")
+
+    def test_format_number_separators(self):
+        """Test "." thousands with "," decimals are not swapped twice."""
+        self.assertEqual(self.manager.format_number(1234.5, "es"), "1.234,50")
+        self.assertEqual(self.manager.format_number(1234.5, "en"), "1,234.50")
+
+    def test_length_limits_use_locale_separators(self):
+        """Test validation limits render with each locale's grouping."""
+        self.assertEqual(self.manager.get_text("errors.name_too_long", locale="en", max_length=1000),
+                         "Name cannot exceed 1,000 characters")
+        self.assertEqual(self.manager.get_text("errors.name_too_long", locale="es", max_length=1000),
+                         "El nombre no puede exceder los 1.000 caracteres")
+
+    def test_reload_metadata_rebinds_formatters(self):
+        """Test changed number conventions apply after reload_metadata."""
+        self.manager.format_number(1000, "es")
+        metadata = json.loads(json.dumps(TEST_METADATA))
+        metadata["es"]["number_format"]["thousand_sep"] = " "
+        self.write_json("metadata.json", metadata)
+        self.manager.reload_metadata()
+        self.assertEqual(self.manager.get_text("errors.name_too_long", locale="es", max_length=1000),
+                         "El nombre no puede exceder los 1 000 caracteres")
+
+    def test_template_compiled_once(self):
+        """Test templates are compiled once per locale."""
+        self.manager.get_text("reports.count", locale="es", count=1)
+        compiled = self.manager._template_cache[("es", "{count:number:integer} nombres")]
+        self.manager.get_text("reports.count", locale="es", count=2)
+        self.assertIs(
+            self.manager._template_cache[("es", "{count:number:integer} nombres")], compiled
+        )
+
+class TestMessageFormat(LocaleDirTestCase):
+    """Test cases for plural and select messages."""
+
+    def test_plural_branches(self):
+        """Test plural selection through the locale's plural_rules."""
+        render = lambda n: self.manager.get_text("reports.names", locale="es", count=n)
+        self.assertEqual(render(0), "Sin nombres")
+        self.assertEqual(render(1), "1 nombre")
+        self.assertEqual(render(1500), "1.500 nombres")
+
+    def test_non_numeric_arguments_logged(self):
+        """Test wrongly typed arguments return the unformatted text, not a missing key."""
+        names = TEST_LOCALES["es"]["reports"]["names"]
+        translator = self.manager.for_locale("es")
+        with self.assertLogs(self.manager.logger, level="WARNING") as logs:
+            self.assertEqual(self.manager.get_text("reports.names", locale="es", count="3"), names)
+            self.assertEqual(self.manager.get_text("reports.names", locale="es", count=None), names)
+            self.assertEqual(self.manager.get_text("reports.total", locale="es", amount=None),
+                             "Total: {amount:number}")
+            self.assertEqual(translator.get_text("reports.names", count="3"), names)
+        self.assertTrue(all("Invalid format parameter" in line for line in logs.output))
+
+    def test_select_branches(self):
+        """Test select messages with nested placeholders."""
+        text = self.manager.get_text("reports.greeting", locale="es", gender="female", name="Ana")
+        self.assertEqual(text, "Estimada Ana")
+        text = self.manager.get_text("reports.greeting", locale="es", gender="x", name="Sam")
+        self.assertEqual(text, "Estimado/a Sam")
+
+    def test_select_in_rtl_locale(self):
+        """Test select keys are matched unisolated while names are isolated."""
+        text = self.manager.get_text("reports.greeting", locale="ar", gender="female", name="Ann")
+        self.assertEqual(text, "\u200Fعزيزتي \u2066Ann\u2069\u200F")
+
+    def test_messages_parsed_at_load(self):
+        """Test plural/select messages are parsed when the catalog loads."""
+        self.manager._load_locale_translations("es")
+        self.assertIn(TEST_LOCALES["es"]["reports"]["names"], self.manager._message_asts["es"])
+
+    def test_message_asts_dropped_with_catalog(self):
+        """Test unloading a locale releases its parsed messages."""
+        self.manager._load_locale_translations("es")
+        self.manager.unload_locale("es")
+        self.assertNotIn("es", self.manager._message_asts)
+        self.assertEqual(self.manager.get_text("reports.names", locale="es", count=1), "1 nombre")
+
+    def test_unload_clears_locale_caches(self):
+        """Test unloading a locale drops every cache derived from it."""
+        self.manager.get_text("greeting_templates.default", locale="es", name="Ana")
+        self.manager.get_plural_category(2, "es")
+        self.manager.get_collator("es")
+        self.assertTrue(any(key[0] == "es" for key in self.manager._template_cache))
+        self.manager.unload_locale("es")
+        self.assertNotIn("es", self.manager._plural_selectors)
+        self.assertNotIn("es", self.manager._collators)
+        self.assertFalse(any(key[0] == "es" for key in self.manager._template_cache))
+        self.assertFalse(any(key[1] == "es" for key in self.manager._bound_formatters))
+
+    def test_plural_categories(self):
+        """Test plural rule evaluation for multi-category locales."""
+        categories = [self.manager.get_plural_category(n, "ar") for n in (0, 1, 2, 5)]
+        self.assertEqual(categories, ["zero", "one", "two", "other"])
+
+class TestCollation(LocaleDirTestCase):
+    """Test cases for locale-aware name sorting."""
+
+    def test_accents_sort_with_base_letter(self):
+        """Test accented names sort next to their base letters."""
+        names = ["Zoé", "Émile", "eva", "Ana", "Ángel"]
+        self.assertEqual(
+            self.manager.sorted_names(names, "en"),
+            ["Ana", "Ángel", "Émile", "eva", "Zoé"]
+        )
+
+    def test_spanish_n_tilde_tailoring(self):
+        """Test ñ sorts as a separate letter after n in Spanish."""
+        names = ["Ñandú", "Nube", "Oscar", "Nzeta"]
+        self.assertEqual(
+            self.manager.sorted_names(names, "es"),
+            ["Nube", "Nzeta", "Ñandú", "Oscar"]
+        )
+        self.assertEqual(
+            self.manager.sorted_names(names, "en"),
+            ["Ñandú", "Nube", "Nzeta", "Oscar"]
+        )
+
+    def test_kana_folding(self):
+        """Test katakana and hiragana share primary weights."""
+        self.assertEqual(
+            self.manager.sort_key("カ", "en")[0], self.manager.sort_key("か", "en")[0]
+        )
+
+    def test_sort_keys_memoized(self):
+        """Test repeated names reuse the same key object."""
+        key = self.manager.sort_key("O'Brien", "es")
+        self.assertIs(self.manager.sort_key("O'Brien", "es"), key)
+        self.assertEqual(key[0], self.manager.sort_key("OBrien", "es")[0])
+
+    def test_letters_without_decomposition(self):
+        """Test Æ, Ø and Œ sort with their base letters, not after Z."""
+        names = ["Zed", "Øyvind", "Æsir", "Aesir", "Oyvind", "Œuvre", "Oeuvre", "Ola"]
+        self.assertEqual(
+            self.manager.sorted_names(names, "en"),
+            ["Aesir", "Æsir", "Oeuvre", "Œuvre", "Ola", "Oyvind", "Øyvind", "Zed"]
+        )
+
+    def test_weights_not_clamped(self):
+        """Test high code points keep distinct weights and keys have no surrogates."""
+        names = ["\U00030001", "\U00030000", "\U00020000", "山"]
+        self.assertEqual(
+            self.manager.sorted_names(names, "en"),
+            ["山", "\U00020000", "\U00030000", "\U00030001"]
+        )
+        for name in names + ["Émile"]:
+            for level in self.manager.sort_key(name, "en")[:3]:
+                self.assertFalse(any(0xD800 <= ord(c) <= 0xDFFF for c in level))
+                level.encode('utf-8')
+
+    def test_collators_keyed_by_resolved_locale(self):
+        """Test unknown locale codes share the negotiated locale's collator."""
+        collator = self.manager.get_collator("en")
+        for code in ("xx-1", "xx-2", "zz"):
+            self.assertIs(self.manager.get_collator(code), collator)
+        self.assertEqual(list(self.manager._collators), ["en"])
+
+class TestDisplayWidth(LocaleDirTestCase):
+    """Test cases for terminal display width handling."""
+
+    def test_wide_and_combining_characters(self):
+        """Test CJK counts two cells and combining marks none."""
+        self.assertEqual(display_width("山田太郎"), 8)
+        self.assertEqual(display_width("Jose\u0301"), 4)
+        self.assertEqual(display_width("John"), 4)
+
+    def test_pad_and_truncate(self):
+        """Test padding and truncation by cells, never splitting wide characters."""
+        self.assertEqual(pad("山田", 6), "山田  ")
+        self.assertEqual(pad("山田", 6, align="right"), "  山田")
+        self.assertEqual(truncate("山田太郎", 6), "山田…")
+        self.assertEqual(truncate("Johnathan", 5), "John…")
+        self.assertEqual(truncate("Johnathan", 5, ellipsis="..."), "Jo...")
+        self.assertEqual(truncate("Johnathan", 0), "")
+
+    def test_control_characters_zero_width(self):
+        """Test ASCII control characters measure the same on both paths."""
+        self.assertEqual(display_width("Ann\t"), 3)
+        self.assertEqual(display_width("Ann\t\u00e9"), 4)
+        self.assertEqual(truncate("Ann\tMarie", 5), "Ann\tM…")
+
+    def test_empty_rows(self):
+        """Test rows without cells format as empty lines."""
+        self.assertEqual(format_columns([[]]), "")
+        self.assertEqual(format_columns([[], []]), "\n")
+
+    def test_last_column_not_padded(self):
+        """Test only the last column's padding is omitted, not its own spaces."""
+        table = format_columns([["Ann", "Hi  "], ["山田", "Hello"]])
+        self.assertEqual(table.splitlines(), ["Ann   Hi  ", "山田  Hello"])
+
+    def test_rtl_columns_right_aligned(self):
+        """Test columns with an RTL LocaleMetadata direction are right-aligned."""
+        directions = [
+            self.manager.get_locale_info("en").direction,
+            self.manager.get_locale_info("ar").direction
+        ]
+        table = format_columns(
+            [["山田", "مرحبا"], ["Ann", "سلام"]], headers=["Name", "Greeting"],
+            directions=directions
+        )
+        self.assertEqual(table.splitlines(), [
+            "Name  Greeting",
+            "山田     مرحبا",
+            "Ann       سلام"
+        ])
+
+class TestLookupTrace(LocaleDirTestCase):
+    """Test cases for lookup trace recording and replay."""
+
+    def test_record_and_replay(self):
+        """Test sampled calls are recorded by shape and replayed."""
+        trace_path = self.locale_dir / "lookups.trace"
+        recorder = TraceRecorder(str(trace_path), sample_rate=0.5)
+        self.manager.trace_recorder = recorder
+        for _ in range(4):
+            self.manager.get_text("greeting_templates.default", locale="es", name="Ana")
+        recorder.close()
+        self.manager.trace_recorder = None
+
+        records = list(read_trace(str(trace_path)))
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records[0].key, "greeting_templates.default")
+        self.assertEqual(records[0].locale, "es")
+        self.assertEqual(records[0].shape, "name:str:3")
+
+        report = replay(records * 10, self.manager)
+        self.assertEqual(report.calls, 20)
+        self.assertLessEqual(report.p50_us, report.p99_us)
+
+    def test_long_strings_cut_on_character_boundary(self):
+        """Test interned strings over 64 KiB are cut without splitting a character."""
+        trace_path = self.locale_dir / "long.trace"
+        with TraceRecorder(str(trace_path), sample_rate=1) as recorder:
+            recorder.record("get_text", "k" * 0xFFFE + "é", "es", {}, 1000)
+        records = list(read_trace(str(trace_path)))
+        self.assertEqual(records[0].key, "k" * 0xFFFE)
+
+    def test_read_in_small_chunks(self):
+        """Test entries split across chunk boundaries are reassembled."""
+        trace_path = self.locale_dir / "chunks.trace"
+        with TraceRecorder(str(trace_path), sample_rate=1) as recorder:
+            for index in range(5):
+                recorder.record("get_text", f"reports.key_{index}", "es",
+                                {"count": index}, 1000 + index)
+        expected = list(read_trace(str(trace_path)))
+        self.assertEqual(len(expected), 5)
+        for chunk_size in (1, 3, 7, 26):
+            self.assertEqual(list(read_trace(str(trace_path), chunk_size)), expected)
+
+        with open(trace_path, 'ab') as f:
+            f.write(b"\x00" * 10)
+        with self.assertRaises(ValueError):
+            list(read_trace(str(trace_path)))
+
+    def test_sampling_is_thread_safe(self):
+        """Test concurrent callers sample exactly every Nth call."""
+        recorder = TraceRecorder(str(self.locale_dir / "threads.trace"), sample_rate=0.25)
+        self.addCleanup(recorder.close)
+        sampled = []
+
+        def call():
+            sampled.append(sum(recorder.should_sample() for _ in range(10_000)))
+
+        threads = [threading.Thread(target=call) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sum(sampled), 10_000)
+
+class TestLocaleShards(LocaleDirTestCase):
+    """Test cases for locale-sharded rendering."""
+
+    def test_render_batch_and_rebalance(self):
+        """Test batches are split by owning shard and locales can move."""
+        router = ShardRouter(str(self.locale_dir), self.config, shard_count=2,
+                             assignment={"en": 0, "es": 1, "ar": 1})
+        self.addCleanup(router.close)
+        requests = [("greeting_templates.default", locale, {"name": "Ana"})
+                    for locale in ("es", "en", "es-MX")]
+        self.assertEqual(router.render_batch(requests), ["Hola Ana", "Hello Ana", "Hola Ana"])
+        self.assertEqual(router.shard_for("es-MX"), 1)
+
+        moved = router.rebalance({"en": 1.0, "es": 1.0, "ar": 5.0})
+        self.assertEqual(router.assignment["ar"], 0)
+        self.assertIn("ar", moved)
+        loads = router.load()
+        self.assertEqual(loads[0].locales, ["ar"])
+        self.assertNotIn("en", loads[0].loaded_locales)
+        self.assertEqual(sum(load.items for load in loads), 3)
+
+    def test_sizes_from_store(self):
+        """Test catalogs are sized through the store, not the filesystem."""
+        store = MemoryStore(dict(TEST_LOCALES, metadata=TEST_METADATA))
+        router = ShardRouter(store, self.config, shard_count=2)
+        self.addCleanup(router.close)
+        self.assertEqual(sorted(router._catalog_sizes()), sorted(TEST_LOCALES))
+        self.assertEqual(router._catalog_sizes()["es"], float(len(store.read("es.json"))))
+        self.assertEqual(router.render_batch([("greeting_templates.default", "es",
+                                               {"name": "Ana"})]), ["Hola Ana"])
+
+    def test_store_base_is_abstract(self):
+        """Test backends must implement read and names."""
+        with self.assertRaises(TypeError):
+            CatalogStore()
+
+class TestCatalogSync(LocaleDirTestCase):
+    """Test cases for versioned catalog distribution."""
+
+    def setUp(self):
+        """Set up a store with version 1 of every catalog."""
+        super().setUp()
+        self.store_dir = self.locale_dir / "store"
+        self.publisher = CatalogPublisher(str(self.store_dir), max_deltas=2)
+        self.publisher.publish_dir(str(self.locale_dir))
+
+    def publish_es(self, greeting):
+        """Publish a Spanish catalog with a new default greeting."""
+        catalog = json.loads(json.dumps(TEST_LOCALES["es"]))
+        catalog["greeting_templates"]["default"] = greeting
+        return self.publisher.publish("es", catalog)
+
+    def test_delta_applied_to_running_manager(self):
+        """Test only changed keys are fetched after the initial snapshot."""
+        subscriber = CatalogSubscriber(self.manager, FileTransport(str(self.store_dir)))
+        self.assertIn("es", subscriber.sync().snapshots)
+        self.assertEqual(self.publish_es("¡Hola {name}!"), 2)
+
+        result = subscriber.sync()
+        self.assertEqual(result.deltas, {"es": [2]})
+        self.assertEqual(result.keys_changed, 1)
+        self.assertEqual(self.manager.get_text("greeting_templates.default", locale="es",
+                                               name="Ana"), "¡Hola Ana!")
+
+    def test_version_gap_falls_back_to_snapshot(self):
+        """Test a subscriber behind the retained deltas loads the snapshot."""
+        subscriber = CatalogSubscriber(self.manager, FileTransport(str(self.store_dir)),
+                                       locales=["es"])
+        subscriber.sync()
+        for greeting in ("Hola {name}.", "Hola {name}!", "Buenas {name}"):
+            self.publish_es(greeting)
+
+        result = subscriber.sync()
+        self.assertEqual(result.snapshots, ["es"])
+        self.assertEqual(subscriber.versions, {"es": 4})
+        self.assertEqual(self.manager.get_text("greeting_templates.default", locale="es",
+                                               name="Ana"), "Buenas Ana")
+
+    def test_http_transport(self):
+        """Test syncing from a local HTTP server."""
+        server = serve_store(str(self.store_dir))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        transport = HttpTransport(f"http://127.0.0.1:{server.server_address[1]}")
+
+        self.assertIsNone(transport.fetch("es/99.json"))
+        result = CatalogSubscriber(self.manager, transport).sync()
+        self.assertEqual(result.updated, ["ar", "en", "es"])
+
+class TestStreamingCatalogs(LocaleDirTestCase):
+    """Test cases for incremental catalog loading."""
+
+    def test_same_lookups_as_nested_catalogs(self):
+        """Test streamed flat catalogs resolve like nested ones."""
+        streaming = LocaleManager(str(self.locale_dir), self.config, stream_catalogs=True)
+        self.assertIsInstance(streaming._load_locale_translations("es"), FlatCatalog)
+        for key, params in (("greeting_templates.default", {"name": "Ana"}),
+                            ("reports.greeting", {"gender": "female", "name": "Ana"}),
+                            ("greeting_templates", {}),
+                            ("no.such.key", {})):
+            self.assertEqual(streaming.get_text(key, locale="es", **params),
+                             self.manager.get_text(key, locale="es", **params))
+
+    def test_small_chunks_and_escapes(self):
+        """Test strings and keys split across chunk boundaries."""
+        catalog = {"a": {"b\"c": "x\u00e9\ud83d\ude00 \"q\"", "n": 1, "l": [1, {"z": "y"}]},
+                   "e": {}, "t": "\n"}
+        flat = load_flat_catalog(json.dumps(catalog, ensure_ascii=True), chunk_size=3)
+        self.assertEqual(flat, {'a.b"c': 'x\u00e9\U0001F600 "q"', "t": "\n"})
+        numbers = '{"n": 1.25, "m": [-2500.0, 3e-7, 0, 1E+2, -0.5e10], "k": "v"}'
+        for chunk_size in (1, 2, 4, 8):
+            self.assertEqual(load_flat_catalog(numbers, chunk_size=chunk_size), {"k": "v"})
+        with self.assertRaises(ValueError):
+            load_flat_catalog('{"a": "b",}')
+
+    def test_peak_memory_proportional_to_index(self):
+        """Test loading never holds much more than the finished index."""
+        catalog = {
+            f"section{i}": {f"key{j}": f"Translated text {i}-{j} for {{name}}" for j in range(100)}
+            for i in range(100)
+        }
+        path = self.locale_dir / "large.json"
+        path.write_text(json.dumps(catalog, indent=2), encoding='utf-8')
+
+        tracemalloc.start()
+        try:
+            with open(path, 'rb') as f:
+                flat = load_flat_catalog(f)
+            index_size, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(len(flat), 10000)
+        self.assertLess(peak, index_size * 1.25)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Session Index
+Version 1.0
+Test coverage for summary parsing, incremental indexing and the CLI
+"""
+
+import unittest
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from session_index_v1_0 import SessionIndex, main as session_index_main, parse_summary
+
+SESSION_SUMMARY = """# Session Summary: Locale Negotiation
+Session ID: SESSION_007
+Previous Session: SESSION_006
+Current Version: v1.5
+Previous Version: v1.4
+Date: 2025-02-01
+
+## Version Control
+### Version Changes
+- Incremented from v1.4 to v1.5
+- Added locale negotiation
+
+### Artifact Relationships
+- locale-manager-v1.5.py (v1.5) - Locale manager
+- simple_io_v1.3.py (unchanged) - Core program
+
+## Interface Changes
+### Current Interface Definition
+```python
+class LocaleManager:
+    def negotiate_locale(self, requested: str) -> str: ...
+
+def get_translator() -> Translator: ...
+```
+
+## Changes from Previous Session
+### Interface Updates
+- Added LocaleManager.negotiate_locale
+
+## Known Issues
+- Collation tailoring is English-only
+
+## Next Steps
+### Immediate
+- Add catalog sync
+### Open Questions
+- Should fr fall back to en?
+"""
+
+class TestSessionIndex(unittest.TestCase):
+    """Test cases for the session summary index."""
+
+    def setUp(self):
+        """Set up a summary directory with two sessions."""
+        self.summary_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.summary_dir)
+        self.write_summary(6, "# Session Summary: Tests\nSession ID: SESSION_006\n")
+        self.write_summary(7, SESSION_SUMMARY)
+
+    def write_summary(self, number, text):
+        """Write Session_summary_NNN.md and return its path."""
+        path = self.summary_dir / f"Session_summary_{number:03d}.md"
+        path.write_text(text, encoding='utf-8')
+        return path
+
+    def test_parse_summary(self):
+        """Test header fields and sections are parsed into their fields."""
+        summary = parse_summary(SESSION_SUMMARY, "Session_summary_007.md", 7)
+        self.assertEqual(summary.title, "Locale Negotiation")
+        self.assertEqual((summary.session_id, summary.previous_session), ("SESSION_007", "SESSION_006"))
+        self.assertEqual((summary.current_version, summary.date), ("v1.5", "2025-02-01"))
+        self.assertEqual(summary.version_changes,
+                         ["Incremented from v1.4 to v1.5", "Added locale negotiation"])
+        self.assertEqual(summary.artifacts, ["locale-manager-v1.5.py", "simple_io_v1.3.py"])
+        self.assertEqual(sorted(summary.interfaces), ["LocaleManager", "get_translator"])
+        self.assertIn("negotiate_locale", summary.interfaces["LocaleManager"])
+        self.assertEqual(summary.interface_changes, ["Added LocaleManager.negotiate_locale"])
+        self.assertEqual(summary.known_issues, ["Collation tailoring is English-only"])
+        self.assertEqual(summary.next_steps, ["Add catalog sync"])
+
+    def test_incremental_update(self):
+        """Test only new, edited and deleted summaries are reported."""
+        index = SessionIndex(str(self.summary_dir))
+        self.assertEqual(index.update(), ["Session_summary_006.md", "Session_summary_007.md"])
+
+        index = SessionIndex(str(self.summary_dir))
+        self.assertEqual(len(index.summaries), 2)
+        self.assertEqual(index.update(), [])
+
+        path = self.summary_dir / "Session_summary_007.md"
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertEqual(index.update(), [])
+        with open(index.index_path, encoding='utf-8') as f:
+            entry = json.load(f)["files"]["Session_summary_007.md"]
+        self.assertEqual(entry["mtime_ns"], path.stat().st_mtime_ns)
+
+        self.write_summary(7, SESSION_SUMMARY.replace("SESSION_007", "SESSION_008"))
+        self.assertEqual(index.update(), ["Session_summary_007.md"])
+        self.assertEqual(index.latest().session_id, "SESSION_008")
+
+        (self.summary_dir / "Session_summary_006.md").unlink()
+        self.assertEqual(index.update(), ["Session_summary_006.md"])
+        self.assertEqual([s.file for s in SessionIndex(str(self.summary_dir)).summaries],
+                         ["Session_summary_007.md"])
+
+    def test_artifact_names_normalized(self):
+        """Test artifact queries ignore the -/_ spelling and match versions exactly."""
+        index = SessionIndex(str(self.summary_dir))
+        index.update()
+        self.assertEqual([s.number for s in index.artifact_sessions("simple-io")], [7])
+        self.assertEqual([s.number for s in index.artifact_sessions("locale_manager_v1.5.py")], [7])
+        self.assertEqual(index.artifact_sessions("locale-manager-v1.4"), [])
+
+    def run_cli(self, *args):
+        """Run the CLI and return its exit status and output."""
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            status = session_index_main(["-d", str(self.summary_dir)] + list(args))
+        return status, stdout.getvalue(), stderr.getvalue()
+
+    def test_cli(self):
+        """Test the interface, issues, artifact and sessions commands."""
+        status, out, _ = self.run_cli("interface", "get_translator")
+        self.assertEqual(status, 0)
+        self.assertEqual(out.splitlines()[0], "# SESSION_007 (v1.5)")
+        self.assertEqual(self.run_cli("interface", "Missing")[:1], (1,))
+        self.assertEqual(self.run_cli("issues")[1], "- Collation tailoring is English-only\n")
+        status, out, _ = self.run_cli("--json", "artifact", "simple-io")
+        self.assertEqual([s["session_id"] for s in json.loads(out)], ["SESSION_007"])
+        self.assertEqual(len(self.run_cli("sessions")[1].splitlines()), 2)
+        self.assertTrue((self.summary_dir / ".session-index.json").is_file())
+
+if __name__ == "__main__":
+    unittest.main()